@@ -0,0 +1,54 @@
+"""
+Benchmark: serial vs process-parallel DataCleaner statistics on a wide synthetic table.
+
+Usage: python benchmarks/bench_cleaning.py [--rows N] [--columns N] [--workers N]
+"""
+
+import argparse
+import contextlib
+import io
+import time
+import numpy as np
+import pandas as pd
+from ds_toolkit.cleaning import DataCleaner
+
+
+def make_frame(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    values = rng.normal(size=(rows, columns))
+    values[rng.random(size=values.shape) < 0.05] = np.nan
+    df = pd.DataFrame(values, columns=[f"num_{i}" for i in range(columns)])
+    for i in range(columns // 10):
+        df[f"cat_{i}"] = rng.choice(['a', 'b', 'c', None], size=rows)
+    return df
+
+
+def best_time(df: pd.DataFrame, executor: str, n_workers, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        cleaner = DataCleaner(executor=executor, n_workers=n_workers)
+        cleaner.df = df.copy()
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cleaner.handle_missing_values().remove_outliers_iqr()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=500_000)
+    parser.add_argument('--columns', type=int, default=120)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.columns)
+    print(f"{len(df):,} rows x {df.shape[1]} columns")
+    serial = best_time(df, 'serial', None)
+    processes = best_time(df, 'processes', args.workers)
+    print(f"serial   : {serial:.3f}s")
+    print(f"processes: {processes:.3f}s  (x{serial / processes:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+"""
+Benchmark: serial vs threaded DataValidator on a wide synthetic table.
+
+Usage: python benchmarks/bench_validation.py [--rows N] [--columns N] [--workers N]
+"""
+
+import argparse
+import time
+import numpy as np
+import pandas as pd
+from ds_toolkit.validation import DataValidator, NoMissingValuesRule, RangeRule, UniqueValuesRule
+
+
+def make_frame(rows: int, columns: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    data = {f"num_{i}": rng.normal(size=rows) for i in range(columns)}
+    data.update({f"id_{i}": rng.permutation(rows) for i in range(columns // 4)})
+    return pd.DataFrame(data)
+
+
+def make_validator(df: pd.DataFrame, executor: str, n_workers) -> DataValidator:
+    validator = DataValidator(executor=executor, n_workers=n_workers)
+    validator.add_rule(NoMissingValuesRule())
+    for col in df.columns:
+        if col.startswith('num_'):
+            validator.add_rule(RangeRule(col, min_value=-10, max_value=10))
+    validator.add_rule(UniqueValuesRule([col for col in df.columns if col.startswith('id_')]))
+    return validator
+
+
+def best_time(validator: DataValidator, df: pd.DataFrame, repeat: int = 3) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        validator.run(df)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--rows', type=int, default=1_000_000)
+    parser.add_argument('--columns', type=int, default=40)
+    parser.add_argument('--workers', type=int, default=None)
+    args = parser.parse_args()
+
+    df = make_frame(args.rows, args.columns)
+    print(f"{len(df):,} rows x {df.shape[1]} columns")
+    serial = best_time(make_validator(df, 'serial', None), df)
+    threads = best_time(make_validator(df, 'threads', args.workers), df)
+    print(f"serial : {serial:.3f}s")
+    print(f"threads: {threads:.3f}s  (x{serial / threads:.2f})")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,43 @@
-from .facade import DataSciencePackage
-from .cleaning import DataCleaner
-from .pipeline import MLPipeline, DataLoader, DataSplitter, Scaler, ModelHandler
-from .validation import DataValidator, NoMissingValuesRule, DataTypeRule
-from .cross_validation import CrossValidationStrategy, KFoldStrategy, StratifiedKFoldStrategy, ModelEvaluator
-from .utils import timing_decorator, logging_decorator
+"""
+ds_toolkit: object-oriented data science toolkit.
+
+Public names are imported lazily on first access (PEP 562), so a job that only
+needs ``DataCleaner`` or ``DataValidator`` does not pay for the modelling
+modules and scikit-learn.
+"""
+
+import importlib
+
+_EXPORTS = {
+    'DataSciencePackage': 'facade',
+    'DataCleaner': 'cleaning',
+    'MLPipeline': 'pipeline',
+    'DataLoader': 'pipeline',
+    'DataSplitter': 'pipeline',
+    'Scaler': 'pipeline',
+    'ModelHandler': 'pipeline',
+    'DataValidator': 'validation',
+    'NoMissingValuesRule': 'validation',
+    'DataTypeRule': 'validation',
+    'CrossValidationStrategy': 'cross_validation',
+    'KFoldStrategy': 'cross_validation',
+    'StratifiedKFoldStrategy': 'cross_validation',
+    'ModelEvaluator': 'cross_validation',
+    'timing_decorator': 'utils',
+    'logging_decorator': 'utils',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    module_name = _EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,65 @@
+"""
+Asyncio Support.
+
+Runs the blocking stages of a workflow on an executor so the event loop stays
+free, and reports a ``StageEvent`` when each stage starts and ends. A
+cancelled task stops between stages: the stage already handed to the executor
+cannot be interrupted and completes in the background, but no later stage
+starts. Stages are closures over the workflow's objects and update them in
+place, so they run on threads: the loop's default pool or a
+``ThreadPoolExecutor``.
+"""
+
+import asyncio
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import AsyncIterator, Awaitable, Callable, List, Optional, Tuple, Union
+
+Stage = Tuple[str, Callable[[], None]]
+
+
+@dataclass
+class StageEvent:
+    """Progress of one stage: ``status`` is 'started', 'finished' or 'failed'."""
+    stage: str
+    status: str
+    seconds: Optional[float] = None
+    error: Optional[str] = None
+
+
+Progress = Callable[[StageEvent], Union[None, Awaitable[None]]]
+
+
+def check_executor(executor: Optional[ThreadPoolExecutor]) -> None:
+    """Rejects executors other than thread pools, on which stages could not run (see module docstring)."""
+    if executor is not None and not isinstance(executor, ThreadPoolExecutor):
+        raise TypeError(f"Stages run on a ThreadPoolExecutor or the loop's default one, got {type(executor).__name__}")
+
+
+async def iter_stages(stages: List[Stage], executor: Optional[ThreadPoolExecutor] = None) -> AsyncIterator[StageEvent]:
+    """Runs ``stages`` one after another on ``executor`` (default: the loop's), yielding their events."""
+    check_executor(executor)
+    loop = asyncio.get_running_loop()
+    for name, stage in stages:
+        # Cancellation points, so a cancelled task never hands the next stage to the executor
+        await asyncio.sleep(0)
+        yield StageEvent(name, 'started')
+        await asyncio.sleep(0)
+        start = time.perf_counter()
+        try:
+            await loop.run_in_executor(executor, stage)
+        except Exception as e:
+            yield StageEvent(name, 'failed', time.perf_counter() - start, f"{type(e).__name__}: {e}")
+            raise
+        yield StageEvent(name, 'finished', time.perf_counter() - start)
+
+
+async def notify(progress: Optional[Progress], event: StageEvent) -> None:
+    """Calls a plain or async ``progress`` callback."""
+    if progress is None:
+        return
+    result = progress(event)
+    if inspect.isawaitable(result):
+        await result
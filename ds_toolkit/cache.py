@@ -0,0 +1,120 @@
+"""
+Content-Addressed Step Cache.
+
+On-disk cache for pipeline stages, keyed on a hash of the input data and of
+the parameters of each component, with LRU eviction by entry count and total
+size.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+import tempfile
+import time
+import pandas as pd
+from typing import Any, Optional, Tuple
+
+
+def hash_frame(data) -> str:
+    """Content hash of a DataFrame, Series or array (values, index, columns and dtypes)."""
+    if not isinstance(data, (pd.DataFrame, pd.Series)):
+        data = pd.DataFrame(data)
+    digest = hashlib.sha256()
+    digest.update(pd.util.hash_pandas_object(data, index=True).to_numpy().tobytes())
+    if isinstance(data, pd.DataFrame):
+        digest.update(repr(list(data.columns)).encode())
+        digest.update(repr([str(dtype) for dtype in data.dtypes]).encode())
+    else:
+        digest.update(repr((data.name, str(data.dtype))).encode())
+    return digest.hexdigest()
+
+
+def hash_params(*parts: Any) -> str:
+    """Stable hash of parameters (anything JSON-serializable, other values by repr)."""
+    payload = json.dumps(parts, sort_keys=True, default=repr)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class StepCache:
+    """
+    Pickle cache stored in ``directory``, one file per key.
+
+    Reading an entry refreshes its modification time; when ``max_entries`` or
+    ``max_bytes`` is exceeded, the least recently used entries are removed.
+    ``hits`` and ``misses`` count lookups.
+    """
+
+    def __init__(self, directory: str = '.ds_toolkit_cache', max_entries: Optional[int] = None,
+                 max_bytes: Optional[int] = None):
+        self.directory = directory
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f'{key}.pkl')
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Returns ``(True, value)`` on a hit and ``(False, None)`` on a miss."""
+        path = self._path(key)
+        try:
+            with open(path, 'rb') as f:
+                value = pickle.load(f)
+        except (OSError, pickle.UnpicklingError, EOFError):
+            self.misses += 1
+            return False, None
+        self._touch(path)
+        self.hits += 1
+        return True, value
+
+    def put(self, key: str, value: Any) -> None:
+        """Stores a value atomically, then evicts old entries if needed."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix='.tmp')
+        with os.fdopen(fd, 'wb') as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, self._path(key))
+        self._touch(self._path(key))
+        self._evict()
+
+    @staticmethod
+    def _touch(path: str) -> None:
+        # Explicit timestamps: implicit ones use the coarse kernel clock
+        now = time.time_ns()
+        os.utime(path, ns=(now, now))
+
+    def _entries(self):
+        entries = []
+        for name in os.listdir(self.directory):
+            if name.endswith('.pkl'):
+                stat = os.stat(os.path.join(self.directory, name))
+                entries.append((stat.st_mtime_ns, stat.st_size, name))
+        return sorted(entries)
+
+    def _evict(self) -> None:
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        while entries and (
+            (self.max_entries is not None and len(entries) > self.max_entries)
+            or (self.max_bytes is not None and total > self.max_bytes)
+        ):
+            _, size, name = entries.pop(0)
+            os.remove(os.path.join(self.directory, name))
+            total -= size
+
+    def clear(self) -> None:
+        """Removes every entry."""
+        for _, _, name in self._entries():
+            os.remove(os.path.join(self.directory, name))
+
+    def stats(self) -> dict:
+        """Hit/miss counters and current footprint."""
+        entries = self._entries()
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'entries': len(entries),
+            'bytes': sum(size for _, size, _ in entries),
+        }
@@ -4,74 +4,143 @@ Data Cleaning Module.
 
 import pandas as pd
 import numpy as np
-from typing import Optional, List
+from typing import Optional, List, Dict, Union
+from .dedup import BloomRowIndex, RowHashIndex
+from .dtypes import MemoryReport, optimize_dtypes
+from .encoding import LabelEncoder, OneHotEncoder
+from .imputation import MissingValueImputer
+from .lazy import LazyCleaner
+from .parallel import EXECUTORS, ProcessBackend, clean_partitioned
+from .profiling import memory_profile
+from .tracing import traced
+from .sketches import QuantileSketch
+from .stats import ValueCounts, is_numeric_column
+from .storage import FrameWriter, iter_frames, read_frame, read_schema, write_frame
 from .utils import logging_decorator, timing_decorator
 
+
+def _frame_rows(cleaner: 'DataCleaner') -> Optional[int]:
+    return len(cleaner.df) if cleaner.df is not None else None
+
+
 class DataCleaner:
     """
     Class to clean and transform data in a reusable way.
     
-    Encapsulates all data cleaning operations.
+    Encapsulates all data cleaning operations. With ``sketch_k`` the medians
+    and IQR quartiles are estimated with ``QuantileSketch`` of that accuracy
+    (rank error about 1.7 / sketch_k) instead of computed exactly. With
+    ``executor='processes'`` the per-column statistics (medians, modes, IQR
+    quartiles, label vocabularies) of wide frames are computed by column
+    groups on ``n_workers`` processes, with the same results; the pool is
+    kept between steps until ``close()``.
     """
     
-    def __init__(self, filepath: Optional[str] = None):
+    def __init__(self, filepath: Optional[str] = None, sketch_k: Optional[int] = None,
+                 executor: str = 'serial', n_workers: Optional[int] = None):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
         self.filepath = filepath
+        self.sketch_k = sketch_k
+        self.executor = executor
+        self.n_workers = n_workers
+        self.backend = ProcessBackend(n_workers) if executor == 'processes' else None
         self.df = None
+        self.memory_report: Optional[MemoryReport] = None
+        self.imputer: Optional[MissingValueImputer] = None
+        self.encoders: Dict[str, Union[LabelEncoder, OneHotEncoder]] = {}
         
     @logging_decorator
-    def load_data(self, filepath: Optional[str] = None) -> pd.DataFrame:
-        """Loads data from a CSV file."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def load_data(self, filepath: Optional[str] = None, format: Optional[str] = None,
+                  columns: Optional[List[str]] = None, optimize_memory: bool = False) -> pd.DataFrame:
+        """
+        Loads data from a CSV, Parquet or Feather file (format inferred from the extension).
+
+        With ``optimize_memory=True`` numeric columns are downcast and
+        low-cardinality text columns converted to ``category``.
+        """
         if filepath:
             self.filepath = filepath
             
         if not self.filepath:
             raise ValueError("No filepath provided")
             
-        self.df = pd.read_csv(self.filepath)
+        self.df = read_frame(self.filepath, format=format, columns=columns)
         print(f"✓ Data loaded: {len(self.df)} rows, {len(self.df.columns)} columns")
+        if optimize_memory:
+            self.df, self.memory_report = optimize_dtypes(self.df)
+            print(f"✓ Memory optimized: {self.memory_report}")
         return self.df
     
     @timing_decorator
-    def remove_duplicates(self) -> 'DataCleaner':
-        """Removes duplicate rows."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def remove_duplicates(self, subset: Optional[List[str]] = None,
+                          index: Optional[Union[RowHashIndex, BloomRowIndex]] = None) -> 'DataCleaner':
+        """
+        Removes duplicate rows (compared on the ``subset`` columns if given).
+
+        With a ``RowHashIndex`` or ``BloomRowIndex``, rows already recorded in
+        the index by previous batches are removed too, and the remaining ones
+        are recorded; the index's own ``subset`` then applies, and a different
+        ``subset`` raises ValueError.
+        """
         if self.df is None:
             raise ValueError("No data loaded. Use load_data() first.")
+        if index is not None and subset is not None and list(subset) != list(index.subset or []):
+            raise ValueError(f"subset {subset!r} differs from the index's subset {index.subset!r}")
         
         initial_rows = len(self.df)
-        self.df = self.df.drop_duplicates()
+        if index is not None:
+            self.df = index.deduplicate(self.df)
+        else:
+            self.df = self.df.drop_duplicates(subset=subset)
         duplicates_removed = initial_rows - len(self.df)
         
         print(f"✓ {duplicates_removed} duplicates removed")
+        if index is not None:
+            print(f"✓ Dedup index: {len(index)} rows recorded, {index.memory_bytes / 2**20:.2f} MB")
         return self
     
-    def handle_missing_values(self, columns: Optional[List[str]] = None) -> 'DataCleaner':
-        """Handles missing values (median for numeric, mode for categorical)."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def handle_missing_values(self, columns: Optional[List[str]] = None,
+                              imputer: Optional[MissingValueImputer] = None) -> 'DataCleaner':
+        """
+        Handles missing values (median for numeric, mode for categorical).
+
+        The fitted imputer is kept in ``self.imputer``; pass a previously fitted
+        ``imputer`` to reuse its fill values instead of computing new ones.
+        """
         if self.df is None:
             raise ValueError("No data loaded. Use load_data() first.")
         
-        cols_to_process = columns or self.df.columns
-        missing_before = self.df.isnull().sum().sum()
-        
-        for col in cols_to_process:
-            if col not in self.df.columns:
-                continue
-                
-            if self.df[col].isnull().sum() == 0:
-                continue
-            
-            if self.df[col].dtype in ['float64', 'int64']:
-                self.df[col] = self.df[col].fillna(self.df[col].median())
-            else:
-                mode_value = self.df[col].mode()
-                if len(mode_value) > 0:
-                    self.df[col] = self.df[col].fillna(mode_value[0])
+        if imputer is None:
+            self.imputer = MissingValueImputer(columns, only_missing=True, sketch_k=self.sketch_k)
+            self.imputer.fit(self.df, backend=self.backend)
+            missing_handled = self.imputer.filled_count
+        else:
+            self.imputer = imputer
+            fill_cols = [col for col in imputer.fill_values if col in self.df.columns]
+            missing_handled = int(self.df[fill_cols].isnull().sum().sum())
         
-        missing_after = self.df.isnull().sum().sum()
-        print(f"✓ {missing_before - missing_after} missing values handled")
+        self.imputer.transform(self.df)
+        print(f"✓ {missing_handled} missing values handled")
         return self
     
-    def remove_outliers_iqr(self, columns: Optional[List[str]] = None) -> 'DataCleaner':
-        """Removes outliers using the IQR method."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def remove_outliers_iqr(self, columns: Optional[List[str]] = None, sequential: bool = False) -> 'DataCleaner':
+        """
+        Removes outliers using the IQR method.
+
+        By default the Q1/Q3 of every column are computed in one vectorized call on
+        the same data and a single combined mask is applied once. With
+        ``sequential=True`` columns are filtered one after another, each column's
+        bounds being computed on the rows left by the previous filters.
+        """
         if self.df is None:
             raise ValueError("No data loaded. Use load_data() first.")
         
@@ -82,44 +151,198 @@ class DataCleaner:
         
         initial_rows = len(self.df)
         
-        for col in numeric_cols:
-            Q1 = self.df[col].quantile(0.25)
-            Q3 = self.df[col].quantile(0.75)
+        if sequential:
+            for col in numeric_cols:
+                Q1, Q3 = self._quartiles(self.df[[col]])
+                Q1, Q3 = Q1[col], Q3[col]
+                IQR = Q3 - Q1
+                
+                lower_bound = Q1 - 1.5 * IQR
+                upper_bound = Q3 + 1.5 * IQR
+                
+                self.df = self.df[
+                    (self.df[col] >= lower_bound) & 
+                    (self.df[col] <= upper_bound)
+                ]
+        elif len(numeric_cols) > 0:
+            Q1, Q3 = self._quartiles(self.df[numeric_cols])
             IQR = Q3 - Q1
+            lower_bounds = Q1 - 1.5 * IQR
+            upper_bounds = Q3 + 1.5 * IQR
             
-            lower_bound = Q1 - 1.5 * IQR
-            upper_bound = Q3 + 1.5 * IQR
-            
-            self.df = self.df[
-                (self.df[col] >= lower_bound) & 
-                (self.df[col] <= upper_bound)
-            ]
+            mask = np.ones(initial_rows, dtype=bool)
+            for col in numeric_cols:
+                values = self.df[col].to_numpy(dtype='float64', na_value=np.nan)
+                mask &= (values >= lower_bounds[col]) & (values <= upper_bounds[col])
+            self.df = self.df[mask]
         
         outliers_removed = initial_rows - len(self.df)
         print(f"✓ {outliers_removed} outliers removed (IQR method)")
         return self
     
+    def _quartiles(self, frame: pd.DataFrame):
+        """Q1 and Q3 of every column, exact or sketched depending on ``sketch_k``."""
+        if self.sketch_k is None:
+            if self.backend is not None:
+                quantiles = self.backend.quantiles(frame, list(frame.columns), [0.25, 0.75])
+            else:
+                quantiles = frame.quantile([0.25, 0.75])
+            return quantiles.loc[0.25], quantiles.loc[0.75]
+        sketches = {col: QuantileSketch(self.sketch_k).update(frame[col]) for col in frame.columns}
+        return (pd.Series({col: sketch.quantile(0.25) for col, sketch in sketches.items()}, dtype='float64'),
+                pd.Series({col: sketch.quantile(0.75) for col, sketch in sketches.items()}, dtype='float64'))
+
     @logging_decorator
     @timing_decorator
-    def clean(self) -> pd.DataFrame:
-        """Executes the full cleaning pipeline."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def clean(self, partitions: Optional[int] = None) -> pd.DataFrame:
+        """
+        Executes the full cleaning pipeline.
+
+        With ``partitions``, rows are split into that many partitions cleaned
+        on a pool of ``n_workers`` processes, whatever the ``executor``:
+        statistics are computed per partition and merged, so the result is
+        the same as the single-process pipeline (up to the sketch accuracy
+        with ``sketch_k``).
+        """
         print("\n=== Starting Data Cleaning ===\n")
         
-        self.remove_duplicates()
-        self.handle_missing_values()
-        self.remove_outliers_iqr()
+        if partitions is not None:
+            self._clean_partitioned(partitions)
+        else:
+            self.remove_duplicates()
+            self.handle_missing_values()
+            self.remove_outliers_iqr()
         
         print("\n=== Cleaning Finished ===")
         print(f"Final rows: {len(self.df)}")
         
         return self.df
     
-    def save_data(self, output_path: str, index: bool = False) -> None:
-        """Saves cleaned data to a CSV file."""
+    def _clean_partitioned(self, partitions: int) -> None:
+        if self.df is None:
+            raise ValueError("No data loaded. Use load_data() first.")
+        result = clean_partitioned(self.df, partitions, n_workers=self.n_workers, sketch_k=self.sketch_k)
+        self.df = result['frame']
+        self.imputer = MissingValueImputer(fill_values=result['fill_values'])
+        print(f"✓ {result['duplicates']} duplicates removed")
+        print(f"✓ {result['missing']} missing values handled")
+        print(f"✓ {result['outliers']} outliers removed (IQR method)")
+
+    @logging_decorator
+    @timing_decorator
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def clean_chunked(self, output_path: str, chunksize: int = 100_000, format: Optional[str] = None,
+                      dedup_index: Optional[Union[RowHashIndex, BloomRowIndex]] = None) -> int:
+        """
+        Executes the full cleaning pipeline out-of-core.
+
+        A first pass over the file computes the global statistics (medians, modes
+        and IQR bounds of the deduplicated, imputed data); a second pass applies
+        deduplication, imputation and outlier filtering chunk by chunk, writing
+        each chunk straight to ``output_path``. Input and output formats are
+        inferred from the file extensions (``format`` overrides the input one).
+        Rows already recorded in ``dedup_index`` (from previous files) count
+        as duplicates, and the index records this file's rows at the end.
+        Column dtypes are those of the whole file (see ``read_schema``), so a
+        chunk where a column is entirely missing reads like the others.
+        Medians and quartiles are exact by default, which keeps a count of
+        every distinct value of each numeric column in memory (up to one per
+        row for continuous floats); with ``sketch_k`` they come from a
+        ``QuantileSketch`` in O(sketch_k) memory per column instead. Text
+        columns always keep exact counts for their mode.
+        Returns the number of rows written.
+        """
+        if not self.filepath:
+            raise ValueError("No filepath provided")
+
+        print("\n=== Starting Chunked Data Cleaning ===\n")
+
+        # Whole-file dtypes, so that every chunk is read alike
+        schema = read_schema(self.filepath, format=format, chunksize=chunksize)
+        numeric_columns = {col: is_numeric_column(schema[col].dtype) for col in schema.columns}
+
+        # Pass 1: global statistics
+        stats: Dict[str, Union[ValueCounts, QuantileSketch]] = {
+            col: QuantileSketch(self.sketch_k) if numeric and self.sketch_k is not None else ValueCounts(numeric)
+            for col, numeric in numeric_columns.items()
+        }
+        subset = dedup_index.subset if dedup_index is not None else None
+
+        def new_rows(seen: RowHashIndex, chunk: pd.DataFrame) -> np.ndarray:
+            mask = seen.first_occurrences(chunk)
+            if dedup_index is not None:
+                mask &= ~dedup_index.contains(chunk)
+            return mask
+
+        seen = RowHashIndex(subset)
+        total_rows = unique_rows = 0
+        for chunk in iter_frames(self.filepath, chunksize, format=format, schema=schema):
+            total_rows += len(chunk)
+            chunk = chunk[new_rows(seen, chunk)]
+            unique_rows += len(chunk)
+            for col in chunk.columns:
+                stats[col].update(chunk[col])
+
+        imputer = MissingValueImputer()
+        for col, counts in stats.items():
+            if counts.missing == 0:
+                continue
+            value = counts.median() if numeric_columns[col] else counts.mode()
+            if value is not None and not pd.isna(value):
+                imputer.fill_values[col] = value
+                counts.add_value(value, counts.missing)
+
+        bounds = {}
+        for col, counts in stats.items():
+            if numeric_columns[col]:
+                q1, q3 = counts.quantile(0.25), counts.quantile(0.75)
+                iqr = q3 - q1
+                bounds[col] = (q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+        print(f"✓ {total_rows - unique_rows} duplicates removed")
+        print(f"✓ {sum(stats[col].missing for col in imputer.fill_values)} missing values handled")
+
+        # Pass 2: apply and write chunk by chunk
+        seen = RowHashIndex(subset)
+        with FrameWriter(output_path) as writer:
+            for chunk in iter_frames(self.filepath, chunksize, format=format, schema=schema):
+                chunk = chunk[new_rows(seen, chunk)]
+                chunk = imputer.transform(chunk)
+                mask = np.ones(len(chunk), dtype=bool)
+                for col, (lower, upper) in bounds.items():
+                    mask &= ((chunk[col] >= lower) & (chunk[col] <= upper)).to_numpy()
+                writer.write(chunk[mask])
+        rows_written = writer.rows_written
+        if dedup_index is not None:
+            dedup_index.merge(seen)
+
+        print(f"✓ {unique_rows - rows_written} outliers removed (IQR method)")
+        print("\n=== Cleaning Finished ===")
+        print(f"Final rows: {rows_written}")
+        print(f"✓ Data saved to: {output_path}")
+        return rows_written
+
+    def close(self) -> None:
+        """Stops the worker processes kept by ``executor='processes'``, if any."""
+        if self.backend is not None:
+            self.backend.close()
+
+    def lazy(self) -> 'LazyCleaner':
+        """
+        Lazy mode: cleaning calls on the returned object only record steps,
+        optimized and run on this cleaner by ``collect()`` (see ``explain()``).
+        """
+        return LazyCleaner(self)
+
+    def save_data(self, output_path: str, index: bool = False, format: Optional[str] = None) -> None:
+        """Saves cleaned data to a CSV, Parquet or Feather file (format inferred from the extension)."""
         if self.df is None:
             raise ValueError("No data to save")
         
-        self.df.to_csv(output_path, index=index)
+        write_frame(self.df, output_path, format=format, index=index)
         print(f"✓ Data saved to: {output_path}")
     
     def get_data(self) -> pd.DataFrame:
@@ -128,25 +351,50 @@ class DataCleaner:
             raise ValueError("No data loaded")
         return self.df
 
-    def encode_categorical(self, column: str, method: str = 'label', prefix: Optional[str] = None) -> 'DataCleaner':
-        """Encodes a categorical variable."""
+    @memory_profile()
+    @traced(rows=_frame_rows)
+    def encode_categorical(self, column: Union[str, List[str]], method: str = 'label',
+                           prefix: Optional[str] = None, sparse: bool = False,
+                           encoder: Optional[Union[LabelEncoder, OneHotEncoder]] = None) -> 'DataCleaner':
+        """
+        Encodes one or several categorical variables.
+
+        The fitted encoder is kept in ``self.encoders`` under each column name;
+        pass a previously fitted ``encoder`` to reapply its vocabulary (e.g. on
+        scoring data). One-hot columns of all variables are added in a single
+        concat, as sparse columns when ``sparse=True``.
+        """
         if self.df is None:
             raise ValueError("Load data first")
         
-        if column not in self.df.columns:
-            print(f"⚠ Column '{column}' not found")
+        columns = [column] if isinstance(column, str) else list(column)
+        for col in columns:
+            if col not in self.df.columns:
+                print(f"⚠ Column '{col}' not found")
+        columns = [col for col in columns if col in self.df.columns]
+        if not columns:
             return self
         
-        if method == 'label':
-            unique_values = self.df[column].dropna().unique()
-            mapping = {val: idx for idx, val in enumerate(unique_values)}
-            self.df[f'{column}_Encoded'] = self.df[column].map(mapping)
-            print(f"✓ Variable '{column}' encoded (label encoding)")
+        if encoder is None:
+            if method == 'label':
+                encoder = LabelEncoder(columns)
+            elif method == 'onehot':
+                prefixes = {columns[0]: prefix} if prefix and len(columns) == 1 else None
+                encoder = OneHotEncoder(columns, prefixes=prefixes, sparse=sparse)
+            else:
+                raise ValueError(f"Unknown encoding method '{method}'")
+            encoder.fit(self.df, backend=self.backend)
         
-        elif method == 'onehot':
-            prefix = prefix or column
-            dummies = pd.get_dummies(self.df[column], prefix=prefix)
-            self.df = pd.concat([self.df, dummies], axis=1)
-            print(f"✓ Variable '{column}' encoded (one-hot encoding)")
+        encoded = encoder.transform(self.df)
+        if isinstance(encoder, LabelEncoder):
+            for name in encoded.columns:
+                self.df[name] = encoded[name]
+            label = 'label encoding'
+        else:
+            self.df = pd.concat([self.df, encoded], axis=1)
+            label = 'one-hot encoding'
         
+        for col in columns:
+            self.encoders[col] = encoder
+            print(f"✓ Variable '{col}' encoded ({label})")
         return self
@@ -1,51 +1,105 @@
 """
 Cross-Validation Strategy Pattern.
+
+scikit-learn is imported when a strategy first validates a model.
 """
 
 from abc import ABC, abstractmethod
-from sklearn.model_selection import KFold, StratifiedKFold, cross_val_score
+from contextvars import ContextVar
+from typing import Optional, Tuple
 import pandas as pd
 import numpy as np
 
+EXECUTORS = ('serial', 'threads', 'processes')
+
+# joblib backend running the folds of each executor
+_BACKENDS = {'threads': 'threading', 'processes': 'loky'}
+
+# Executor settings of the ModelEvaluator currently running a strategy, if any
+_OVERRIDE: ContextVar[Optional[Tuple[str, Optional[int]]]] = ContextVar('cv_executor_override', default=None)
+
+
+def _check_executor(executor: Optional[str]) -> None:
+    if executor is not None and executor not in EXECUTORS:
+        raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+
+
 class CrossValidationStrategy(ABC):
-    """Interface for cross-validation strategies."""
-    
+    """
+    Interface for cross-validation strategies.
+
+    Folds run serially, on threads or on processes depending on ``executor``,
+    through scikit-learn's ``cross_val_score`` and joblib (process workers
+    share large arrays by memory mapping); scores are always returned in fold
+    order.
+    """
+
+    def __init__(self, executor: str = 'serial', n_workers: Optional[int] = None):
+        _check_executor(executor)
+        self.executor = executor
+        self.n_workers = n_workers
+
     @abstractmethod
     def validate(self, model, X, y, n_splits=5):
         pass
 
+    def _score_folds(self, model, X, y, cv) -> np.ndarray:
+        """Scores every fold of ``cv`` with the evaluator's executor settings, else the strategy's."""
+        from sklearn.model_selection import cross_val_score
+        executor, n_workers = _OVERRIDE.get() or (self.executor, self.n_workers)
+        if executor == 'serial':
+            return cross_val_score(model, X, y, cv=cv)
+        from joblib import parallel_backend
+        with parallel_backend(_BACKENDS[executor]):
+            return cross_val_score(model, X, y, cv=cv, n_jobs=n_workers or -1)
+
 
 class KFoldStrategy(CrossValidationStrategy):
     """Standard K-Fold strategy."""
-    
+
     def validate(self, model, X, y, n_splits=5):
+        from sklearn.model_selection import KFold
         kf = KFold(n_splits=n_splits, shuffle=True, random_state=42)
-        scores = cross_val_score(model, X, y, cv=kf)
-        return scores
+        return self._score_folds(model, X, y, kf)
 
 
 class StratifiedKFoldStrategy(CrossValidationStrategy):
     """Stratified K-Fold strategy."""
-    
+
     def validate(self, model, X, y, n_splits=5):
+        from sklearn.model_selection import StratifiedKFold
         skf = StratifiedKFold(n_splits=n_splits, shuffle=True, random_state=42)
-        scores = cross_val_score(model, X, y, cv=skf)
-        return scores
+        return self._score_folds(model, X, y, skf)
 
 
 class ModelEvaluator:
-    """Context using a validation strategy."""
-    
-    def __init__(self, strategy: CrossValidationStrategy):
+    """
+    Context using a validation strategy.
+
+    When ``executor`` is given it is used, with ``n_workers``, for every
+    evaluation instead of the strategy's own settings, which are left as is
+    (strategies that do not score through ``_score_folds`` ignore it).
+    """
+
+    def __init__(self, strategy: CrossValidationStrategy,
+                 executor: Optional[str] = None, n_workers: Optional[int] = None):
+        _check_executor(executor)
         self.strategy = strategy
-        
+        self.executor = executor
+        self.n_workers = n_workers
+
     def set_strategy(self, strategy: CrossValidationStrategy):
         """Allows changing strategy dynamically."""
         self.strategy = strategy
-        
+
     def evaluate(self, model, X, y):
         print(f"Evaluating with {self.strategy.__class__.__name__}...")
-        scores = self.strategy.validate(model, X, y)
+        token = _OVERRIDE.set((self.executor, self.n_workers)) if self.executor is not None else None
+        try:
+            scores = self.strategy.validate(model, X, y)
+        finally:
+            if token is not None:
+                _OVERRIDE.reset(token)
         print(f"Scores: {scores}")
         print(f"Mean Score: {scores.mean():.4f}")
         return scores
@@ -0,0 +1,212 @@
+"""
+Incremental Row Deduplication.
+
+Rows are hashed to 64-bit values in one vectorized call and checked against a
+persistent set of the hashes seen so far, so new batches are deduplicated
+against all previous ones without reloading them. ``RowHashIndex`` is exact
+up to 64-bit hash collisions: among n distinct rows, some pair collides with
+probability about n**2 / 2**65, i.e. ~3% for a billion rows;
+``BloomRowIndex`` uses a fixed amount of memory at the cost of a
+configurable false-positive rate, i.e. of unique rows wrongly dropped.
+"""
+
+import math
+from abc import ABC, abstractmethod
+from typing import List, Optional, Union
+import numpy as np
+import pandas as pd
+from .stats import is_numeric_column
+
+
+def row_hashes(df: pd.DataFrame, subset: Optional[List[str]] = None) -> np.ndarray:
+    """Hashes each row (or its ``subset`` columns) to a uint64, numeric columns normalized to float64 first."""
+    columns = list(df.columns) if subset is None else subset
+    normalized = {
+        col: df[col].astype('float64') if is_numeric_column(df[col].dtype) else df[col]
+        for col in columns
+    }
+    return pd.util.hash_pandas_object(pd.DataFrame(normalized, index=df.index), index=False).to_numpy()
+
+
+def _first_in_batch(hashes: np.ndarray):
+    """Positions of the first occurrence of each distinct hash, and those sorted distinct hashes."""
+    order = np.argsort(hashes, kind='stable')
+    ordered = hashes[order]
+    first = np.ones(len(hashes), dtype=bool)
+    first[1:] = ordered[1:] != ordered[:-1]
+    return order[first], ordered[first]
+
+
+class _RowIndex(ABC):
+    """Shared batch logic; subclasses store and look up hashes."""
+
+    kind = ''
+
+    def __init__(self, subset: Optional[List[str]] = None):
+        self.subset = subset
+
+    @abstractmethod
+    def _contains(self, hashes: np.ndarray) -> np.ndarray:
+        pass
+
+    @abstractmethod
+    def _add(self, hashes: np.ndarray) -> None:
+        pass
+
+    def contains(self, df: pd.DataFrame) -> np.ndarray:
+        """Mask of the rows already recorded, without recording anything."""
+        return self._contains(row_hashes(df, self.subset))
+
+    def first_occurrences(self, df: pd.DataFrame) -> np.ndarray:
+        """Mask of the rows never seen before (first of their batch), and records them."""
+        positions, distinct = _first_in_batch(row_hashes(df, self.subset))
+        new = ~self._contains(distinct)
+        self._add(distinct[new])
+        mask = np.zeros(len(df), dtype=bool)
+        mask[positions[new]] = True
+        return mask
+
+    def deduplicate(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Rows of ``df`` never seen before, recorded for the next batches."""
+        return df[self.first_occurrences(df)]
+
+    @property
+    @abstractmethod
+    def memory_bytes(self) -> int:
+        pass
+
+    def _meta(self) -> dict:
+        return {'kind': np.array(self.kind), 'subset': np.array(self.subset or [], dtype=str),
+                'has_subset': np.array(self.subset is not None)}
+
+
+class RowHashIndex(_RowIndex):
+    """
+    Exact set of row hashes (8 bytes per distinct row).
+
+    Hashes are kept as a few sorted runs, merged as they grow, so recording a
+    batch costs O(batch) plus an amortized O(log n) merges.
+    """
+
+    kind = 'exact'
+
+    def __init__(self, subset: Optional[List[str]] = None):
+        super().__init__(subset)
+        self.runs: List[np.ndarray] = []
+
+    def __len__(self) -> int:
+        return sum(len(run) for run in self.runs)
+
+    def _contains(self, hashes: np.ndarray) -> np.ndarray:
+        found = np.zeros(len(hashes), dtype=bool)
+        for run in self.runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            found |= run[positions] == hashes
+        return found
+
+    def _add(self, hashes: np.ndarray) -> None:
+        # ``hashes`` are sorted, distinct and not recorded yet
+        if len(hashes) == 0:
+            return
+        self.runs.append(hashes)
+        while len(self.runs) > 1 and len(self.runs[-2]) <= 2 * len(self.runs[-1]):
+            last = self.runs.pop()
+            self.runs[-1] = np.sort(np.concatenate([self.runs[-1], last]))
+
+    def merge(self, other: 'RowHashIndex') -> 'RowHashIndex':
+        """Records every hash of ``other``."""
+        for run in other.runs:
+            self._add(run[~self._contains(run)])
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        return sum(run.nbytes for run in self.runs)
+
+    def save(self, path: str) -> None:
+        """Writes the index in ``.npz`` format to ``path`` (kept as given, no suffix added)."""
+        hashes = np.sort(np.concatenate(self.runs)) if self.runs else np.empty(0, dtype='uint64')
+        with open(path, 'wb') as f:
+            np.savez(f, hashes=hashes, **self._meta())
+
+
+class BloomRowIndex(_RowIndex):
+    """
+    Bloom filter of row hashes sized for ``capacity`` rows at ``error_rate``.
+
+    Memory is fixed at about 1.44 * log2(1 / error_rate) bits per row of
+    capacity; a row is wrongly reported as seen with probability up to
+    ``error_rate`` once ``capacity`` rows were recorded.
+    """
+
+    kind = 'bloom'
+
+    def __init__(self, capacity: int, error_rate: float = 0.001, subset: Optional[List[str]] = None):
+        if capacity <= 0 or not 0 < error_rate < 1:
+            raise ValueError("capacity must be positive and error_rate in (0, 1)")
+        super().__init__(subset)
+        self.capacity = capacity
+        self.error_rate = error_rate
+        n_bits = math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        self.n_hashes = max(1, round(n_bits / capacity * math.log(2)))
+        self.bits = np.zeros((n_bits + 7) // 8, dtype=np.uint8)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return self.count
+
+    def _positions(self, hashes: np.ndarray) -> np.ndarray:
+        # Double hashing: the k bit positions are h1 + i * h2 (mod m)
+        n_bits = np.uint64(len(self.bits) * 8)
+        h1 = hashes & np.uint64(0xFFFFFFFF)
+        h2 = (hashes >> np.uint64(32)) | np.uint64(1)
+        steps = np.arange(self.n_hashes, dtype=np.uint64)
+        return (h1[:, None] + steps[None, :] * h2[:, None]) % n_bits
+
+    def _contains(self, hashes: np.ndarray) -> np.ndarray:
+        positions = self._positions(hashes)
+        bits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+
+    def _add(self, hashes: np.ndarray) -> None:
+        positions = self._positions(hashes).ravel()
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3),
+                         (np.uint8(1) << (positions & np.uint64(7)).astype(np.uint8)))
+        self.count += len(hashes)
+
+    def merge(self, other: Union['BloomRowIndex', RowHashIndex]) -> 'BloomRowIndex':
+        """Records every row of ``other``, an exact index or a filter built with the same parameters."""
+        if isinstance(other, RowHashIndex):
+            for run in other.runs:
+                self._add(run[~self._contains(run)])
+            return self
+        if (other.capacity, other.error_rate) != (self.capacity, self.error_rate):
+            raise ValueError("Bloom filters with different parameters cannot be merged")
+        self.bits |= other.bits
+        self.count += other.count
+        return self
+
+    @property
+    def memory_bytes(self) -> int:
+        return self.bits.nbytes
+
+    def save(self, path: str) -> None:
+        """Writes the filter in ``.npz`` format to ``path`` (kept as given, no suffix added)."""
+        with open(path, 'wb') as f:
+            np.savez(f, bits=self.bits, capacity=self.capacity, error_rate=self.error_rate,
+                     count=self.count, **self._meta())
+
+
+def load_index(path: str) -> _RowIndex:
+    """Reads a ``RowHashIndex`` or ``BloomRowIndex`` written by its ``save`` method."""
+    with np.load(path) as data:
+        subset = [str(col) for col in data['subset']] if data['has_subset'] else None
+        if str(data['kind']) == RowHashIndex.kind:
+            index = RowHashIndex(subset)
+            if len(data['hashes']):
+                index.runs = [data['hashes']]
+            return index
+        index = BloomRowIndex(int(data['capacity']), float(data['error_rate']), subset)
+        index.bits = data['bits']
+        index.count = int(data['count'])
+        return index
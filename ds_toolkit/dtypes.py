@@ -0,0 +1,63 @@
+"""
+Memory-Optimizing Dtype Conversion.
+
+Downcasts numeric columns to the smallest width that represents every value
+exactly and turns low-cardinality text columns into ``category``.
+"""
+
+from dataclasses import dataclass
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_float_dtype, is_integer_dtype, is_object_dtype, is_string_dtype
+from typing import Tuple
+
+
+@dataclass
+class MemoryReport:
+    """Memory footprint of a DataFrame before and after optimization, in bytes."""
+    bytes_before: int
+    bytes_after: int
+
+    @property
+    def saved(self) -> int:
+        return self.bytes_before - self.bytes_after
+
+    def __str__(self) -> str:
+        ratio = self.bytes_after / self.bytes_before if self.bytes_before else 1.0
+        return f"{self.bytes_before:,} -> {self.bytes_after:,} bytes ({ratio:.1%})"
+
+
+def frame_memory(df: pd.DataFrame) -> int:
+    """Deep memory usage of a DataFrame in bytes."""
+    return int(df.memory_usage(deep=True).sum())
+
+
+def _downcast(series: pd.Series, max_category_ratio: float) -> pd.Series:
+    dtype = series.dtype
+    if is_integer_dtype(dtype) and isinstance(dtype, np.dtype):
+        return pd.to_numeric(series, downcast='integer')
+    if is_float_dtype(dtype) and dtype == np.float64:
+        candidate = series.astype('float32')
+        if np.array_equal(candidate.to_numpy(dtype='float64'), series.to_numpy(), equal_nan=True):
+            return candidate
+        return series
+    if (is_object_dtype(dtype) or is_string_dtype(dtype)) and len(series) > 0:
+        if series.nunique(dropna=True) / len(series) <= max_category_ratio:
+            return series.astype('category')
+    return series
+
+
+def optimize_dtypes(df: pd.DataFrame, max_category_ratio: float = 0.5) -> Tuple[pd.DataFrame, MemoryReport]:
+    """
+    Returns a memory-optimized copy of ``df`` and the before/after report.
+
+    Integers are downcast to the smallest signed width, float64 columns become
+    float32 only when no value loses precision, and text columns whose share of
+    distinct values is at most ``max_category_ratio`` become ``category``.
+    """
+    bytes_before = frame_memory(df)
+    optimized = pd.DataFrame(
+        {col: _downcast(df[col], max_category_ratio) for col in df.columns},
+        index=df.index
+    )
+    return optimized, MemoryReport(bytes_before, frame_memory(optimized))
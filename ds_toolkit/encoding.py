@@ -0,0 +1,133 @@
+"""
+Categorical Encoders.
+
+Fit/transform encoders that store their vocabulary, so the same codes are
+applied to training and scoring data whatever the row order.
+"""
+
+from abc import ABC, abstractmethod
+import numpy as np
+import pandas as pd
+from typing import Dict, List, Optional
+
+
+def _vocabulary(series: pd.Series) -> pd.Index:
+    """Sorted distinct non-missing values (category order for categorical columns)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        return series.cat.categories
+    values = pd.Index(series.dropna().unique())
+    try:
+        return values.sort_values()
+    except TypeError:
+        return values
+
+
+def _codes(series: pd.Series, vocabulary: pd.Index) -> np.ndarray:
+    """Vectorized vocabulary positions; -1 for missing or unknown values."""
+    if isinstance(series.dtype, pd.CategoricalDtype) and series.cat.categories.equals(vocabulary):
+        return series.cat.codes.to_numpy()
+    return vocabulary.get_indexer(series)
+
+
+class _CategoricalEncoder(ABC):
+    """Base class holding one vocabulary per encoded column."""
+
+    def __init__(self, columns: List[str]):
+        self.columns = list(columns)
+        self.vocabulary: Dict[str, pd.Index] = {}
+
+    def fit(self, df: pd.DataFrame, backend=None) -> '_CategoricalEncoder':
+        """Learns the vocabulary of each column, on ``backend`` (a ``ProcessBackend``) if given."""
+        if backend is not None:
+            self.vocabulary = backend.vocabularies(df, self.columns)
+        else:
+            self.vocabulary = {col: _vocabulary(df[col]) for col in self.columns}
+        return self
+
+    def _check_fitted(self) -> None:
+        if not self.vocabulary:
+            raise ValueError(f"{self.__class__.__name__} is not fitted. Use fit() first.")
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    @abstractmethod
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        pass
+
+
+class LabelEncoder(_CategoricalEncoder):
+    """
+    Encodes each column as the position of its value in the sorted vocabulary.
+
+    Missing and unseen values become NaN. Output columns are named
+    ``<column>_Encoded``.
+    """
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        self._check_fitted()
+        encoded = {}
+        for col in self.columns:
+            codes = _codes(df[col], self.vocabulary[col]).astype('int64')
+            if (codes < 0).any():
+                codes = np.where(codes < 0, np.nan, codes)
+            encoded[f'{col}_Encoded'] = codes
+        return pd.DataFrame(encoded, index=df.index)
+
+
+class OneHotEncoder(_CategoricalEncoder):
+    """
+    Encodes each column as one indicator column per vocabulary value.
+
+    Output columns are named ``<prefix>_<value>`` (the prefix defaults to the
+    column name). Missing and unseen values get no indicator. With
+    ``sparse=True`` the indicators are stored as sparse columns;
+    ``transform_matrix`` returns a scipy CSR matrix directly.
+    """
+
+    def __init__(self, columns: List[str], prefixes: Optional[Dict[str, str]] = None, sparse: bool = False):
+        super().__init__(columns)
+        self.prefixes = prefixes or {}
+        self.sparse = sparse
+
+    def feature_names(self) -> List[str]:
+        """Names of the indicator columns, in output order."""
+        self._check_fitted()
+        return [
+            f'{self.prefixes.get(col, col)}_{value}'
+            for col in self.columns for value in self.vocabulary[col]
+        ]
+
+    def transform_matrix(self, df: pd.DataFrame):
+        """Indicators of all columns as one scipy CSR matrix."""
+        from scipy import sparse
+
+        self._check_fitted()
+        rows, cols = [], []
+        offset = 0
+        for col in self.columns:
+            codes = _codes(df[col], self.vocabulary[col])
+            valid = np.flatnonzero(codes >= 0)
+            rows.append(valid)
+            cols.append(codes[valid].astype('int64') + offset)
+            offset += len(self.vocabulary[col])
+        rows = np.concatenate(rows) if rows else np.array([], dtype='int64')
+        cols = np.concatenate(cols) if cols else np.array([], dtype='int64')
+        data = np.ones(len(rows), dtype=bool)
+        return sparse.csr_matrix((data, (rows, cols)), shape=(len(df), offset))
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        self._check_fitted()
+        if self.sparse:
+            return pd.DataFrame.sparse.from_spmatrix(
+                self.transform_matrix(df), index=df.index, columns=self.feature_names()
+            )
+        blocks = []
+        for col in self.columns:
+            codes = _codes(df[col], self.vocabulary[col])
+            indicators = np.zeros((len(df), len(self.vocabulary[col])), dtype=bool)
+            valid = np.flatnonzero(codes >= 0)
+            indicators[valid, codes[valid]] = True
+            blocks.append(indicators)
+        values = np.hstack(blocks) if blocks else np.zeros((len(df), 0), dtype=bool)
+        return pd.DataFrame(values, index=df.index, columns=self.feature_names())
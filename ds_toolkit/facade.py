@@ -3,10 +3,122 @@ Facade for the Data Science Package.
 Integrates all components into a unified interface (Facade Pattern).
 """
 
+import asyncio
+import contextlib
+import functools
+import logging
+import os
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple
+import pandas as pd
+from .aio import Progress, StageEvent, check_executor, iter_stages, notify
 from .cleaning import DataCleaner
 from .pipeline import MLPipeline, DataLoader, DataSplitter, Scaler, ModelHandler
+from .storage import default_save_format, infer_format
+from .tracing import TRACER, traced
 from .utils import timing_decorator
 
+EXECUTORS = ('serial', 'processes')
+
+SUMMARY_COLUMNS = ['dataset', 'target', 'status', 'error', 'rows_in', 'rows_clean', 'seconds',
+                   'cleaning_seconds', 'pipeline_seconds', 'accuracy', 'f1_macro', 'output_dir']
+
+
+def _failed_row(filepath: str, target_col: str, error: Optional[str] = None) -> Dict[str, Any]:
+    row = dict.fromkeys(SUMMARY_COLUMNS)
+    row.update(dataset=filepath, target=target_col, status='failed', error=error)
+    return row
+
+
+@contextlib.contextmanager
+def _logging_to(stream):
+    """Also sends the root logger's records (e.g. from the decorators) to ``stream``."""
+    handler = logging.StreamHandler(stream)
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+    root = logging.getLogger()
+    root.addHandler(handler)
+    try:
+        yield
+    finally:
+        root.removeHandler(handler)
+
+
+def _run_dataset(index: int, filepath: str, target_col: str, output_dir: Optional[str],
+                 save_format: Optional[str]) -> Dict[str, Any]:
+    """Runs one workflow in its own directory and returns its summary row; never raises."""
+    row = _failed_row(filepath, target_col)
+    start = time.perf_counter()
+    with contextlib.ExitStack() as stack:
+        if output_dir is None:
+            run_dir = stack.enter_context(tempfile.TemporaryDirectory(prefix='ds_toolkit_run_'))
+        else:
+            stem = os.path.splitext(os.path.basename(filepath))[0]
+            run_dir = os.path.join(output_dir, f"{index:04d}_{stem}")
+            os.makedirs(run_dir, exist_ok=True)
+            row['output_dir'] = run_dir
+        log = stack.enter_context(open(os.path.join(run_dir, 'run.log'), 'w'))
+        # Both redirections are process-wide: runs must not share a process concurrently
+        stack.enter_context(contextlib.redirect_stdout(log))
+        stack.enter_context(_logging_to(log))
+        try:
+            saved_clean_path = None
+            if output_dir is not None:
+                fmt = infer_format('', save_format, default=default_save_format())
+                saved_clean_path = os.path.join(run_dir, f'cleaned.{fmt}')
+            pkg = DataSciencePackage(filepath, target_col)
+            pkg.run_full_workflow(saved_clean_path=saved_clean_path, save_format=save_format, raise_errors=True)
+            metrics = pkg.pipeline.model_handler.metrics
+            row.update(status='ok', rows_in=pkg.rows_in, rows_clean=len(pkg.cleaner.df),
+                       cleaning_seconds=pkg.timings.get('cleaning'),
+                       pipeline_seconds=pkg.timings.get('pipeline'),
+                       accuracy=metrics.get('accuracy'),
+                       f1_macro=metrics.get('macro avg', {}).get('f1-score'))
+        except Exception as e:
+            row['error'] = f"{type(e).__name__}: {e}"
+            traceback.print_exc(file=log)
+    row['seconds'] = time.perf_counter() - start
+    return row
+
+
+def _run_on_processes(jobs: List[tuple], n_workers: int) -> List[Dict[str, Any]]:
+    """
+    Runs ``_run_dataset`` jobs on a pool of ``n_workers`` processes.
+
+    A worker that dies (OOM kill, crash in native code) breaks the whole pool
+    and fails every unfinished job with it; those jobs are rerun in one
+    process each, at most ``n_workers`` at a time, so that only the dataset
+    that actually kills its process is reported as failed.
+    """
+    rows: Dict[int, Dict[str, Any]] = {}
+    lost = []
+    with ProcessPoolExecutor(max_workers=n_workers) as pool:
+        futures = [(job, pool.submit(_run_dataset, *job)) for job in jobs]
+        for job, future in futures:
+            try:
+                rows[job[0]] = future.result()
+            except BrokenProcessPool:
+                lost.append(job)
+
+    for start in range(0, len(lost), n_workers):
+        batch = lost[start:start + n_workers]
+        pools = [ProcessPoolExecutor(max_workers=1) for _ in batch]
+        try:
+            futures = [pool.submit(_run_dataset, *job) for pool, job in zip(pools, batch)]
+            for job, future in zip(batch, futures):
+                try:
+                    rows[job[0]] = future.result()
+                except BrokenProcessPool as e:
+                    rows[job[0]] = _failed_row(job[1], job[2], f"{type(e).__name__}: worker process died ({e})")
+        finally:
+            for pool in pools:
+                pool.shutdown()
+    return [rows[job[0]] for job in jobs]
+
+
 class DataSciencePackage:
     """Unified Facade for the Data Science Project."""
     
@@ -15,31 +127,141 @@ class DataSciencePackage:
         self.target_col = target_col
         self.cleaner = DataCleaner(filepath)
         self.pipeline = None
+        self.rows_in: Optional[int] = None
+        self.timings: Dict[str, float] = {}
         
     @timing_decorator
-    def run_full_workflow(self, saved_clean_path: str = "temp_cleaned_data.csv"):
+    @traced('DataSciencePackage.run_full_workflow')
+    def run_full_workflow(self, saved_clean_path: Optional[str] = None, save_format: Optional[str] = None,
+                          raise_errors: bool = False):
+        """
+        Runs cleaning then the ML pipeline.
+
+        The cleaned frame is handed to the pipeline in memory; pass
+        ``saved_clean_path`` to also write it to disk as a side output. Unless
+        ``save_format`` or the extension says otherwise, it is written as Parquet
+        (CSV when pyarrow is not installed).
+        Cleaning errors are printed and end the workflow, or are raised with
+        ``raise_errors=True``. Stage durations are kept in ``timings``; see
+        ``run_full_workflow_async`` for an asyncio version.
+        """
         print("=== Launching Data Science Workflow ===")
+        self.timings = {}
         
         # 1. Cleaning
         print("\n1. Data Cleaning...")
         try:
-            self.cleaner.load_data()
-            self.cleaner.clean()
-            # Save properly to communicate with the next step
-            self.cleaner.save_data(saved_clean_path)
-            print(f"Intermediate data saved to {saved_clean_path}")
+            self._clean(saved_clean_path, save_format)
         except Exception as e:
+            if raise_errors:
+                raise
             print(f"Cleaning error: {e}")
             return
 
         # 2. ML Pipeline
         print("\n2. Executing ML Pipeline...")
-        loader = DataLoader(saved_clean_path, self.target_col)
+        start = time.perf_counter()
+        self.pipeline = self._make_pipeline()
+        with TRACER.span('DataSciencePackage.pipeline'):
+            self.pipeline.run()
+        self.timings['pipeline'] = time.perf_counter() - start
+        
+        print("\n=== Workflow Completed ===")
+
+    def _clean(self, saved_clean_path: Optional[str], save_format: Optional[str]) -> None:
+        start = time.perf_counter()
+        with TRACER.span('DataSciencePackage.cleaning'):
+            self.rows_in = len(self.cleaner.load_data())
+            self.cleaner.clean()
+        if saved_clean_path:
+            self.cleaner.save_data(
+                saved_clean_path,
+                format=infer_format(saved_clean_path, save_format, default=default_save_format())
+            )
+            print(f"Intermediate data saved to {saved_clean_path}")
+        self.timings['cleaning'] = time.perf_counter() - start
+
+    def _make_pipeline(self) -> MLPipeline:
+        loader = DataLoader(self.cleaner, self.target_col)
         splitter = DataSplitter()
         scaler = Scaler()
         model = ModelHandler()
-        
-        self.pipeline = MLPipeline(loader, splitter, scaler, model)
-        self.pipeline.run()
-        
+        return MLPipeline(loader, splitter, scaler, model)
+
+    async def run_full_workflow_async(self, saved_clean_path: Optional[str] = None,
+                                      save_format: Optional[str] = None, raise_errors: bool = False,
+                                      executor: Optional[ThreadPoolExecutor] = None, progress: Optional[Progress] = None):
+        """
+        ``run_full_workflow`` without blocking the event loop.
+
+        Loading, cleaning, saving and each pipeline stage run on ``executor``, a
+        ``ThreadPoolExecutor`` (the loop's default one if None); ``progress``,
+        a plain or async callable, receives a ``StageEvent`` when each stage
+        starts and ends. Cancelling the task stops the workflow before its next stage.
+        """
+        async for event in self.iter_workflow_async(saved_clean_path, save_format, raise_errors, executor):
+            await notify(progress, event)
+
+    async def iter_workflow_async(self, saved_clean_path: Optional[str] = None,
+                                  save_format: Optional[str] = None, raise_errors: bool = False,
+                                  executor: Optional[ThreadPoolExecutor] = None) -> AsyncIterator[StageEvent]:
+        """Runs the workflow like ``run_full_workflow_async``, as an async iterator of its ``StageEvent``."""
+        check_executor(executor)
+        print("=== Launching Data Science Workflow ===")
+        self.timings = {}
+        self.pipeline = None
+        # Building the model handler imports scikit-learn the first time
+        pipeline = await asyncio.get_running_loop().run_in_executor(executor, self._make_pipeline)
+
+        print("\n1. Data Cleaning...")
+        cleaning = functools.partial(self._clean, saved_clean_path, save_format)
+        try:
+            async for event in iter_stages([('DataSciencePackage.cleaning', cleaning)], executor):
+                yield event
+        except Exception as e:
+            if raise_errors:
+                raise
+            print(f"Cleaning error: {e}")
+            return
+
+        print("\n2. Executing ML Pipeline...")
+        start = time.perf_counter()
+        self.pipeline = pipeline
+        async for event in pipeline.iter_async(executor):
+            yield event
+        self.timings['pipeline'] = time.perf_counter() - start
+
         print("\n=== Workflow Completed ===")
+
+    @staticmethod
+    def run_batch(datasets: Iterable[Tuple[str, str]], n_workers: Optional[int] = None,
+                  executor: str = 'processes', output_dir: Optional[str] = None,
+                  save_format: Optional[str] = None) -> pd.DataFrame:
+        """
+        Runs the full workflow on many ``(filepath, target_col)`` pairs.
+
+        Runs are scheduled on a pool of at most ``n_workers`` processes (or
+        one after another with ``executor='serial'``). Each run works in its
+        own directory: a temporary one removed afterwards, or
+        ``output_dir/<nnnn>_<file stem>/`` kept with the run's printed and
+        logged output (``run.log``) and the cleaned data (``cleaned.<format>``,
+        ``save_format`` or Parquet, CSV when pyarrow is not installed); without
+        ``output_dir`` the cleaned data stays in memory. Capturing the output
+        swaps process-wide streams, which is why runs execute in worker
+        processes or serially, never on threads. A failing dataset is reported
+        and does not stop the others, even when it kills its worker process.
+        Returns one row per dataset, in input order, with its status, error,
+        row counts, stage timings, accuracy and macro F1.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+        datasets = list(datasets)
+        if output_dir is not None:
+            os.makedirs(output_dir, exist_ok=True)
+        jobs = [(i, filepath, target, output_dir, save_format) for i, (filepath, target) in enumerate(datasets)]
+
+        if executor == 'serial' or not jobs:
+            rows = [_run_dataset(*job) for job in jobs]
+        else:
+            rows = _run_on_processes(jobs, min(n_workers or os.cpu_count() or 1, len(jobs)))
+        return pd.DataFrame(rows, columns=SUMMARY_COLUMNS)
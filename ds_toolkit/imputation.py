@@ -0,0 +1,105 @@
+"""
+Missing Value Imputation.
+
+Median imputation for numeric columns and mode imputation for the others,
+fitted with a single null-mask scan and reusable on new data.
+"""
+
+import numpy as np
+import pandas as pd
+from typing import Any, Dict, List, Optional
+from .sketches import QuantileSketch
+from .stats import is_numeric_column
+
+
+def column_mode(series: pd.Series) -> Any:
+    """Most frequent non-missing value, smallest one on ties (same result as ``Series.mode()[0]``)."""
+    if isinstance(series.dtype, pd.CategoricalDtype):
+        codes = series.cat.codes.to_numpy()
+        codes = codes[codes >= 0]
+        if len(codes) == 0:
+            return None
+        return series.cat.categories[np.bincount(codes).argmax()]
+    try:
+        codes, uniques = pd.factorize(series, sort=True)
+    except TypeError:
+        modes = series.mode()
+        return modes.iloc[0] if len(modes) > 0 else None
+    codes = codes[codes >= 0]
+    if len(codes) == 0:
+        return None
+    return uniques[np.bincount(codes).argmax()]
+
+
+class MissingValueImputer:
+    """
+    Fills missing values with the median (numeric columns) or the mode (others).
+
+    ``fit`` builds the null mask once, computes all medians in one vectorized
+    reduction and the modes from integer codes; the fill values are kept in
+    ``fill_values`` so ``transform`` can be applied to new data without
+    rescanning. With ``only_missing=True`` only columns that contain missing
+    values at fit time get a fill value. With ``sketch_k`` the medians are
+    estimated with a ``QuantileSketch`` of that accuracy. ``fit`` accepts a
+    ``ProcessBackend`` to compute medians and modes by column groups on a
+    process pool.
+    """
+
+    def __init__(self, columns: Optional[List[str]] = None, only_missing: bool = False,
+                 fill_values: Optional[Dict[str, Any]] = None, sketch_k: Optional[int] = None):
+        self.columns = columns
+        self.only_missing = only_missing
+        self.sketch_k = sketch_k
+        self.fill_values: Dict[str, Any] = dict(fill_values or {})
+        self.null_counts = pd.Series(dtype='int64')
+
+    def fit(self, df: pd.DataFrame, backend=None) -> 'MissingValueImputer':
+        """Computes the fill values of ``df``, on ``backend`` if given."""
+        columns = [col for col in (self.columns or df.columns) if col in df.columns]
+        frame = df if self.columns is None else df[columns]
+        self.null_counts = frame.isnull().sum()
+        if self.only_missing:
+            columns = list(self.null_counts.index[self.null_counts > 0])
+
+        numeric = [col for col in columns if is_numeric_column(df[col].dtype)]
+        others = [col for col in columns if not is_numeric_column(df[col].dtype)]
+
+        self.fill_values = {}
+        if numeric and self.sketch_k is not None:
+            for col in numeric:
+                median = QuantileSketch(self.sketch_k).update(df[col]).median()
+                if not pd.isna(median):
+                    self.fill_values[col] = median
+            numeric = []
+        if backend is not None:
+            stats = backend.summarize(df, medians=numeric, modes=others)
+            medians, modes = stats['median'], stats['mode']
+        else:
+            medians = df[numeric].median() if numeric else pd.Series(dtype='float64')
+            modes = {col: column_mode(df[col]) for col in others}
+        self.fill_values.update({col: value for col, value in medians.items() if not pd.isna(value)})
+        self.fill_values.update({col: mode for col, mode in modes.items() if mode is not None})
+        return self
+
+    def transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Fills the missing values of ``df`` in place and returns it.
+
+        Categorical columns get the fill value added to their categories when
+        the batch does not already have it.
+        """
+        values = {col: value for col, value in self.fill_values.items() if col in df.columns}
+        for col, value in values.items():
+            if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories:
+                df[col] = df[col].cat.add_categories([value])
+        if values:
+            df.fillna(values, inplace=True)
+        return df
+
+    def fit_transform(self, df: pd.DataFrame) -> pd.DataFrame:
+        return self.fit(df).transform(df)
+
+    @property
+    def filled_count(self) -> int:
+        """Number of missing values the fitted columns had at fit time."""
+        return int(sum(self.null_counts.get(col, 0) for col in self.fill_values))
@@ -0,0 +1,103 @@
+"""
+Batch and Streaming Inference.
+
+An ``InferenceBundle`` keeps together everything needed to score new data
+(fitted scaler, trained model and feature column order), can be persisted,
+and scores files or chunk iterators chunk by chunk with bounded memory.
+"""
+
+import os
+import pickle
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import numpy as np
+import pandas as pd
+from typing import Any, Iterable, Iterator, List, Optional, Union
+from .storage import iter_frames
+
+EXECUTORS = ('serial', 'threads', 'processes')
+
+_worker_bundle = None
+
+
+def _init_worker(bundle: 'InferenceBundle') -> None:
+    global _worker_bundle
+    _worker_bundle = bundle
+
+
+def _predict_in_worker(chunk: pd.DataFrame) -> np.ndarray:
+    return _worker_bundle.predict(chunk)
+
+
+class InferenceBundle:
+    """
+    Fitted scaler + trained model + feature column order.
+
+    ``columns`` selects and orders the features of incoming data; ``scaler``
+    (optional) is any object with a ``transform`` method, such as ``Scaler``.
+    """
+
+    def __init__(self, model: Any, scaler: Any = None, columns: Optional[List[str]] = None):
+        self.model = model
+        self.scaler = scaler
+        self.columns = list(columns) if columns is not None else None
+
+    def save(self, path: str) -> None:
+        """Persists the bundle with pickle."""
+        with open(path, 'wb') as f:
+            pickle.dump(self, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path: str) -> 'InferenceBundle':
+        """Loads a bundle written by ``save``."""
+        with open(path, 'rb') as f:
+            bundle = pickle.load(f)
+        if not isinstance(bundle, cls):
+            raise TypeError(f"{path} does not contain an {cls.__name__}")
+        return bundle
+
+    def predict(self, X: Union[pd.DataFrame, np.ndarray]) -> np.ndarray:
+        """Scores one in-memory batch."""
+        if self.columns is not None and isinstance(X, pd.DataFrame):
+            X = X[self.columns]
+        if self.scaler is not None:
+            X = self.scaler.transform(X)
+        return self.model.predict(X)
+
+    def predict_stream(self, source: Union[str, Iterable[pd.DataFrame]], chunksize: int = 100_000,
+                       format: Optional[str] = None, executor: str = 'serial',
+                       n_workers: Optional[int] = None) -> Iterator[np.ndarray]:
+        """
+        Yields the predictions of each chunk of ``source``, in order.
+
+        ``source`` is a file path (read ``chunksize`` rows at a time, only the
+        feature columns) or an iterable of DataFrames. With the 'threads' or
+        'processes' executor, chunks are scored on a worker pool with at most
+        two chunks per worker in flight.
+        """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
+        if isinstance(source, str):
+            source = iter_frames(source, chunksize, format=format, columns=self.columns)
+
+        if executor == 'serial':
+            for chunk in source:
+                yield self.predict(chunk)
+            return
+
+        n_workers = n_workers or os.cpu_count() or 1
+        if executor == 'threads':
+            pool = ThreadPoolExecutor(max_workers=n_workers)
+            predict = self.predict
+        else:
+            pool = ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(self,))
+            predict = _predict_in_worker
+        with pool:
+            max_in_flight = 2 * n_workers
+            pending = deque()
+            for chunk in source:
+                pending.append(pool.submit(predict, chunk))
+                if len(pending) >= max_in_flight:
+                    yield pending.popleft().result()
+            while pending:
+                yield pending.popleft().result()
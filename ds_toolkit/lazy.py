@@ -0,0 +1,275 @@
+"""
+Lazy Cleaning Plans.
+
+``DataCleaner.lazy()`` returns a ``LazyCleaner`` whose cleaning calls only
+record steps. ``collect()`` optimizes the plan, then runs it on the cleaner:
+
+- ``None`` column lists are resolved against the schema, so later
+  rewrites cannot change which columns a step reads;
+- consecutive imputations, and consecutive encodings with the same
+  options, are fused into one step;
+- row filters (deduplication, IQR outliers) are pushed ahead of the
+  encodings whose output they do not read. The encoder is still fitted at
+  its original position, so codes are unchanged, but the encoded columns
+  are only built for the rows that survive;
+- with ``select``, imputations and encodings of unused columns are
+  dropped and only the needed columns are read from the source file.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Union
+import pandas as pd
+from .encoding import LabelEncoder, OneHotEncoder
+from .stats import is_numeric_column
+from .storage import read_schema
+
+FILTERS = ('remove_duplicates', 'remove_outliers_iqr')
+
+
+@dataclass
+class Step:
+    """One recorded operation; ``slot`` links a split encoding to its fit."""
+    op: str
+    columns: Optional[List[str]] = None
+    params: Dict[str, Any] = field(default_factory=dict)
+    slot: Optional[dict] = None
+
+    def __str__(self) -> str:
+        args = [] if self.columns is None else [repr(self.columns)]
+        args += [f"{key}={value!r}" for key, value in self.params.items()]
+        return f"{self.op}({', '.join(args)})"
+
+
+def _encoded_names(step: Step) -> List[str]:
+    """Output columns known before fitting (one-hot names depend on the data)."""
+    if step.params.get('method', 'label') == 'label':
+        return [f'{col}_Encoded' for col in step.columns]
+    return []
+
+
+def _produces(step: Step, name: str) -> bool:
+    """Whether an encoding step creates the column ``name``."""
+    if step.params.get('method', 'label') == 'label':
+        return name in _encoded_names(step)
+    prefix = step.params.get('prefix')
+    return any(name.startswith(f"{prefix or col}_") for col in step.columns)
+
+
+def _reads(step: Step) -> Set[str]:
+    """Columns whose values the step depends on."""
+    return set(step.columns or [])
+
+
+class LazyCleaner:
+    """Records cleaning steps on a ``DataCleaner`` and runs them optimized on ``collect()``."""
+
+    def __init__(self, cleaner):
+        self.cleaner = cleaner
+        self.steps: List[Step] = []
+
+    def remove_duplicates(self, subset: Optional[List[str]] = None) -> 'LazyCleaner':
+        self.steps.append(Step('remove_duplicates', subset))
+        return self
+
+    def handle_missing_values(self, columns: Optional[List[str]] = None) -> 'LazyCleaner':
+        self.steps.append(Step('handle_missing_values', columns))
+        return self
+
+    def remove_outliers_iqr(self, columns: Optional[List[str]] = None) -> 'LazyCleaner':
+        self.steps.append(Step('remove_outliers_iqr', columns))
+        return self
+
+    def encode_categorical(self, column: Union[str, List[str]], method: str = 'label',
+                           prefix: Optional[str] = None, sparse: bool = False) -> 'LazyCleaner':
+        if method not in ('label', 'onehot'):
+            raise ValueError(f"Unknown encoding method '{method}'")
+        columns = [column] if isinstance(column, str) else list(column)
+        params = {'method': method}
+        if prefix is not None:
+            params['prefix'] = prefix
+        if sparse:
+            params['sparse'] = sparse
+        self.steps.append(Step('encode_categorical', columns, params))
+        return self
+
+    def select(self, columns: List[str]) -> 'LazyCleaner':
+        """Keeps only ``columns`` (in that order) at this point of the plan."""
+        self.steps.append(Step('select', list(columns)))
+        return self
+
+    # Planning
+
+    def _source(self) -> str:
+        if self.cleaner.df is not None:
+            return 'scan(<DataFrame>)'
+        return f"scan({self.cleaner.filepath!r})"
+
+    def _schema(self) -> pd.DataFrame:
+        if self.cleaner.df is not None:
+            return self.cleaner.df.iloc[:0]
+        if not self.cleaner.filepath:
+            raise ValueError("No data loaded. Use load_data() or pass a filepath first.")
+        return read_schema(self.cleaner.filepath)
+
+    def _resolve(self, schema: pd.DataFrame) -> List[Step]:
+        """Copies the steps with every column list made explicit."""
+        columns = list(schema.columns)
+        numeric = {col: is_numeric_column(schema[col].dtype) for col in columns}
+        derived: Dict[str, str] = {}
+        encodings: List[Step] = []
+        resolved = []
+        for step in self.steps:
+            cols = None if step.columns is None else list(step.columns)
+            if step.op == 'remove_duplicates' and cols is None:
+                # Encoded columns are functions of their source column, while it is still there
+                cols = [col for col in columns if derived.get(col) not in columns]
+            elif step.op == 'handle_missing_values':
+                cols = [col for col in (cols or columns) if col in columns]
+            elif step.op == 'remove_outliers_iqr':
+                cols = [col for col in (cols or columns) if col in columns and numeric.get(col)]
+            elif step.op == 'encode_categorical':
+                cols = [col for col in cols if col in columns]
+                encodings.append(Step(step.op, cols, step.params))
+                for name, source in zip(_encoded_names(encodings[-1]), cols):
+                    if name not in columns:
+                        columns.append(name)
+                    numeric[name] = True
+                    derived[name] = source
+            elif step.op == 'select':
+                # Unknown names are ignored, as by collect(); one-hot names are only known once fitted
+                cols = [col for col in cols
+                        if col in columns or any(_produces(encoding, col) for encoding in encodings)]
+                columns = list(cols)
+            resolved.append(Step(step.op, cols, dict(step.params)))
+        return resolved
+
+    @staticmethod
+    def _fuse(steps: List[Step]) -> List[Step]:
+        fused: List[Step] = []
+        for step in steps:
+            previous = fused[-1] if fused else None
+            if previous is not None and previous.op == step.op == 'handle_missing_values':
+                previous.columns += [col for col in step.columns if col not in previous.columns]
+                continue
+            if (previous is not None and previous.op == step.op == 'encode_categorical'
+                    and previous.params == step.params and 'prefix' not in step.params
+                    and not any(_produces(previous, col) for col in step.columns)):
+                previous.columns += [col for col in step.columns if col not in previous.columns]
+                continue
+            if step.op in ('handle_missing_values', 'encode_categorical') and not step.columns:
+                continue
+            fused.append(step)
+        return fused
+
+    @staticmethod
+    def _push_filters(steps: List[Step]) -> List[Step]:
+        steps = list(steps)
+        moved = True
+        while moved:
+            moved = False
+            for i in range(1, len(steps)):
+                encode, step = steps[i - 1], steps[i]
+                if encode.op != 'encode_categorical' or step.op not in FILTERS + ('fit_encoder',):
+                    continue
+                if any(_produces(encode, col) for col in _reads(step)):
+                    continue
+                # Encodings also move past other encoders' fits, to reach the filters behind them
+                if encode.slot is None and step.op in FILTERS:
+                    encode.slot = {}
+                    steps.insert(i - 1, Step('fit_encoder', encode.columns, encode.params, encode.slot))
+                    i += 1
+                steps[i - 1], steps[i] = steps[i], steps[i - 1]
+                moved = True
+                break
+        return steps
+
+    @staticmethod
+    def _prune(steps: List[Step], schema: pd.DataFrame):
+        """Drops work on unused columns; returns the steps and the columns to read."""
+        selects = [step for step in steps if step.op == 'select']
+        if not selects:
+            return steps, None
+        required: Set[str] = set(selects[-1].columns)
+        kept: List[Step] = []
+        # Columns still encoded by each split encoding, keyed by its slot
+        encoded: Dict[int, List[str]] = {}
+        for step in reversed(steps):
+            if step.op == 'select':
+                required &= set(step.columns)
+            elif step.op in FILTERS:
+                required |= _reads(step)
+            elif step.op == 'handle_missing_values':
+                step.columns = [col for col in step.columns if col in required]
+                if not step.columns:
+                    continue
+            elif step.op == 'encode_categorical':
+                step.columns = [col for col in step.columns if any(
+                    _produces(Step(step.op, [col], step.params), name) for name in required)]
+                if step.slot is not None:
+                    encoded[id(step.slot)] = step.columns
+                if not step.columns:
+                    continue
+                required |= set(step.columns)
+            elif step.op == 'fit_encoder':
+                step.columns = encoded.get(id(step.slot), [])
+                if not step.columns:
+                    continue
+            kept.append(step)
+        kept.reverse()
+        return kept, [col for col in schema.columns if col in required]
+
+    def optimized_plan(self):
+        """Returns the columns to read (None for all) and the optimized steps."""
+        schema = self._schema()
+        steps = self._push_filters(self._fuse(self._resolve(schema)))
+        steps, scan_columns = self._prune(steps, schema)
+        return scan_columns, steps
+
+    def explain(self) -> str:
+        """Prints the recorded plan and the optimized one, and returns them as text."""
+        scan_columns, steps = self.optimized_plan()
+        source = self._source()
+        lines = ["== Logical plan ==", source] + [f"  {step}" for step in self.steps]
+        scan = source if scan_columns is None else f"{source[:-1]}, columns={scan_columns!r})"
+        lines += ["== Optimized plan ==", scan] + [f"  {step}" for step in steps]
+        text = '\n'.join(lines)
+        print(text)
+        return text
+
+    # Execution
+
+    def collect(self) -> pd.DataFrame:
+        """Runs the optimized plan on the cleaner and returns its DataFrame."""
+        scan_columns, steps = self.optimized_plan()
+        cleaner = self.cleaner
+        if cleaner.df is None:
+            cleaner.load_data(columns=scan_columns)
+        elif scan_columns is not None:
+            cleaner.df = cleaner.df[scan_columns]
+
+        for step in steps:
+            if step.op == 'remove_duplicates':
+                cleaner.remove_duplicates(subset=step.columns)
+            elif step.op == 'handle_missing_values':
+                cleaner.handle_missing_values(step.columns)
+            elif step.op == 'remove_outliers_iqr':
+                cleaner.remove_outliers_iqr(step.columns)
+            elif step.op == 'fit_encoder':
+                step.slot['encoder'] = self._encoder(step).fit(cleaner.df, backend=cleaner.backend)
+            elif step.op == 'encode_categorical':
+                encoder = step.slot['encoder'] if step.slot is not None else None
+                cleaner.encode_categorical(step.columns, method=step.params['method'],
+                                           prefix=step.params.get('prefix'),
+                                           sparse=step.params.get('sparse', False), encoder=encoder)
+            elif step.op == 'select':
+                cleaner.df = cleaner.df[[col for col in step.columns if col in cleaner.df.columns]]
+        self.steps = []
+        return cleaner.df
+
+    @staticmethod
+    def _encoder(step: Step):
+        if step.params['method'] == 'label':
+            return LabelEncoder(step.columns)
+        prefix = step.params.get('prefix')
+        prefixes = {step.columns[0]: prefix} if prefix and len(step.columns) == 1 else None
+        return OneHotEncoder(step.columns, prefixes=prefixes, sparse=step.params.get('sparse', False))
@@ -0,0 +1,145 @@
+"""
+In-Process Metrics Registry.
+
+Per-function call counts and latency histograms fed by ``timing_decorator``,
+with percentile estimates and JSON / Prometheus text export. ``disable()``
+turns recording off globally, leaving only a flag check in the decorators.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from typing import Dict
+
+# Histogram bucket upper bounds: 1µs doubling up to ~19 hours
+BUCKET_BOUNDS_NS = tuple(1000 * 2 ** i for i in range(37))
+
+
+class Histogram:
+    """Latency histogram with exponential buckets (nanoseconds)."""
+
+    __slots__ = ('count', 'errors', 'sum_ns', 'min_ns', 'max_ns', 'buckets')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.sum_ns = 0
+        self.min_ns = None
+        self.max_ns = None
+        self.buckets = [0] * (len(BUCKET_BOUNDS_NS) + 1)
+
+    def observe(self, duration_ns: int, error: bool = False) -> None:
+        self.count += 1
+        self.errors += error
+        self.sum_ns += duration_ns
+        self.min_ns = duration_ns if self.min_ns is None else min(self.min_ns, duration_ns)
+        self.max_ns = duration_ns if self.max_ns is None else max(self.max_ns, duration_ns)
+        self.buckets[bisect_left(BUCKET_BOUNDS_NS, duration_ns)] += 1
+
+    def percentile(self, p: float) -> float:
+        """Estimated ``p``-th percentile in nanoseconds, interpolated inside its bucket."""
+        if self.count == 0:
+            return 0.0
+        rank = p / 100 * self.count
+        cumulative = 0
+        for i, n in enumerate(self.buckets):
+            if n and cumulative + n >= rank:
+                lower = BUCKET_BOUNDS_NS[i - 1] if i > 0 else 0
+                upper = BUCKET_BOUNDS_NS[i] if i < len(BUCKET_BOUNDS_NS) else self.max_ns
+                estimate = lower + (upper - lower) * (rank - cumulative) / n
+                return float(min(max(estimate, self.min_ns), self.max_ns))
+            cumulative += n
+        return float(self.max_ns)
+
+
+class MetricsRegistry:
+    """Thread-safe collection of named histograms."""
+
+    def __init__(self):
+        self.enabled = True
+        self._lock = threading.Lock()
+        self._histograms: Dict[str, Histogram] = {}
+
+    def observe(self, name: str, duration_ns: int, error: bool = False) -> None:
+        """Records one call of ``name`` lasting ``duration_ns``."""
+        with self._lock:
+            histogram = self._histograms.get(name)
+            if histogram is None:
+                histogram = self._histograms[name] = Histogram()
+            histogram.observe(duration_ns, error)
+
+    @contextmanager
+    def timer(self, name: str):
+        """Times the enclosed block under ``name``."""
+        if not self.enabled:
+            yield
+            return
+        start = time.perf_counter_ns()
+        error = False
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self.observe(name, time.perf_counter_ns() - start, error)
+
+    def reset(self) -> None:
+        """Drops every recorded metric."""
+        with self._lock:
+            self._histograms.clear()
+
+    def snapshot(self) -> Dict[str, dict]:
+        """Per-function counts and latencies in seconds."""
+        with self._lock:
+            items = list(self._histograms.items())
+        return {
+            name: {
+                'count': h.count,
+                'errors': h.errors,
+                'total_seconds': h.sum_ns / 1e9,
+                'min_seconds': h.min_ns / 1e9,
+                'max_seconds': h.max_ns / 1e9,
+                'p50_seconds': h.percentile(50) / 1e9,
+                'p95_seconds': h.percentile(95) / 1e9,
+                'p99_seconds': h.percentile(99) / 1e9,
+            }
+            for name, h in sorted(items)
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2)
+
+    def to_prometheus(self, metric: str = 'ds_toolkit_call_duration_seconds') -> str:
+        """Snapshot in the Prometheus text exposition format."""
+        with self._lock:
+            items = [(name, list(h.buckets), h.sum_ns, h.count, h.errors)
+                     for name, h in sorted(self._histograms.items())]
+        lines = [f'# TYPE {metric} histogram']
+        for name, buckets, sum_ns, count, _ in items:
+            cumulative = 0
+            for bound, n in zip(BUCKET_BOUNDS_NS, buckets):
+                cumulative += n
+                lines.append(f'{metric}_bucket{{function="{name}",le="{bound / 1e9:g}"}} {cumulative}')
+            lines.append(f'{metric}_bucket{{function="{name}",le="+Inf"}} {count}')
+            lines.append(f'{metric}_sum{{function="{name}"}} {sum_ns / 1e9:.9f}')
+            lines.append(f'{metric}_count{{function="{name}"}} {count}')
+        lines.append('# TYPE ds_toolkit_call_errors_total counter')
+        for name, _, _, _, errors in items:
+            lines.append(f'ds_toolkit_call_errors_total{{function="{name}"}} {errors}')
+        return '\n'.join(lines) + '\n'
+
+
+REGISTRY = MetricsRegistry()
+
+
+def enable() -> None:
+    """Turns metrics recording on (the default)."""
+    REGISTRY.enabled = True
+
+
+def disable() -> None:
+    """Turns metrics recording off globally."""
+    REGISTRY.enabled = False
@@ -0,0 +1,295 @@
+"""
+Parallel Cleaning.
+
+Column-parallel statistics: ``ProcessBackend`` computes the per-column
+statistics of the cleaning steps (medians, IQR quartiles, modes, encoder
+vocabularies) on a process pool, by groups of columns. Numeric columns are
+copied once into a shared-memory float64 block that every worker maps
+without pickling; other columns have no fixed-width representation and are
+sent to the workers pickled, one group per task.
+
+Row-parallel cleaning: ``clean_partitioned`` splits a frame into row
+partitions; workers hash them for deduplication, return mergeable
+statistics (``ValueCounts`` or ``QuantileSketch``) from which the global fill
+values and IQR bounds are derived, then clean their partition against them.
+"""
+
+import os
+import warnings
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
+import numpy as np
+import pandas as pd
+from .dedup import _first_in_batch, row_hashes
+from .encoding import _vocabulary
+from .imputation import column_mode
+from .sketches import QuantileSketch
+from .stats import ValueCounts, is_numeric_column
+
+EXECUTORS = ('serial', 'processes')
+
+
+def _numeric_stats(name: str, shape: tuple, start: int, stop: int,
+                   median: bool, quantiles: Sequence[float]) -> Dict[str, np.ndarray]:
+    """Medians and quantiles of rows ``start:stop`` of a shared (columns x rows) block."""
+    shm = SharedMemory(name=name)
+    try:
+        block = np.ndarray(shape, dtype='float64', buffer=shm.buf)[start:stop]
+        result = {}
+        with warnings.catch_warnings():
+            # All-missing columns give NaN, like pandas
+            warnings.simplefilter('ignore', RuntimeWarning)
+            if median:
+                result['median'] = np.nanmedian(block, axis=1)
+            if len(quantiles):
+                result['quantiles'] = np.nanquantile(block, list(quantiles), axis=1).reshape(len(quantiles), -1)
+        del block
+        return result
+    finally:
+        shm.close()
+
+
+def _object_stats(frame: pd.DataFrame, mode: List[str], vocabulary: List[str]) -> Dict[str, Dict[str, Any]]:
+    return {
+        'mode': {col: column_mode(frame[col]) for col in mode},
+        'vocabulary': {col: _vocabulary(frame[col]) for col in vocabulary},
+    }
+
+
+class ProcessBackend:
+    """
+    Runs column statistics on ``n_workers`` processes (all CPUs by default).
+
+    Columns are split into one contiguous group per worker and results are
+    returned in the requested column order. Requests touching fewer than
+    ``min_columns`` columns are computed in the calling process. The pool is
+    started by the first parallel request and reused by the next ones until
+    ``close()``; use the backend as a context manager to close it on exit.
+    """
+
+    def __init__(self, n_workers: Optional[int] = None, min_columns: int = 2):
+        self.n_workers = n_workers or os.cpu_count() or 1
+        self.min_columns = min_columns
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+    def __enter__(self) -> 'ProcessBackend':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self.n_workers)
+        return self._pool
+
+    def close(self) -> None:
+        """Shuts the worker processes down; a later request starts new ones."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+
+    def summarize(self, df: pd.DataFrame, medians: Sequence[str] = (), quantiles: Sequence[str] = (),
+                  q: Sequence[float] = (0.25, 0.75), modes: Sequence[str] = (),
+                  vocabularies: Sequence[str] = ()) -> Dict[str, Any]:
+        """
+        Computes every requested statistic in one round of pool tasks.
+
+        Returns ``median`` (Series, like ``df[medians].median()``),
+        ``quantiles`` (DataFrame indexed by ``q``, like ``df[quantiles].quantile(q)``),
+        ``mode`` and ``vocabulary`` (dicts by column).
+        """
+        medians, quantiles = list(medians), list(quantiles)
+        modes, vocabularies = list(modes), list(vocabularies)
+        numeric = list(dict.fromkeys(medians + quantiles))
+        others = list(dict.fromkeys(modes + vocabularies))
+        if len(numeric) + len(others) < self.min_columns or self.n_workers < 2:
+            return self._serial(df, medians, quantiles, q, modes, vocabularies)
+
+        pool = self._get_pool()
+        shm = self._share(df, numeric) if numeric else None
+        try:
+            numeric_futures = [
+                (group, pool.submit(_numeric_stats, shm.name, (len(numeric), len(df)), group[0], group[-1] + 1,
+                                    bool(medians), list(q) if quantiles else []))
+                for group in self._groups(len(numeric))
+            ]
+            object_futures = [
+                pool.submit(_object_stats, df[[others[i] for i in group]],
+                            [others[i] for i in group if others[i] in modes],
+                            [others[i] for i in group if others[i] in vocabularies])
+                for group in self._groups(len(others))
+            ]
+            median_values = np.full(len(numeric), np.nan)
+            quantile_values = np.full((len(q), len(numeric)), np.nan)
+            for group, future in numeric_futures:
+                part = future.result()
+                if 'median' in part:
+                    median_values[group] = part['median']
+                if 'quantiles' in part:
+                    quantile_values[:, group] = part['quantiles']
+            found = {'mode': {}, 'vocabulary': {}}
+            for future in object_futures:
+                part = future.result()
+                found['mode'].update(part['mode'])
+                found['vocabulary'].update(part['vocabulary'])
+        except BrokenProcessPool:
+            # A dead worker breaks the pool for good: the next request starts a new one
+            self.close()
+            raise
+        finally:
+            if shm is not None:
+                shm.close()
+                shm.unlink()
+
+        position = {col: i for i, col in enumerate(numeric)}
+        return {
+            'median': pd.Series([median_values[position[col]] for col in medians], index=medians, dtype='float64'),
+            'quantiles': pd.DataFrame(quantile_values[:, [position[col] for col in quantiles]],
+                                      index=list(q), columns=quantiles),
+            'mode': {col: found['mode'][col] for col in modes},
+            'vocabulary': {col: found['vocabulary'][col] for col in vocabularies},
+        }
+
+    def _groups(self, n_columns: int) -> List[np.ndarray]:
+        if n_columns == 0:
+            return []
+        return np.array_split(np.arange(n_columns), min(n_columns, self.n_workers))
+
+    @staticmethod
+    def _share(df: pd.DataFrame, columns: List[str]) -> SharedMemory:
+        """Copies ``columns`` as float64 into a new shared block, one contiguous row per column."""
+        shm = SharedMemory(create=True, size=max(1, 8 * len(columns) * len(df)))
+        block = np.ndarray((len(columns), len(df)), dtype='float64', buffer=shm.buf)
+        for i, col in enumerate(columns):
+            block[i] = df[col].to_numpy(dtype='float64', na_value=np.nan)
+        del block
+        return shm
+
+    @staticmethod
+    def _serial(df: pd.DataFrame, medians: List[str], quantiles: List[str], q: Sequence[float],
+                modes: List[str], vocabularies: List[str]) -> Dict[str, Any]:
+        return {
+            'median': df[medians].median() if medians else pd.Series(dtype='float64'),
+            'quantiles': df[quantiles].quantile(list(q)) if quantiles else pd.DataFrame(index=list(q)),
+            **_object_stats(df, modes, vocabularies),
+        }
+
+    # Shortcuts for a single kind of statistic
+
+    def medians(self, df: pd.DataFrame, columns: Sequence[str]) -> pd.Series:
+        return self.summarize(df, medians=columns)['median']
+
+    def quantiles(self, df: pd.DataFrame, columns: Sequence[str], q: Sequence[float]) -> pd.DataFrame:
+        return self.summarize(df, quantiles=columns, q=q)['quantiles']
+
+    def vocabularies(self, df: pd.DataFrame, columns: Sequence[str]) -> Dict[str, pd.Index]:
+        return self.summarize(df, vocabularies=columns)['vocabulary']
+
+
+# Row partitions
+
+_worker_frame: Optional[pd.DataFrame] = None
+
+
+def _init_worker(df: pd.DataFrame) -> None:
+    # Inherited without a copy when workers are forked, pickled once per worker otherwise
+    global _worker_frame
+    _worker_frame = df
+
+
+def _partition_hashes(start: int, stop: int) -> np.ndarray:
+    return row_hashes(_worker_frame.iloc[start:stop])
+
+
+def _partition_stats(start: int, stop: int, keep: np.ndarray,
+                     sketch_k: Optional[int]) -> Dict[str, Union[ValueCounts, QuantileSketch]]:
+    """Mergeable statistics of every column over the kept rows of a partition."""
+    chunk = _worker_frame.iloc[start:stop][keep]
+    stats = {}
+    for col in chunk.columns:
+        numeric = is_numeric_column(chunk[col].dtype)
+        stats[col] = QuantileSketch(sketch_k) if numeric and sketch_k is not None else ValueCounts(numeric)
+        stats[col].update(chunk[col])
+    return stats
+
+
+def _clean_partition(start: int, stop: int, keep: np.ndarray, fill_values: Dict[str, Any],
+                     bounds: Dict[str, Tuple[float, float]]) -> pd.DataFrame:
+    chunk = _worker_frame.iloc[start:stop][keep].copy()
+    if fill_values:
+        chunk.fillna(fill_values, inplace=True)
+    mask = np.ones(len(chunk), dtype=bool)
+    for col, (lower, upper) in bounds.items():
+        values = chunk[col].to_numpy(dtype='float64', na_value=np.nan)
+        mask &= (values >= lower) & (values <= upper)
+    return chunk[mask]
+
+
+def partition_bounds(n_rows: int, partitions: int) -> List[Tuple[int, int]]:
+    """``(start, stop)`` of ``partitions`` contiguous row ranges of near-equal size, empty ones left out."""
+    edges = np.linspace(0, n_rows, max(1, partitions) + 1).astype('int64')
+    return [(int(start), int(stop)) for start, stop in zip(edges[:-1], edges[1:]) if stop > start]
+
+
+def clean_partitioned(df: pd.DataFrame, partitions: int, n_workers: Optional[int] = None,
+                      sketch_k: Optional[int] = None) -> Dict[str, Any]:
+    """
+    Deduplicates, imputes and filters IQR outliers of ``df`` by row partitions.
+
+    Same result as the in-memory steps: duplicates (first occurrence kept)
+    are found across partitions from the row hashes, fill values and
+    quartiles come from the merged statistics of the deduplicated rows, and
+    the cleaned partitions are concatenated in row order. With ``sketch_k``
+    medians and quartiles are estimated with ``QuantileSketch``.
+
+    Returns the cleaned ``frame``, the ``fill_values`` and the
+    ``duplicates``, ``missing`` and ``outliers`` counts.
+    """
+    ranges = partition_bounds(len(df), partitions)
+    n_workers = min(n_workers or os.cpu_count() or 1, max(1, len(ranges)))
+    with ProcessPoolExecutor(max_workers=n_workers, initializer=_init_worker, initargs=(df,)) as pool:
+        hashes = [pool.submit(_partition_hashes, start, stop) for start, stop in ranges]
+        hashes = np.concatenate([future.result() for future in hashes]) if ranges else np.empty(0, 'uint64')
+        positions, _ = _first_in_batch(hashes)
+        unique = np.zeros(len(df), dtype=bool)
+        unique[positions] = True
+        keeps = [unique[start:stop] for start, stop in ranges]
+
+        stats: Dict[str, Union[ValueCounts, QuantileSketch]] = {}
+        partials = [pool.submit(_partition_stats, start, stop, keep, sketch_k)
+                    for (start, stop), keep in zip(ranges, keeps)]
+        for future in partials:
+            for col, partial in future.result().items():
+                stats[col] = stats[col].merge(partial) if col in stats else partial
+
+        numeric = {col: is_numeric_column(df[col].dtype) for col in df.columns}
+        fill_values = {}
+        for col, counts in stats.items():
+            if counts.missing == 0:
+                continue
+            value = counts.median() if numeric[col] else counts.mode()
+            if value is not None and not pd.isna(value):
+                fill_values[col] = value
+                counts.add_value(value, counts.missing)
+        bounds = {}
+        for col, counts in stats.items():
+            if numeric[col]:
+                q1, q3 = counts.quantile(0.25), counts.quantile(0.75)
+                bounds[col] = (q1 - 1.5 * (q3 - q1), q3 + 1.5 * (q3 - q1))
+
+        parts = [pool.submit(_clean_partition, start, stop, keep, fill_values, bounds)
+                 for (start, stop), keep in zip(ranges, keeps)]
+        parts = [future.result() for future in parts]
+
+    frame = pd.concat(parts) if parts else df.iloc[:0]
+    unique_rows = int(unique.sum())
+    return {
+        'frame': frame,
+        'fill_values': fill_values,
+        'duplicates': len(df) - unique_rows,
+        'missing': sum(stats[col].missing for col in fill_values),
+        'outliers': unique_rows - len(frame),
+    }
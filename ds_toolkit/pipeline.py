@@ -1,24 +1,72 @@
 """
 ML Pipeline Module.
+
+scikit-learn is imported when a component is first built or used, so importing
+this module stays cheap.
 """
 
+import warnings
 import pandas as pd
 import numpy as np
-from sklearn.model_selection import train_test_split
-from sklearn.preprocessing import StandardScaler
-from sklearn.ensemble import RandomForestClassifier
-from sklearn.metrics import classification_report
-from typing import Tuple, Any, Dict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Tuple, Any, AsyncIterator, Callable, Dict, List, Optional, Union
+from .aio import Progress, StageEvent, check_executor, iter_stages, notify
+from .cache import StepCache, hash_frame, hash_params
+from .inference import InferenceBundle
+from .profiling import PROFILER
+from .tracing import TRACER
+from .storage import read_frame
 
 class DataLoader:
-    """Loads data and separates features/target."""
-    def __init__(self, filepath: str, target_column: str):
-        self.filepath = filepath
+    """
+    Loads data and separates features/target.
+
+    The source can be a file path (CSV, Parquet or Feather), an in-memory
+    DataFrame, or a frame provider: any object exposing ``get_data()`` (such as
+    a ``DataCleaner``) or a callable returning a DataFrame. When
+    ``feature_columns`` is given, only those columns and the target are read.
+    The ``filepath`` keyword is a deprecated alias of ``source``.
+    """
+    def __init__(self, source: Union[str, pd.DataFrame, Any] = None, target_column: str = None,
+                 feature_columns: Optional[List[str]] = None, format: Optional[str] = None,
+                 filepath: Optional[str] = None):
+        if filepath is not None:
+            if source is not None:
+                raise TypeError("DataLoader() got both 'source' and its deprecated alias 'filepath'")
+            warnings.warn("DataLoader(filepath=...) is deprecated, use source=...", DeprecationWarning, stacklevel=2)
+            source = filepath
+        if source is None or target_column is None:
+            raise TypeError("DataLoader() requires a source and a target_column")
+        self.source = source
         self.target_column = target_column
+        self.feature_columns = feature_columns
+        self.format = format
+
+    @property
+    def filepath(self):
+        return self.source if isinstance(self.source, str) else None
+
+    def _read(self) -> pd.DataFrame:
+        if isinstance(self.source, pd.DataFrame):
+            return self.source
+        if isinstance(self.source, str):
+            columns = None
+            if self.feature_columns is not None:
+                columns = list(self.feature_columns) + [self.target_column]
+            return read_frame(self.source, format=self.format, columns=columns)
+        if hasattr(self.source, 'get_data'):
+            return self.source.get_data()
+        if callable(self.source):
+            return self.source()
+        raise TypeError(f"Unsupported data source: {type(self.source).__name__}")
         
     def load(self) -> Tuple[pd.DataFrame, pd.Series]:
-        data = pd.read_csv(self.filepath)
-        X = data.drop(self.target_column, axis=1)
+        data = self._read()
+        if self.feature_columns is not None:
+            X = data[list(self.feature_columns)]
+        else:
+            X = data.drop(self.target_column, axis=1)
         y = data[self.target_column]
         return X, y
 
@@ -29,7 +77,17 @@ class DataSplitter:
         self.test_size = test_size
         self.random_state = random_state
         
+    def split_indices(self, n_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """Train and test row positions; ``split`` returns the same rows."""
+        from sklearn.model_selection import train_test_split
+        return train_test_split(
+            np.arange(n_samples),
+            test_size=self.test_size,
+            random_state=self.random_state
+        )
+        
     def split(self, X: pd.DataFrame, y: pd.Series) -> Tuple:
+        from sklearn.model_selection import train_test_split
         return train_test_split(
             X, y, 
             test_size=self.test_size, 
@@ -40,6 +98,7 @@ class DataSplitter:
 class Scaler:
     """Handles data scaling (StandardScaler)."""
     def __init__(self):
+        from sklearn.preprocessing import StandardScaler
         self.scaler = StandardScaler()
         
     def fit_transform(self, X_train: pd.DataFrame) -> np.ndarray:
@@ -50,9 +109,15 @@ class Scaler:
 
 
 class ModelHandler:
-    """Handles model training and evaluation (RandomForest)."""
+    """
+    Handles model training and evaluation (RandomForest).
+
+    ``evaluate`` keeps the last classification report as a dict in ``metrics``.
+    """
     def __init__(self, n_estimators: int = 100):
+        from sklearn.ensemble import RandomForestClassifier
         self.model = RandomForestClassifier(n_estimators=n_estimators)
+        self.metrics: Dict[str, Any] = {}
         
     def train(self, X_train: np.ndarray, y_train: pd.Series) -> None:
         self.model.fit(X_train, y_train)
@@ -61,34 +126,175 @@ class ModelHandler:
         return self.model.predict(X_test)
         
     def evaluate(self, X_test: np.ndarray, y_test: pd.Series) -> str:
+        from sklearn.metrics import classification_report
         predictions = self.predict(X_test)
-        return classification_report(y_test, predictions)
+        self.metrics = classification_report(y_test, predictions, output_dict=True, zero_division=0)
+        return classification_report(y_test, predictions, zero_division=0)
+        
+    def to_bundle(self, scaler=None, columns: Optional[List[str]] = None) -> InferenceBundle:
+        """Packs the trained model with its fitted scaler and feature column order."""
+        return InferenceBundle(self.model, scaler=scaler, columns=columns)
+        
+    def predict_stream(self, source, scaler=None, columns: Optional[List[str]] = None, **kwargs):
+        """Yields predictions chunk by chunk (see ``InferenceBundle.predict_stream``)."""
+        return self.to_bundle(scaler, columns).predict_stream(source, **kwargs)
+
+
+@contextmanager
+def _stage(name: str):
+    """Traces and memory-profiles one pipeline stage; yields its span."""
+    with TRACER.span(name) as span, PROFILER.step(name):
+        yield span
+
+
+def _take(data, indices):
+    """Selects rows by position from a DataFrame, Series or array."""
+    return data.iloc[indices] if hasattr(data, 'iloc') else data[indices]
+
+
+def _estimator_params(component, attr: str):
+    """Class name and parameters of the estimator wrapped by a component, or None."""
+    estimator = getattr(component, attr, None)
+    if estimator is None or not hasattr(estimator, 'get_params'):
+        return None
+    return [type(estimator).__name__, estimator.get_params()]
 
 
 class MLPipeline:
-    """Facade orchestrating the complete pipeline."""
-    def __init__(self, loader, splitter, scaler, model_handler):
+    """
+    Facade orchestrating the complete pipeline.
+
+    With a ``StepCache``, the split indices, the fitted scaler and the trained
+    model are stored under keys derived from the input data and the component
+    parameters, so a rerun with the same inputs skips those stages.
+    """
+    def __init__(self, loader, splitter, scaler, model_handler, cache: Optional[StepCache] = None):
         self.loader = loader
         self.splitter = splitter
         self.scaler = scaler
         self.model_handler = model_handler
+        self.cache = cache
+        self.feature_columns: Optional[List[str]] = None
+        self.report: Optional[str] = None
         
-    def run(self):
-        # 1. Load
-        X, y = self.loader.load()
+    def _cached(self, key: Optional[str], compute):
+        """Returns the cached value of ``key`` or computes and stores it."""
+        if self.cache is None or key is None:
+            return compute()
+        found, value = self.cache.get(key)
+        if not found:
+            value = compute()
+            self.cache.put(key, value)
+        return value
         
-        # 2. Split
-        X_train, X_test, y_train, y_test = self.splitter.split(X, y)
+    def _split(self, X, y, data_key: Optional[str]):
+        if not hasattr(self.splitter, 'split_indices'):
+            return self.splitter.split(X, y), None
+        key = None
+        if data_key is not None:
+            key = hash_params('split', data_key, self.splitter.test_size, self.splitter.random_state)
+        train_idx, test_idx = self._cached(key, lambda: self.splitter.split_indices(len(X)))
+        return (_take(X, train_idx), _take(X, test_idx), _take(y, train_idx), _take(y, test_idx)), key
         
-        # 3. Scale
+    def _scale(self, X_train, X_test, split_key: Optional[str]):
+        params = _estimator_params(self.scaler, 'scaler')
+        key = hash_params('scaler', split_key, params) if split_key and params else None
+        if key is not None:
+            found, fitted = self.cache.get(key)
+            if found:
+                self.scaler.scaler = fitted
+                return self.scaler.transform(X_train), self.scaler.transform(X_test), key
         X_train_scaled = self.scaler.fit_transform(X_train)
-        X_test_scaled = self.scaler.transform(X_test)
+        if key is not None:
+            self.cache.put(key, self.scaler.scaler)
+        return X_train_scaled, self.scaler.transform(X_test), key
         
-        # 4. Train
+    def _train(self, X_train_scaled, y_train, scaler_key: Optional[str]) -> None:
+        params = _estimator_params(self.model_handler, 'model')
+        key = hash_params('model', scaler_key, params) if scaler_key and params else None
+        if key is not None:
+            found, fitted = self.cache.get(key)
+            if found:
+                self.model_handler.model = fitted
+                return
         self.model_handler.train(X_train_scaled, y_train)
+        if key is not None:
+            self.cache.put(key, self.model_handler.model)
+        
+    def stages(self) -> List[Tuple[str, Callable[[], None]]]:
+        """
+        The stages of ``run`` as ``(name, function)`` pairs, to be called in order.
+
+        Stages pass their results to the next ones through the pipeline; the
+        last one stores the classification report in ``report``.
+        """
+        state: Dict[str, Any] = {}
+
+        def load():
+            with _stage('MLPipeline.load') as span:
+                X, y = self.loader.load()
+                span.set(rows_out=len(X))
+            if isinstance(X, pd.DataFrame):
+                self.feature_columns = list(X.columns)
+            data_key = None
+            if self.cache is not None:
+                data_key = hash_params('data', hash_frame(X), hash_frame(y))
+            state.update(X=X, y=y, data_key=data_key)
+
+        def split():
+            X = state.pop('X')
+            with _stage('MLPipeline.split') as span:
+                (X_train, X_test, y_train, y_test), split_key = self._split(X, state.pop('y'), state['data_key'])
+                span.set(rows_in=len(X), train_rows=len(X_train), test_rows=len(X_test))
+            state.update(X_train=X_train, X_test=X_test, y_train=y_train, y_test=y_test, split_key=split_key)
+
+        def scale():
+            X_train, X_test = state.pop('X_train'), state.pop('X_test')
+            with _stage('MLPipeline.scale') as span:
+                X_train_scaled, X_test_scaled, scaler_key = self._scale(X_train, X_test, state['split_key'])
+                span.set(rows_in=len(X_train) + len(X_test))
+            state.update(X_train_scaled=X_train_scaled, X_test_scaled=X_test_scaled, scaler_key=scaler_key)
+
+        def train():
+            with _stage('MLPipeline.train') as span:
+                self._train(state['X_train_scaled'], state['y_train'], state['scaler_key'])
+                span.set(rows_in=len(state['X_train_scaled']))
+
+        def evaluate():
+            with _stage('MLPipeline.evaluate') as span:
+                self.report = self.model_handler.evaluate(state['X_test_scaled'], state['y_test'])
+                span.set(rows_in=len(state['X_test_scaled']))
+            state.clear()
+            print("Classification Report:")
+            print(self.report)
+
+        return [('MLPipeline.load', load), ('MLPipeline.split', split), ('MLPipeline.scale', scale),
+                ('MLPipeline.train', train), ('MLPipeline.evaluate', evaluate)]
+
+    def run(self):
+        for _, stage in self.stages():
+            stage()
+        return self.report
+
+    async def run_async(self, executor: Optional[ThreadPoolExecutor] = None, progress: Optional[Progress] = None):
+        """
+        ``run`` without blocking the event loop: each stage runs on ``executor``
+        (a ``ThreadPoolExecutor``, the loop's default one if None) and
+        ``progress`` is called with a ``StageEvent`` before and after it.
+        Cancelling the task stops the pipeline before its next stage.
+        """
+        async for event in self.iter_async(executor):
+            await notify(progress, event)
+        return self.report
+
+    def iter_async(self, executor: Optional[ThreadPoolExecutor] = None) -> AsyncIterator[StageEvent]:
+        """Runs the pipeline like ``run_async``, as an async iterator of its ``StageEvent``."""
+        check_executor(executor)
+        return iter_stages(self.stages(), executor)
         
-        # 5. Evaluate
-        report = self.model_handler.evaluate(X_test_scaled, y_test)
-        print("Classification Report:")
-        print(report)
-        return report
+    def export_bundle(self, path: Optional[str] = None) -> InferenceBundle:
+        """Returns the inference bundle of the last run, saved to ``path`` if given."""
+        bundle = self.model_handler.to_bundle(self.scaler, self.feature_columns)
+        if path:
+            bundle.save(path)
+        return bundle
@@ -0,0 +1,197 @@
+"""
+Memory Profiling.
+
+Per-step allocation tracking built on ``tracemalloc`` and RSS sampling. Steps
+are recorded with the ``memory_profile`` decorator or the ``PROFILER.step``
+context manager; profiling is off by default since tracemalloc slows
+allocations down.
+"""
+
+import functools
+import os
+import sys
+import threading
+import tracemalloc
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def current_rss() -> int:
+    """Resident set size of the process in bytes (0 when unavailable)."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # Peak RSS, the best available without /proc (kilobytes on Linux, bytes on macOS)
+        usage = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        return usage if sys.platform == 'darwin' else usage * 1024
+    return 0
+
+
+class _Frame:
+    __slots__ = ('name', 'start_current', 'peak_abs', 'start_rss', 'concurrent')
+
+    def __init__(self, name: str, start_current: int, start_rss: int):
+        self.name = name
+        self.start_current = start_current
+        self.peak_abs = start_current
+        self.start_rss = start_rss
+        self.concurrent = False
+
+
+class MemoryProfiler:
+    """
+    Records peak and net traced allocation and RSS growth for each step call.
+
+    Nested steps are supported: each step's peak includes its children's.
+    tracemalloc keeps a single process-wide peak, so peaks are only measured
+    for steps that run while no other thread is in a step: a step overlapping
+    one of another thread records ``peak_bytes=None`` and leaves the peak
+    alone. Net and RSS figures are process-wide and then include the other
+    thread's allocations.
+    """
+
+    def __init__(self):
+        self.enabled = False
+        self.records: List[dict] = []
+        self._lock = threading.Lock()
+        self._stacks: Dict[int, List[_Frame]] = {}
+        self._started_tracing = False
+
+    def enable(self) -> None:
+        """Starts tracemalloc (if needed) and recording."""
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self.enabled = True
+
+    def disable(self) -> None:
+        """Stops recording (and tracemalloc if it was started here)."""
+        self.enabled = False
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def reset(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def _push(self, name: str) -> _Frame:
+        with self._lock:
+            stack = self._stacks.setdefault(threading.get_ident(), [])
+            current, peak = tracemalloc.get_traced_memory()
+            if stack:
+                stack[-1].peak_abs = max(stack[-1].peak_abs, peak)
+            frame = _Frame(name, current, current_rss())
+            if len(self._stacks) > 1:
+                # Another thread is in a step: the shared peak belongs to neither
+                for frames in self._stacks.values():
+                    for other in frames:
+                        other.concurrent = True
+                frame.concurrent = True
+            else:
+                tracemalloc.reset_peak()
+            stack.append(frame)
+            return frame
+
+    def _pop(self) -> Tuple[_Frame, int, int, int]:
+        """Closes the thread's innermost step; returns it, its peak, the current allocation and its depth."""
+        with self._lock:
+            ident = threading.get_ident()
+            stack = self._stacks[ident]
+            frame = stack.pop()
+            current, peak = tracemalloc.get_traced_memory()
+            peak_abs = max(frame.peak_abs, peak)
+            if stack:
+                stack[-1].peak_abs = max(stack[-1].peak_abs, peak_abs)
+            else:
+                del self._stacks[ident]
+            return frame, peak_abs, current, len(stack)
+
+    @contextmanager
+    def step(self, name: str):
+        """Profiles the enclosed block as one call of ``name``."""
+        if not self.enabled or not tracemalloc.is_tracing():
+            yield
+            return
+        self._push(name)
+        try:
+            yield
+        finally:
+            frame, peak_abs, current, depth = self._pop()
+            record = {
+                'step': name,
+                'peak_bytes': None if frame.concurrent else peak_abs - frame.start_current,
+                'net_bytes': current - frame.start_current,
+                'rss_delta_bytes': current_rss() - frame.start_rss,
+                'depth': depth,
+            }
+            with self._lock:
+                self.records.append(record)
+
+    def summary(self) -> Dict[str, dict]:
+        """Per-step aggregates: calls, max measured peak, total net and RSS growth."""
+        with self._lock:
+            records = list(self.records)
+        steps: Dict[str, dict] = {}
+        for record in records:
+            step = steps.setdefault(record['step'], {
+                'calls': 0, 'max_peak_bytes': 0, 'total_net_bytes': 0, 'total_rss_delta_bytes': 0
+            })
+            step['calls'] += 1
+            if record['peak_bytes'] is not None:
+                step['max_peak_bytes'] = max(step['max_peak_bytes'], record['peak_bytes'])
+            step['total_net_bytes'] += record['net_bytes']
+            step['total_rss_delta_bytes'] += record['rss_delta_bytes']
+        return steps
+
+    def report(self) -> str:
+        """Text table of the steps, largest peak allocation first."""
+        steps = sorted(self.summary().items(), key=lambda item: -item[1]['max_peak_bytes'])
+        width = max([len(name) for name, _ in steps] + [4])
+        lines = [f"{'Step':<{width}}  {'Calls':>5}  {'Peak MB':>10}  {'Net MB':>10}  {'RSS MB':>10}"]
+        for name, step in steps:
+            lines.append(
+                f"{name:<{width}}  {step['calls']:>5}  {step['max_peak_bytes'] / 2**20:>10.2f}  "
+                f"{step['total_net_bytes'] / 2**20:>10.2f}  {step['total_rss_delta_bytes'] / 2**20:>10.2f}"
+            )
+        return '\n'.join(lines)
+
+
+PROFILER = MemoryProfiler()
+
+
+def memory_profile(name: Optional[str] = None):
+    """
+    Decorator recording each call in ``PROFILER`` (a no-op while profiling is disabled).
+
+    The step name defaults to the function's qualified name.
+    """
+    def decorator(func):
+        step_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not PROFILER.enabled:
+                return func(*args, **kwargs)
+            with PROFILER.step(step_name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def enable() -> None:
+    """Turns memory profiling on."""
+    PROFILER.enable()
+
+
+def disable() -> None:
+    """Turns memory profiling off."""
+    PROFILER.disable()
@@ -0,0 +1,73 @@
+"""
+Row Sampling.
+
+Sample sizes for a target confidence level and margin of error, uniform or
+stratified row samples, and Wilson confidence intervals for the proportion of
+sampled rows violating a rule.
+"""
+
+import math
+from statistics import NormalDist
+from typing import Optional, Tuple
+import numpy as np
+import pandas as pd
+
+
+def _z_score(confidence: float) -> float:
+    if not 0 < confidence < 1:
+        raise ValueError(f"confidence must be in (0, 1), got {confidence}")
+    return NormalDist().inv_cdf((1 + confidence) / 2)
+
+
+def sample_size(confidence: float = 0.95, margin: float = 0.01, population: Optional[int] = None) -> int:
+    """
+    Rows needed to estimate a proportion within ``margin`` at ``confidence``.
+
+    Uses the worst case p = 0.5 and, when ``population`` is given, the
+    finite population correction.
+    """
+    if not 0 < margin < 1:
+        raise ValueError(f"margin must be in (0, 1), got {margin}")
+    n = _z_score(confidence) ** 2 * 0.25 / margin ** 2
+    if population is not None:
+        n = n / (1 + (n - 1) / population)
+        return min(population, math.ceil(n))
+    return math.ceil(n)
+
+
+def wilson_interval(successes: int, n: int, confidence: float = 0.95) -> Tuple[float, float]:
+    """Wilson score interval of a proportion observed as ``successes`` out of ``n``."""
+    if n == 0:
+        return 0.0, 1.0
+    z = _z_score(confidence)
+    p = successes / n
+    denominator = 1 + z ** 2 / n
+    center = (p + z ** 2 / (2 * n)) / denominator
+    half_width = z * math.sqrt(p * (1 - p) / n + z ** 2 / (4 * n ** 2)) / denominator
+    return max(0.0, center - half_width), min(1.0, center + half_width)
+
+
+def sample_positions(n_rows: int, size: int, strata: Optional[pd.Series] = None,
+                     random_state: Optional[int] = None) -> np.ndarray:
+    """
+    Sorted positions of a sample of ``size`` rows drawn without replacement.
+
+    With ``strata`` (one label per row) every stratum gets a share of the
+    sample proportional to its size, and at least one row.
+    """
+    rng = np.random.default_rng(random_state)
+    if size >= n_rows:
+        return np.arange(n_rows)
+    if strata is None:
+        return np.sort(rng.choice(n_rows, size=size, replace=False))
+
+    codes, _ = pd.factorize(strata)
+    codes[codes < 0] = codes.max() + 1  # missing labels form their own stratum
+    counts = np.bincount(codes)
+    quotas = np.minimum(counts, np.maximum(1, np.round(counts * size / n_rows).astype('int64')))
+    # Random keys sorted within each stratum: the first quota rows of a stratum form its sample
+    order = np.lexsort((rng.random(n_rows), codes))
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    rank = np.empty(n_rows, dtype='int64')
+    rank[order] = np.arange(n_rows) - np.repeat(starts, counts)
+    return np.flatnonzero(rank < quotas[codes])
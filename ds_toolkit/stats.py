@@ -0,0 +1,109 @@
+"""
+Mergeable Column Statistics.
+
+Accumulators filled chunk by chunk and merged together, used to derive the
+global fill values and IQR bounds of the cleaning steps without holding the
+whole dataset in memory.
+"""
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import is_bool_dtype, is_numeric_dtype
+from typing import Any
+
+
+def is_numeric_column(dtype) -> bool:
+    """True for numeric (non-boolean) dtypes, i.e. columns imputed with the median."""
+    return is_numeric_dtype(dtype) and not is_bool_dtype(dtype)
+
+
+def _lerp(a: float, b: float, t: float) -> float:
+    """Linear interpolation computed exactly like numpy's 'linear' quantile method."""
+    diff = b - a
+    if t >= 0.5:
+        return b - diff * (1 - t)
+    return a + diff * t
+
+
+class ValueCounts:
+    """
+    Exact, mergeable value counts of a single column.
+
+    Memory grows with the number of distinct values, not with the number of rows.
+    Numeric columns are counted as float64 so that integer and float chunks of the
+    same column align.
+    """
+
+    def __init__(self, numeric: bool = True):
+        self.numeric = numeric
+        self.counts = pd.Series(dtype='int64')
+        self.missing = 0
+
+    @property
+    def count(self) -> int:
+        """Number of non-missing values seen."""
+        return int(self.counts.sum())
+
+    def update(self, values: pd.Series) -> 'ValueCounts':
+        """Adds the values of one chunk."""
+        if self.numeric:
+            values = values.astype('float64')
+        self.missing += int(values.isna().sum())
+        self._add(values.value_counts(dropna=True))
+        return self
+
+    def merge(self, other: 'ValueCounts') -> 'ValueCounts':
+        """Merges the counts of another accumulator into this one."""
+        self.missing += other.missing
+        self._add(other.counts)
+        return self
+
+    def add_value(self, value: Any, n: int) -> 'ValueCounts':
+        """Adds ``n`` occurrences of ``value`` (e.g. imputed missing values)."""
+        if n > 0 and not pd.isna(value):
+            self._add(pd.Series([n], index=[value]))
+        return self
+
+    def _add(self, counts: pd.Series) -> None:
+        if len(counts) == 0:
+            return
+        if len(self.counts) == 0:
+            self.counts = counts.astype('int64')
+        else:
+            self.counts = self.counts.add(counts, fill_value=0).astype('int64')
+
+    def _sorted(self):
+        ordered = self.counts.sort_index()
+        return ordered.index.to_numpy(dtype='float64'), np.cumsum(ordered.to_numpy(dtype='int64'))
+
+    def quantile(self, q: float) -> float:
+        """Exact quantile with linear interpolation (same result as ``Series.quantile``)."""
+        if self.count == 0:
+            return np.nan
+        values, cumulative = self._sorted()
+        position = (cumulative[-1] - 1) * q
+        lower = int(np.floor(position))
+        upper = int(np.ceil(position))
+        a = values[np.searchsorted(cumulative, lower, side='right')]
+        b = values[np.searchsorted(cumulative, upper, side='right')]
+        return float(_lerp(a, b, position - lower))
+
+    def median(self) -> float:
+        """Exact median (same result as ``Series.median``)."""
+        if self.count == 0:
+            return np.nan
+        values, cumulative = self._sorted()
+        n = cumulative[-1]
+        a = values[np.searchsorted(cumulative, (n - 1) // 2, side='right')]
+        b = values[np.searchsorted(cumulative, n // 2, side='right')]
+        return float((a + b) / 2.0)
+
+    def mode(self) -> Any:
+        """Most frequent value, smallest one on ties (same result as ``Series.mode()[0]``)."""
+        if self.count == 0:
+            return None
+        top = self.counts.index[self.counts == self.counts.max()]
+        try:
+            return sorted(top)[0]
+        except TypeError:
+            return top[0]
@@ -0,0 +1,253 @@
+"""
+Storage Backends.
+
+Reads and writes DataFrames as CSV, Parquet or Feather (Arrow IPC), picking the
+format from the file extension unless one is given explicitly. The binary
+formats keep dtypes (integers, categories) and support column projection;
+they require the optional ``pyarrow`` dependency.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+from typing import Dict, Iterable, Iterator, List, Optional, Set
+
+FORMATS = {
+    '.csv': 'csv',
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.feather': 'feather',
+    '.arrow': 'feather',
+    '.ipc': 'feather',
+}
+
+DEFAULT_BINARY_FORMAT = 'parquet'
+
+# Dtype pandas gives CSV text columns (``str`` from pandas 3, ``object`` before)
+TEXT_DTYPE = str(pd.Series(['']).dtype)
+
+
+def _require_pyarrow():
+    try:
+        import pyarrow
+    except ImportError as e:
+        raise ImportError("Parquet/Feather support requires pyarrow (pip install pyarrow)") from e
+    return pyarrow
+
+
+def default_save_format() -> str:
+    """``DEFAULT_BINARY_FORMAT`` when pyarrow is installed, else 'csv'."""
+    try:
+        _require_pyarrow()
+    except ImportError:
+        return 'csv'
+    return DEFAULT_BINARY_FORMAT
+
+
+def infer_format(path: str, format: Optional[str] = None, default: str = 'csv') -> str:
+    """Returns the storage format of a path: explicit ``format``, else its extension, else ``default``."""
+    if format is None:
+        format = FORMATS.get(os.path.splitext(path)[1].lower(), default)
+    if format not in set(FORMATS.values()):
+        raise ValueError(f"Unsupported format '{format}', expected one of {sorted(set(FORMATS.values()))}")
+    return format
+
+
+def read_frame(path: str, format: Optional[str] = None, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Reads a whole file, optionally only the given columns."""
+    format = infer_format(path, format)
+    if format == 'csv':
+        return pd.read_csv(path, usecols=columns)
+    _require_pyarrow()
+    if format == 'parquet':
+        return pd.read_parquet(path, columns=columns)
+    return pd.read_feather(path, columns=columns)
+
+
+def common_dtype(dtypes: Iterable[str], empty_dtypes: Iterable[str] = ()) -> Optional[str]:
+    """
+    Dtype pandas gives a whole column from the dtypes of its chunks.
+
+    ``empty_dtypes`` are those of chunks where the column is entirely missing:
+    they do not decide the type, but turn integers into float64 and booleans
+    into object. Returns None when there are no chunks at all.
+    """
+    dtypes, empty_dtypes = set(dtypes), set(empty_dtypes)
+    if not dtypes:
+        return common_dtype(empty_dtypes) if empty_dtypes else None
+    if len(dtypes) == 1:
+        dtype = next(iter(dtypes))
+    else:
+        try:
+            numpy_dtypes = [np.dtype(dtype) for dtype in dtypes]
+        except TypeError:
+            return 'object'
+        if not all(dtype.kind in 'iuf' for dtype in numpy_dtypes):
+            return 'object'
+        dtype = str(np.result_type(*numpy_dtypes))
+    if empty_dtypes and dtype in ('bool', 'int8', 'int16', 'int32', 'int64',
+                                  'uint8', 'uint16', 'uint32', 'uint64'):
+        return 'float64' if dtype != 'bool' else 'object'
+    return dtype
+
+
+def _is_text(values: pd.Series) -> bool:
+    return pd.api.types.infer_dtype(values, skipna=True) == 'string'
+
+
+def _scan_csv(path: str, chunksize: int) -> Dict[str, str]:
+    """Column dtypes of a whole-file ``read_csv``, found chunk by chunk; see ``read_schema``."""
+    header = pd.read_csv(path, nrows=0)
+    dtypes: Dict[str, Set[str]] = {col: set() for col in header.columns}
+    empty: Dict[str, Set[str]] = {col: set() for col in header.columns}
+    text: Set[str] = set()
+    with pd.read_csv(path, chunksize=chunksize) as reader:
+        for chunk in reader:
+            for col in chunk.columns:
+                values = chunk[col]
+                if values.isnull().all():
+                    empty[col].add(str(values.dtype))
+                    continue
+                dtypes[col].add(str(values.dtype))
+                if _is_text(values):
+                    text.add(col)
+    # A column with any text is read as text, numbers included
+    return {col: TEXT_DTYPE if col in text else common_dtype(dtypes[col], empty[col]) or str(header[col].dtype)
+            for col in header.columns}
+
+
+def read_schema(path: str, format: Optional[str] = None, chunksize: int = 100_000) -> pd.DataFrame:
+    """
+    Empty DataFrame with the columns and dtypes of a file.
+
+    Binary formats read the stored schema. CSV dtypes are those of a whole-file
+    ``read_csv``, found by scanning the file ``chunksize`` rows at a time:
+    chunks where a column is entirely missing do not decide its type, and a
+    column mixing numbers and text is text.
+    """
+    format = infer_format(path, format)
+    if format == 'csv':
+        dtypes = _scan_csv(path, chunksize)
+        return pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in dtypes.items()})
+    _require_pyarrow()
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        return pq.read_schema(path).empty_table().to_pandas()
+    import pyarrow.ipc as ipc
+    with ipc.open_file(path) as reader:
+        return reader.schema.empty_table().to_pandas()
+
+
+def write_frame(df: pd.DataFrame, path: str, format: Optional[str] = None, index: bool = False) -> None:
+    """Writes a DataFrame to a file."""
+    format = infer_format(path, format)
+    if format == 'csv':
+        df.to_csv(path, index=index)
+        return
+    _require_pyarrow()
+    if index:
+        df = df.reset_index()
+    if format == 'parquet':
+        df.to_parquet(path, index=False)
+    else:
+        df.reset_index(drop=True).to_feather(path)
+
+
+def _conform(chunk: pd.DataFrame, schema: pd.DataFrame) -> pd.DataFrame:
+    changed = {col: schema[col].dtype for col in chunk.columns
+               if col in schema.columns and chunk[col].dtype != schema[col].dtype}
+    return chunk.astype(changed) if changed else chunk
+
+
+def iter_frames(path: str, chunksize: int, format: Optional[str] = None,
+                columns: Optional[List[str]] = None, schema: Optional[pd.DataFrame] = None) -> Iterator[pd.DataFrame]:
+    """
+    Yields a file as DataFrames of at most ``chunksize`` rows.
+
+    With ``schema`` (from ``read_schema``), every chunk gets the dtypes of
+    the whole file instead of those inferred from its own rows.
+    """
+    format = infer_format(path, format)
+    if format == 'csv' and schema is not None:
+        # Numbers in text columns keep their raw text, as in a whole-file read
+        # (before pandas 3 this also reads booleans with missing values as text)
+        text = {col: str for col in schema.columns if schema[col].dtype == TEXT_DTYPE}
+        with pd.read_csv(path, chunksize=chunksize, usecols=columns, dtype=text) as reader:
+            for chunk in reader:
+                yield _conform(chunk, schema)
+        return
+    if schema is not None:
+        for chunk in iter_frames(path, chunksize, format, columns):
+            yield _conform(chunk, schema)
+        return
+    if format == 'csv':
+        with pd.read_csv(path, chunksize=chunksize, usecols=columns) as reader:
+            yield from reader
+        return
+
+    _require_pyarrow()
+    if format == 'parquet':
+        import pyarrow.parquet as pq
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=columns):
+            yield batch.to_pandas()
+        return
+
+    import pyarrow.ipc as ipc
+    with ipc.open_file(path) as reader:
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i)
+            if columns is not None:
+                batch = batch.select(columns)
+            for start in range(0, batch.num_rows, chunksize):
+                yield batch.slice(start, chunksize).to_pandas()
+
+
+class FrameWriter:
+    """
+    Appends DataFrame chunks to a single output file.
+
+    Use as a context manager; the schema of binary formats is fixed by the
+    first chunk written.
+    """
+
+    def __init__(self, path: str, format: Optional[str] = None):
+        self.path = path
+        self.format = infer_format(path, format)
+        self.rows_written = 0
+        self._started = False
+        self._writer = None
+        self._schema = None
+
+    def __enter__(self) -> 'FrameWriter':
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def write(self, chunk: pd.DataFrame) -> None:
+        """Appends one chunk."""
+        if self.format == 'csv':
+            chunk.to_csv(self.path, index=False, mode='a' if self._started else 'w', header=not self._started)
+        else:
+            self._write_arrow(chunk)
+        self._started = True
+        self.rows_written += len(chunk)
+
+    def _write_arrow(self, chunk: pd.DataFrame) -> None:
+        pa = _require_pyarrow()
+        table = pa.Table.from_pandas(chunk, schema=self._schema, preserve_index=False)
+        if self._writer is None:
+            self._schema = table.schema
+            if self.format == 'parquet':
+                import pyarrow.parquet as pq
+                self._writer = pq.ParquetWriter(self.path, self._schema)
+            else:
+                import pyarrow.ipc as ipc
+                self._writer = ipc.new_file(self.path, self._schema)
+        self._writer.write_table(table)
+
+    def close(self) -> None:
+        """Closes the underlying writer."""
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
@@ -0,0 +1,147 @@
+"""
+Hierarchical Tracing.
+
+Records nested spans (start/end times, row counts, exceptions) in process and
+exports them as Chrome trace-event JSON, viewable in chrome://tracing,
+Perfetto or speedscope. Tracing is off by default.
+"""
+
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, List, Optional
+
+
+class Span:
+    """One timed operation; ``args`` holds attributes such as row counts."""
+
+    __slots__ = ('name', 'start_ns', 'end_ns', 'thread_id', 'depth', 'args', 'error')
+
+    def __init__(self, name: str, depth: int, args: dict):
+        self.name = name
+        self.start_ns = time.perf_counter_ns()
+        self.end_ns: Optional[int] = None
+        self.thread_id = threading.get_ident()
+        self.depth = depth
+        self.args = args
+        self.error: Optional[str] = None
+
+    def set(self, **attributes: Any) -> None:
+        """Adds attributes to the span."""
+        self.args.update(attributes)
+
+    @property
+    def duration_ns(self) -> int:
+        return (self.end_ns or time.perf_counter_ns()) - self.start_ns
+
+
+class _NullSpan:
+    """Span returned while tracing is disabled."""
+
+    def set(self, **attributes: Any) -> None:
+        pass
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class Tracer:
+    """Collects spans; nesting is tracked per thread."""
+
+    def __init__(self):
+        self.enabled = False
+        self.spans: List[Span] = []
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.spans.clear()
+
+    @contextmanager
+    def span(self, name: str, **args: Any):
+        """Records the enclosed block as a span nested in the current one."""
+        if not self.enabled:
+            yield _NULL_SPAN
+            return
+        depth = getattr(self._local, 'depth', 0)
+        span = Span(name, depth, args)
+        self._local.depth = depth + 1
+        try:
+            yield span
+        except BaseException as e:
+            span.error = f"{type(e).__name__}: {e}"
+            raise
+        finally:
+            span.end_ns = time.perf_counter_ns()
+            self._local.depth = depth
+            with self._lock:
+                self.spans.append(span)
+
+    def to_chrome_trace(self) -> dict:
+        """Spans as Chrome trace-event 'complete' events (microseconds)."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s.start_ns)
+        pid = os.getpid()
+        events = []
+        for span in spans:
+            args = dict(span.args)
+            if span.error is not None:
+                args['error'] = span.error
+            events.append({
+                'name': span.name,
+                'ph': 'X',
+                'ts': span.start_ns / 1000,
+                'dur': span.duration_ns / 1000,
+                'pid': pid,
+                'tid': span.thread_id,
+                'args': args,
+            })
+        return {'traceEvents': events, 'displayTimeUnit': 'ms'}
+
+    def export(self, path: str) -> None:
+        """Writes the Chrome trace JSON to ``path``."""
+        with open(path, 'w') as f:
+            json.dump(self.to_chrome_trace(), f, default=str)
+
+
+TRACER = Tracer()
+
+
+def traced(name: Optional[str] = None, rows: Optional[Callable[..., Optional[int]]] = None):
+    """
+    Decorator recording each call as a span.
+
+    ``rows`` receives the call's first argument (``self`` for methods) and
+    returns a row count, recorded before and after the call as ``rows_in`` and
+    ``rows_out``.
+    """
+    def decorator(func):
+        span_name = name or func.__qualname__
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not TRACER.enabled:
+                return func(*args, **kwargs)
+            with TRACER.span(span_name) as span:
+                if rows is not None and args:
+                    span.set(rows_in=rows(args[0]))
+                result = func(*args, **kwargs)
+                if rows is not None and args:
+                    span.set(rows_out=rows(args[0]))
+                return result
+        return wrapper
+    return decorator
+
+
+def enable() -> None:
+    """Turns tracing on."""
+    TRACER.enabled = True
+
+
+def disable() -> None:
+    """Turns tracing off."""
+    TRACER.enabled = False
@@ -5,20 +5,36 @@ Utilities and Decorators (Decorator Pattern).
 import time
 import functools
 import logging
+from .metrics import REGISTRY
 
 # Basic logging configuration if not already configured
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(message)s')
 
 def timing_decorator(func):
-    """Decorator measuring function execution time."""
+    """
+    Decorator measuring function execution time.
+
+    Durations go to the metrics registry (``ds_toolkit.metrics.REGISTRY``) under
+    the function's qualified name and are logged at DEBUG level. When metrics
+    are disabled the function is called directly.
+    """
+    name = f"{func.__module__}.{func.__qualname__}"
+    
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        start_time = time.time()
-        result = func(*args, **kwargs)
-        end_time = time.time()
-        duration = end_time - start_time
-        print(f"[TIMING] {func.__name__} executed in {duration:.4f} seconds")
-        return result
+        if not REGISTRY.enabled:
+            return func(*args, **kwargs)
+        start_time = time.perf_counter_ns()
+        error = False
+        try:
+            return func(*args, **kwargs)
+        except BaseException:
+            error = True
+            raise
+        finally:
+            duration = time.perf_counter_ns() - start_time
+            REGISTRY.observe(name, duration, error)
+            logging.debug("[TIMING] %s executed in %.4f seconds", func.__name__, duration / 1e9)
     return wrapper
 
 def logging_decorator(func):
@@ -1,72 +1,565 @@
 """
 Data Validation Framework.
+
+Rules declare the column statistics they need (null counts, dtypes, min/max,
+distinct values); ``DataValidator`` gathers all of them in one pass over the
+data and evaluates every rule against that shared profile.
+
+Profiles are mergeable, so the same rules also validate files larger than
+memory chunk by chunk (``DataValidator.run_stream``).
 """
 
+import contextlib
+import io
+import os
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import numpy as np
 import pandas as pd
-from typing import List, Dict
+from typing import Any, Dict, Iterable, List, Optional, Set, Union
+from .sampling import sample_positions, sample_size, wilson_interval
+from .stats import is_numeric_column
+from .storage import common_dtype, iter_frames
+
+# Statistics a rule can request for a column
+NULLS, DTYPE, RANGE, DISTINCT = 'nulls', 'dtype', 'range', 'distinct'
+
+Requirements = Dict[str, Set[str]]
+
+EXECUTORS = ('serial', 'threads')
+
+
+@dataclass
+class ColumnProfile:
+    """
+    Statistics of one column; only the requested ones are filled.
+
+    Distinct values are kept as 64-bit hashes in a few disjoint sorted runs,
+    so merging chunk profiles costs O(new values), not O(values seen).
+    """
+    null_count: int = 0
+    dtypes: Set[str] = field(default_factory=set)
+    empty_dtypes: Set[str] = field(default_factory=set)
+    min: Any = None
+    max: Any = None
+    hash_runs: Optional[List[np.ndarray]] = None
+    duplicate_count: int = 0
+
+    @property
+    def dtype(self) -> Optional[str]:
+        """Dtype of the whole column, ignoring chunks where it was entirely missing."""
+        return common_dtype(self.dtypes, self.empty_dtypes)
+
+    @property
+    def distinct_count(self) -> Optional[int]:
+        return None if self.hash_runs is None else sum(len(run) for run in self.hash_runs)
+
+    def merge(self, other: 'ColumnProfile') -> 'ColumnProfile':
+        """Adds the statistics of ``other`` (the same column, other rows)."""
+        self.null_count += other.null_count
+        self.dtypes |= other.dtypes
+        self.empty_dtypes |= other.empty_dtypes
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        if other.hash_runs is not None:
+            if self.hash_runs is None:
+                self.hash_runs = []
+            self.duplicate_count += other.duplicate_count
+            for run in other.hash_runs:
+                self._add_hashes(run)
+        return self
+
+    def _add_hashes(self, hashes: np.ndarray) -> None:
+        """Records sorted unique ``hashes``, counting those already seen as duplicates."""
+        new = np.ones(len(hashes), dtype=bool)
+        for run in self.hash_runs:
+            positions = np.minimum(np.searchsorted(run, hashes), len(run) - 1)
+            new &= run[positions] != hashes
+        self.duplicate_count += int(len(hashes) - new.sum())
+        if not new.all():
+            hashes = hashes[new]
+        if len(hashes) == 0:
+            return
+        self.hash_runs.append(hashes)
+        while len(self.hash_runs) > 1 and len(self.hash_runs[-2]) <= 2 * len(self.hash_runs[-1]):
+            last = self.hash_runs.pop()
+            self.hash_runs[-1] = np.sort(np.concatenate([self.hash_runs[-1], last]))
+
+
+@dataclass
+class FrameProfile:
+    """Row count and per-column statistics of a DataFrame."""
+    rows: int = 0
+    columns: Dict[str, ColumnProfile] = field(default_factory=dict)
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, requirements: Requirements) -> 'FrameProfile':
+        """Computes every requested statistic with one vectorized reduction per statistic kind."""
+        present = [col for col in requirements if col in df.columns]
+        profile = cls(rows=len(df), columns={col: ColumnProfile() for col in present})
+
+        def wanting(*kinds):
+            return [col for col in present if requirements[col].intersection(kinds)]
+
+        null_cols = wanting(NULLS, DTYPE)
+        if null_cols:
+            for col, n in df[null_cols].isnull().sum().items():
+                profile.columns[col].null_count = int(n)
+
+        for col in wanting(DTYPE):
+            stats = profile.columns[col]
+            if len(df) and stats.null_count == len(df):
+                stats.empty_dtypes.add(str(df[col].dtype))
+            else:
+                stats.dtypes.add(str(df[col].dtype))
+
+        range_cols = wanting(RANGE)
+        if range_cols:
+            frame = df[range_cols]
+            for (col, low), high in zip(frame.min().items(), frame.max()):
+                if not pd.isna(low):
+                    profile.columns[col].min = low
+                    profile.columns[col].max = high
+
+        for col in wanting(DISTINCT):
+            values = df[col].dropna()
+            if is_numeric_column(values.dtype):
+                # Same hash for 1 and 1.0, whatever dtype a chunk was read with
+                values = values.astype('float64')
+            hashes = np.sort(pd.util.hash_array(values.to_numpy()))
+            # Sort-based dedup: np.unique goes through a slower hash table for uint64
+            unique = hashes[np.concatenate(([True], hashes[1:] != hashes[:-1]))] if len(hashes) else hashes
+            profile.columns[col].hash_runs = [unique] if len(unique) else []
+            profile.columns[col].duplicate_count = len(hashes) - len(unique)
+        return profile
+
+    @classmethod
+    def from_schema(cls, df: pd.DataFrame, requirements: Requirements) -> 'FrameProfile':
+        """Profile holding only the dtypes, read from metadata without touching any row."""
+        present = [col for col in requirements if col in df.columns]
+        return cls(rows=len(df), columns={col: ColumnProfile(dtypes={str(df[col].dtype)}) for col in present})
+
+    def merge(self, other: 'FrameProfile', columns: Optional[Iterable[str]] = None) -> 'FrameProfile':
+        """Adds the statistics of ``other`` (other rows), restricted to ``columns`` if given."""
+        self.rows += other.rows
+        for col in (other.columns if columns is None else columns):
+            if col in other.columns:
+                self.columns.setdefault(col, ColumnProfile()).merge(other.columns[col])
+        return self
+
+
+@dataclass
+class RuleResult:
+    """Outcome of one rule."""
+    rule: str
+    passed: bool
+    messages: List[str] = field(default_factory=list)
+    details: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class ValidationReport:
+    """Outcome of all rules, in registration order."""
+    results: List[RuleResult]
+    rows: int
+    complete: bool = True
+    sampled_rows: Optional[int] = None
+    escalated: bool = False
+
+    @property
+    def passed(self) -> bool:
+        return all(result.passed for result in self.results)
+
+    @property
+    def failures(self) -> List[RuleResult]:
+        return [result for result in self.results if not result.passed]
+
+    def summary(self) -> str:
+        lines = []
+        for result in self.results:
+            if result.passed:
+                lines.append(f"Rule '{result.rule}' passed")
+            else:
+                lines.extend(result.messages or [f"Rule '{result.rule}' failed"])
+        if not self.complete:
+            lines.append(f"Stopped early after {self.rows} rows")
+        if self.sampled_rows is not None:
+            lines.append(f"Validated a sample of {self.sampled_rows} of {self.rows} rows")
+        if self.escalated:
+            lines.append("Sample looked suspicious: validated every row")
+        return '\n'.join(lines)
+
+
+def _merge_requirements(target: Requirements, extra: Requirements) -> None:
+    for col, kinds in extra.items():
+        target.setdefault(col, set()).update(kinds)
+
 
 class ValidationRule(ABC):
-    """Abstract class defining a validation rule."""
-    
+    """
+    Abstract class defining a validation rule.
+
+    Rules implementing only ``validate(df)`` are called by the validator on
+    the whole frame (or on every chunk when streaming); ``ProfileRule``
+    subclasses are checked against the shared profile instead.
+    """
+
     def __init__(self, name: str):
         self.name = name
-        
+
+    def requirements(self, columns: Iterable[str]) -> Optional[Requirements]:
+        """Statistics needed per column, or None for a rule that scans the frame itself."""
+        return None
+
+    def row_violations(self, df: pd.DataFrame) -> Optional[pd.Series]:
+        """Boolean mask of the rows breaking the rule, or None if the rule is not row-wise."""
+        return None
+
     @abstractmethod
     def validate(self, df: pd.DataFrame) -> bool:
         pass
 
 
-class NoMissingValuesRule(ValidationRule):
+class ProfileRule(ValidationRule):
+    """
+    Rule checked against a ``FrameProfile``: implements ``requirements`` and ``evaluate``.
+
+    Streaming validation goes through ``initial_state`` / ``accumulate`` /
+    ``merge`` / ``finalize``; by default the state is the rule's own merged
+    ``FrameProfile``, so profile-based rules get it for free. ``monotonic``
+    rules cannot pass again once they failed on part of the data, which lets
+    fail-fast validation stop early.
+    """
+
+    monotonic = True
+
+    @abstractmethod
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        """Statistics needed per column."""
+
+    @abstractmethod
+    def evaluate(self, profile: FrameProfile) -> RuleResult:
+        """Checks the rule against the shared profile."""
+
+    def initial_state(self) -> Any:
+        """State before any chunk was seen."""
+        return FrameProfile()
+
+    def accumulate(self, state: Any, chunk: pd.DataFrame, profile: FrameProfile) -> Any:
+        """Folds one chunk (and its shared profile) into the state."""
+        return state.merge(profile, self.requirements(chunk.columns))
+
+    def merge(self, state: Any, other: Any) -> Any:
+        """Combines the states of two disjoint parts of the data."""
+        return state.merge(other)
+
+    def finalize(self, state: Any) -> RuleResult:
+        """Result of the rule on all the data folded into the state."""
+        return self.evaluate(state)
+
+    def definitely_failed(self, state: Any) -> bool:
+        """True when no further data can make the rule pass."""
+        return self.monotonic and not self.finalize(state).passed
+
+    def validate(self, df: pd.DataFrame) -> bool:
+        """Checks the rule on a DataFrame and prints the outcome."""
+        result = self.evaluate(FrameProfile.from_frame(df, self.requirements(df.columns)))
+        print(ValidationReport([result], len(df)).summary())
+        return result.passed
+
+
+def _missing_columns(rule: ProfileRule, columns: Iterable[str], profile: FrameProfile) -> List[str]:
+    return [f"Rule '{rule.name}' failed: column '{col}' not found" for col in columns if col not in profile.columns]
+
+
+class NoMissingValuesRule(ProfileRule):
     """Checks for absence of missing values."""
-    
+
     def __init__(self, columns: List[str] = None):
         super().__init__("No Missing Values")
         self.columns = columns
-        
-    def validate(self, df: pd.DataFrame) -> bool:
-        cols = self.columns if self.columns else df.columns
-        missing = df[cols].isnull().sum().sum()
+
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        return {col: {NULLS} for col in (self.columns or columns)}
+
+    def evaluate(self, profile: FrameProfile) -> RuleResult:
+        cols = self.columns or list(profile.columns)
+        messages = _missing_columns(self, cols, profile)
+        missing = sum(profile.columns[col].null_count for col in cols if col in profile.columns)
         if missing > 0:
-            print(f"Rule '{self.name}' failed: {missing} missing values")
-            return False
-        print(f"Rule '{self.name}' passed")
-        return True
+            messages.append(f"Rule '{self.name}' failed: {missing} missing values")
+        return RuleResult(self.name, not messages, messages, {'missing': missing})
+
+    def row_violations(self, df: pd.DataFrame) -> pd.Series:
+        cols = [col for col in (self.columns or df.columns) if col in df.columns]
+        return df[cols].isnull().any(axis=1)
 
 
-class DataTypeRule(ValidationRule):
+class DataTypeRule(ProfileRule):
     """Checks data types."""
-    
+
+    # A later chunk can promote an integer column to the expected float dtype
+    monotonic = False
+
     def __init__(self, expected_types: Dict[str, str]):
         super().__init__("Data Types Check")
         self.expected_types = expected_types
-        
-    def validate(self, df: pd.DataFrame) -> bool:
-        passed = True
+
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        return {col: {DTYPE} for col in self.expected_types}
+
+    def evaluate(self, profile: FrameProfile) -> RuleResult:
+        messages = _missing_columns(self, self.expected_types, profile)
         for col, dtype in self.expected_types.items():
-            if str(df[col].dtype) != dtype:
-                print(f"Rule '{self.name}' failed for {col}: expected {dtype}, got {df[col].dtype}")
-                passed = False
-        if passed:
-            print(f"Rule '{self.name}' passed")
-        return passed
+            if col not in profile.columns:
+                continue
+            found = profile.columns[col].dtype
+            if found != dtype:
+                messages.append(f"Rule '{self.name}' failed for {col}: expected {dtype}, got {found}")
+        return RuleResult(self.name, not messages, messages)
+
+
+class RangeRule(ProfileRule):
+    """Checks that the non-missing values of a column lie within [min_value, max_value]."""
+
+    def __init__(self, column: str, min_value: Any = None, max_value: Any = None):
+        super().__init__(f"Range Check ({column})")
+        self.column = column
+        self.min_value = min_value
+        self.max_value = max_value
+
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        return {self.column: {RANGE}}
+
+    def evaluate(self, profile: FrameProfile) -> RuleResult:
+        messages = _missing_columns(self, [self.column], profile)
+        stats = profile.columns.get(self.column)
+        if stats is not None and stats.min is not None:
+            if self.min_value is not None and stats.min < self.min_value:
+                messages.append(f"Rule '{self.name}' failed: minimum {stats.min} < {self.min_value}")
+            if self.max_value is not None and stats.max > self.max_value:
+                messages.append(f"Rule '{self.name}' failed: maximum {stats.max} > {self.max_value}")
+        details = {} if stats is None else {'min': stats.min, 'max': stats.max}
+        return RuleResult(self.name, not messages, messages, details)
+
+    def row_violations(self, df: pd.DataFrame) -> pd.Series:
+        violations = pd.Series(False, index=df.index)
+        if self.column not in df.columns:
+            return violations
+        values = df[self.column]
+        if self.min_value is not None:
+            violations |= (values < self.min_value).fillna(False).astype(bool)
+        if self.max_value is not None:
+            violations |= (values > self.max_value).fillna(False).astype(bool)
+        return violations
+
+
+class UniqueValuesRule(ProfileRule):
+    """Checks that the non-missing values of each column are unique."""
+
+    def __init__(self, columns: List[str]):
+        super().__init__("Unique Values")
+        self.columns = columns
+
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        return {col: {DISTINCT} for col in self.columns}
+
+    def evaluate(self, profile: FrameProfile) -> RuleResult:
+        messages = _missing_columns(self, self.columns, profile)
+        duplicates = {}
+        for col in self.columns:
+            if col in profile.columns and profile.columns[col].duplicate_count > 0:
+                duplicates[col] = profile.columns[col].duplicate_count
+                messages.append(f"Rule '{self.name}' failed for {col}: {duplicates[col]} duplicate values")
+        return RuleResult(self.name, not messages, messages, {'duplicates': duplicates})
 
 
 class DataValidator:
-    """Validator orchestrating rules execution."""
-    
-    def __init__(self):
+    """
+    Validator orchestrating rules execution.
+
+    ``run`` profiles the data once for all rules and returns a
+    ``ValidationReport``; ``validate`` prints that report and returns whether
+    every rule passed. ``run_stream`` / ``validate_stream`` do the same for a
+    file or an iterable of chunks, in memory bounded by the chunk size.
+
+    With ``executor='threads'`` the profile is computed by column groups on a
+    thread pool (numpy reductions and hashing release the GIL) while legacy
+    rules run; results are still reported in registration order.
+    """
+
+    def __init__(self, executor: str = 'serial', n_workers: Optional[int] = None):
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}', expected one of {EXECUTORS}")
         self.rules = []
-        
+        self.executor = executor
+        self.n_workers = n_workers
+
     def add_rule(self, rule: ValidationRule):
         self.rules.append(rule)
-        
+
+    def requirements(self, columns: Iterable[str]) -> Requirements:
+        """Union of the statistics needed by the profile-based rules."""
+        requirements: Requirements = {}
+        for rule in self.rules:
+            needed = rule.requirements(columns)
+            if needed is not None:
+                _merge_requirements(requirements, needed)
+        return requirements
+
+    @contextlib.contextmanager
+    def _pool(self):
+        """Thread pool of the validator, or None when running serially."""
+        if self.executor == 'serial':
+            yield None
+            return
+        with ThreadPoolExecutor(max_workers=self.n_workers) as pool:
+            yield pool
+
+    def _submit_profile(self, pool: Optional[ThreadPoolExecutor], df: pd.DataFrame, requirements: Requirements):
+        """Starts profiling ``df``; returns a callable waiting for the profile."""
+        columns = list(requirements)
+        if pool is None or len(columns) < 2:
+            profile = FrameProfile.from_frame(df, requirements)
+            return lambda: profile
+        n_groups = min(len(columns), self.n_workers or os.cpu_count() or 1)
+        futures = [
+            pool.submit(FrameProfile.from_frame, df, {col: requirements[col] for col in columns[i::n_groups]})
+            for i in range(n_groups)
+        ]
+
+        def gather() -> FrameProfile:
+            profile = FrameProfile(rows=len(df))
+            parts = {}
+            for future in futures:
+                parts.update(future.result().columns)
+            # Same column order as a serial profile
+            profile.columns = {col: parts[col] for col in columns if col in parts}
+            return profile
+        return gather
+
+    def run(self, df: pd.DataFrame) -> ValidationReport:
+        """Evaluates every rule against one shared profile of ``df``."""
+        with self._pool() as pool:
+            profile = self._submit_profile(pool, df, self.requirements(df.columns))
+            legacy = {
+                i: RuleResult(rule.name, bool(rule.validate(df)), details={'legacy': True})
+                for i, rule in enumerate(self.rules) if rule.requirements(df.columns) is None
+            }
+            profile = profile()
+        results = [legacy[i] if i in legacy else rule.evaluate(profile) for i, rule in enumerate(self.rules)]
+        return ValidationReport(results, len(df))
+
     def validate(self, df: pd.DataFrame) -> bool:
         print("\n--- Starting Validation ---")
-        all_passed = True
-        for rule in self.rules:
-            if not rule.validate(df):
-                all_passed = False
-        
+        report = self.run(df)
+        # Legacy rules print their own outcome from validate()
+        profiled = [result for result in report.results if not result.details.get('legacy')]
+        if profiled:
+            print(ValidationReport(profiled, report.rows).summary())
+        print("--- Validation Finished ---")
+        return report.passed
+
+    def run_stream(self, source: Union[str, Iterable[pd.DataFrame]], chunksize: int = 100_000,
+                   format: Optional[str] = None, fail_fast: bool = False) -> ValidationReport:
+        """
+        Validates a file (read ``chunksize`` rows at a time) or an iterable of DataFrames.
+
+        Each chunk is profiled once and folded into every rule's state. With
+        ``fail_fast`` reading stops as soon as a rule has definitely failed;
+        the report is then marked incomplete. Legacy rules are checked on
+        every chunk and pass only if they pass on all of them.
+        """
+        chunks = iter_frames(source, chunksize, format=format) if isinstance(source, str) else source
+        legacy = [rule.requirements([]) is None for rule in self.rules]
+        states = [True if is_legacy else rule.initial_state() for rule, is_legacy in zip(self.rules, legacy)]
+        rows = 0
+        complete = True
+        with self._pool() as pool:
+            for chunk in chunks:
+                rows += len(chunk)
+                profile = self._submit_profile(pool, chunk, self.requirements(chunk.columns))
+                failed = False
+                for i, rule in enumerate(self.rules):
+                    if legacy[i]:
+                        with contextlib.redirect_stdout(io.StringIO()):
+                            states[i] = states[i] and bool(rule.validate(chunk))
+                        failed = failed or not states[i]
+                profile = profile()
+                for i, rule in enumerate(self.rules):
+                    if not legacy[i]:
+                        states[i] = rule.accumulate(states[i], chunk, profile)
+                        failed = failed or (fail_fast and rule.definitely_failed(states[i]))
+                if fail_fast and failed:
+                    complete = False
+                    break
+
+        results = [
+            RuleResult(rule.name, state, details={'legacy': True}) if is_legacy else rule.finalize(state)
+            for rule, state, is_legacy in zip(self.rules, states, legacy)
+        ]
+        return ValidationReport(results, rows, complete)
+
+    def validate_stream(self, source: Union[str, Iterable[pd.DataFrame]], chunksize: int = 100_000,
+                        format: Optional[str] = None, fail_fast: bool = False) -> bool:
+        print("\n--- Starting Streaming Validation ---")
+        report = self.run_stream(source, chunksize, format=format, fail_fast=fail_fast)
+        print(report.summary())
         print("--- Validation Finished ---")
-        return all_passed
+        return report.passed
+
+    def run_sampled(self, df: pd.DataFrame, confidence: float = 0.95, margin: float = 0.01,
+                    stratify: Optional[str] = None, escalate: bool = True,
+                    random_state: Optional[int] = None) -> ValidationReport:
+        """
+        Validates a random sample of ``df`` sized for ``confidence`` and ``margin``.
+
+        Row-wise rules report the estimated share of violating rows with its
+        Wilson confidence interval; rules needing only dtypes check the full
+        schema from metadata. Any violation found in the sample is real, and
+        marks the batch as suspicious: with ``escalate`` it is then
+        validated in full. ``stratify`` names a column whose groups are
+        sampled proportionally.
+        """
+        size = sample_size(confidence, margin, population=len(df))
+        if size >= len(df):
+            return self.run(df)
+        positions = sample_positions(len(df), size, df[stratify] if stratify else None, random_state)
+        sample = df.iloc[positions]
+
+        def metadata_only(rule):
+            needed = rule.requirements(df.columns)
+            return needed is not None and all(kinds <= {DTYPE} for kinds in needed.values())
+
+        metadata_rules = [rule for rule in self.rules if metadata_only(rule)]
+        schema = FrameProfile.from_schema(df, self.requirements(df.columns)) if metadata_rules else None
+        sample_report = self.run(sample) if len(metadata_rules) < len(self.rules) else None
+
+        results = []
+        for i, rule in enumerate(self.rules):
+            if schema is not None and metadata_only(rule):
+                results.append(rule.evaluate(schema))
+                continue
+            result = sample_report.results[i]
+            violations = rule.row_violations(sample)
+            if violations is not None:
+                count = int(violations.sum())
+                low, high = wilson_interval(count, len(sample), confidence)
+                result.details.update(
+                    violations=count, violation_rate=count / len(sample), interval=(low, high)
+                )
+                if count:
+                    result.messages.append(
+                        f"Rule '{rule.name}': estimated {count / len(sample):.2%} of rows in violation "
+                        f"({confidence:.0%} CI {low:.2%} - {high:.2%})"
+                    )
+            results.append(result)
+
+        report = ValidationReport(results, len(df), sampled_rows=len(sample))
+        if escalate and not report.passed:
+            full = self.run(df)
+            full.escalated = True
+            return full
+        return report
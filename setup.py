@@ -12,4 +12,7 @@ setup(
         "numpy>=1.21.0",
         "scikit-learn>=1.0.0",
     ],
+    extras_require={
+        "parquet": ["pyarrow>=6.0.0"],
+    },
 )
@@ -0,0 +1,131 @@
+import asyncio
+import os
+from concurrent.futures import ProcessPoolExecutor
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit.aio import StageEvent, iter_stages, notify
+from ds_toolkit.facade import DataSciencePackage
+
+class TestStages(unittest.TestCase):
+
+    def test_events_and_failure(self):
+        calls = []
+
+        def fail():
+            raise RuntimeError("boom")
+
+        async def collect():
+            events = []
+            with self.assertRaises(RuntimeError):
+                async for event in iter_stages([('a', lambda: calls.append('a')), ('b', fail), ('c', lambda: calls.append('c'))]):
+                    events.append(event)
+            return events
+
+        events = asyncio.run(collect())
+        self.assertEqual([(e.stage, e.status) for e in events],
+                         [('a', 'started'), ('a', 'finished'), ('b', 'started'), ('b', 'failed')])
+        self.assertEqual(events[-1].error, 'RuntimeError: boom')
+        self.assertEqual(calls, ['a'])
+
+    def test_rejects_process_executor(self):
+        calls = []
+
+        async def collect():
+            with ProcessPoolExecutor(max_workers=1) as pool:
+                async for _ in iter_stages([('a', lambda: calls.append('a'))], pool):
+                    pass
+
+        with self.assertRaises(TypeError):
+            asyncio.run(collect())
+        self.assertEqual(calls, [])
+
+    def test_notify_accepts_plain_and_async_callbacks(self):
+        received = []
+
+        async def async_callback(event):
+            received.append(('async', event.stage))
+
+        async def main():
+            await notify(lambda event: received.append(('plain', event.stage)), StageEvent('x', 'started'))
+            await notify(async_callback, StageEvent('y', 'started'))
+            await notify(None, StageEvent('z', 'started'))
+
+        asyncio.run(main())
+        self.assertEqual(received, [('plain', 'x'), ('async', 'y')])
+
+class TestAsyncWorkflow(unittest.TestCase):
+
+    def setUp(self):
+        self.filename = "test_aio_data.csv"
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame(rng.rand(40, 3), columns=['f1', 'f2', 'f3'])
+        df['target'] = rng.choice([0, 1], 40)
+        df.to_csv(self.filename, index=False)
+
+    def tearDown(self):
+        if os.path.exists(self.filename):
+            os.remove(self.filename)
+
+    def test_run_full_workflow_async(self):
+        events = []
+
+        async def progress(event):
+            events.append((event.stage, event.status))
+
+        pkg = DataSciencePackage(self.filename, 'target')
+        asyncio.run(pkg.run_full_workflow_async(progress=progress))
+        stages = ['DataSciencePackage.cleaning', 'MLPipeline.load', 'MLPipeline.split',
+                  'MLPipeline.scale', 'MLPipeline.train', 'MLPipeline.evaluate']
+        self.assertEqual(events, [(stage, status) for stage in stages for status in ('started', 'finished')])
+        self.assertIn('precision', pkg.pipeline.report)
+        self.assertEqual(set(pkg.timings), {'cleaning', 'pipeline'})
+
+    def test_cleaning_error(self):
+        pkg = DataSciencePackage("missing_file.csv", 'target')
+        asyncio.run(pkg.run_full_workflow_async())
+        self.assertIsNone(pkg.pipeline)
+        with self.assertRaises(FileNotFoundError):
+            asyncio.run(pkg.run_full_workflow_async(raise_errors=True))
+
+    def test_cancel_between_stages(self):
+        pkg = DataSciencePackage(self.filename, 'target')
+        events = []
+
+        async def main():
+            def progress(event):
+                events.append((event.stage, event.status))
+                if event.stage == 'MLPipeline.split' and event.status == 'finished':
+                    task.cancel()
+
+            task = asyncio.ensure_future(pkg.run_full_workflow_async(progress=progress))
+            with self.assertRaises(asyncio.CancelledError):
+                await task
+
+        asyncio.run(main())
+        self.assertEqual(events[-1], ('MLPipeline.split', 'finished'))
+        self.assertIsNone(pkg.pipeline.report)
+        self.assertFalse(hasattr(pkg.pipeline.model_handler.model, 'estimators_'))
+
+    def test_pipeline_iter_async(self):
+        pkg = DataSciencePackage(self.filename, 'target')
+        pkg.cleaner.load_data()
+        pipeline = pkg._make_pipeline()
+
+        async def main():
+            return [event.status async for event in pipeline.iter_async()]
+
+        self.assertEqual(asyncio.run(main()), ['started', 'finished'] * 5)
+        self.assertIsNotNone(pipeline.report)
+
+    def test_workflow_rejects_process_executor(self):
+        pkg = DataSciencePackage(self.filename, 'target')
+        with ProcessPoolExecutor(max_workers=1) as pool:
+            with self.assertRaises(TypeError):
+                asyncio.run(pkg.run_full_workflow_async(executor=pool))
+            with self.assertRaises(TypeError):
+                pkg._make_pipeline().iter_async(pool)
+        self.assertIsNone(pkg.cleaner.df)
+
+if __name__ == '__main__':
+    unittest.main()
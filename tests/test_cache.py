@@ -0,0 +1,67 @@
+import unittest
+import shutil
+import tempfile
+import pandas as pd
+import numpy as np
+from ds_toolkit.cache import StepCache, hash_frame
+from ds_toolkit.pipeline import MLPipeline, DataLoader, DataSplitter, Scaler, ModelHandler
+
+class TestStepCache(unittest.TestCase):
+    
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(40, 3), columns=['f1', 'f2', 'f3'])
+        self.df['target'] = (self.df['f1'] > 0.5).astype(int)
+
+    def tearDown(self):
+        shutil.rmtree(self.directory, ignore_errors=True)
+
+    def _pipeline(self, cache, n_estimators=10):
+        return MLPipeline(
+            DataLoader(self.df, 'target'), DataSplitter(), Scaler(),
+            ModelHandler(n_estimators=n_estimators), cache=cache
+        )
+
+    def test_hash_frame_detects_changes(self):
+        changed = self.df.copy()
+        changed.loc[0, 'f1'] = 2.0
+        self.assertEqual(hash_frame(self.df), hash_frame(self.df.copy()))
+        self.assertNotEqual(hash_frame(self.df), hash_frame(changed))
+
+    def test_rerun_hits_every_stage(self):
+        cache = StepCache(self.directory)
+        first = self._pipeline(cache)
+        report = first.run()
+        self.assertEqual((cache.hits, cache.misses), (0, 3))
+
+        second = self._pipeline(cache)
+        self.assertEqual(second.run(), report)
+        self.assertEqual((cache.hits, cache.misses), (3, 3))
+
+    def test_changed_model_params_retrain_only(self):
+        cache = StepCache(self.directory)
+        self._pipeline(cache).run()
+        self._pipeline(cache, n_estimators=5).run()
+        self.assertEqual((cache.hits, cache.misses), (2, 4))
+
+    def test_same_split_without_cache(self):
+        X, y = DataLoader(self.df, 'target').load()
+        splitter = DataSplitter()
+        train_idx, test_idx = splitter.split_indices(len(X))
+        X_train, X_test, _, _ = splitter.split(X, y)
+        pd.testing.assert_frame_equal(X.iloc[train_idx], X_train)
+        pd.testing.assert_frame_equal(X.iloc[test_idx], X_test)
+
+    def test_lru_eviction(self):
+        cache = StepCache(self.directory, max_entries=2)
+        cache.put('a', 1)
+        cache.put('b', 2)
+        cache.get('a')
+        cache.put('c', 3)
+        self.assertEqual(cache.stats()['entries'], 2)
+        self.assertFalse(cache.get('b')[0])
+        self.assertEqual(cache.get('a'), (True, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -3,6 +3,7 @@ import pandas as pd
 import numpy as np
 import os
 from ds_toolkit.cleaning import DataCleaner
+from ds_toolkit.dedup import RowHashIndex
 
 class TestDataCleaner(unittest.TestCase):
     
@@ -27,6 +28,21 @@ class TestDataCleaner(unittest.TestCase):
         self.assertIsNotNone(self.cleaner.df)
         self.assertEqual(len(self.cleaner.df), 5)
 
+    def test_load_data_optimize_memory(self):
+        cleaner = DataCleaner(self.filename)
+        cleaner.load_data(optimize_memory=True)
+        self.assertEqual(str(cleaner.df['A'].dtype), 'int8')
+        self.assertEqual(str(cleaner.df['C'].dtype), 'float32')
+        self.assertEqual(str(cleaner.df['cat'].dtype), 'category')
+        self.assertLess(cleaner.memory_report.bytes_after, cleaner.memory_report.bytes_before)
+
+        cleaner.df.loc[0, 'cat'] = None
+        cleaner.handle_missing_values()
+        self.assertEqual(cleaner.df['C'].iloc[0], 1.0)
+        self.assertEqual(cleaner.df['cat'].iloc[0], 'x')
+        cleaner.encode_categorical('cat', method='label')
+        self.assertTrue(np.issubdtype(cleaner.df['cat_Encoded'].dtype, np.integer))
+
     def test_remove_duplicates(self):
         # Row 1 and 2 are almost same but A is different (2 vs 2).
         # Let's add a real duplicate
@@ -36,12 +52,47 @@ class TestDataCleaner(unittest.TestCase):
         cleaner.remove_duplicates()
         self.assertEqual(len(cleaner.df), 1)
 
+    def test_remove_duplicates_across_batches(self):
+        index = RowHashIndex()
+        first, second = DataCleaner(), DataCleaner()
+        first.df = pd.DataFrame({'A': [1, 1, 2], 'B': [2, 2, 3]})
+        second.df = pd.DataFrame({'A': [2, 5], 'B': [3, 6]})
+        first.remove_duplicates(index=index)
+        second.remove_duplicates(index=index)
+        self.assertEqual(len(first.df), 2)
+        self.assertEqual(second.df['A'].tolist(), [5])
+
+    def test_remove_duplicates_subset(self):
+        cleaner = DataCleaner()
+        cleaner.df = pd.DataFrame({'A': [1, 1], 'B': [2, 3]})
+        cleaner.remove_duplicates(subset=['A'])
+        self.assertEqual(len(cleaner.df), 1)
+
+    def test_remove_duplicates_subset_must_match_index(self):
+        cleaner = DataCleaner()
+        cleaner.df = pd.DataFrame({'A': [1, 1], 'B': [2, 3]})
+        with self.assertRaises(ValueError):
+            cleaner.remove_duplicates(subset=['A'], index=RowHashIndex())
+        cleaner.remove_duplicates(subset=['A'], index=RowHashIndex(subset=['A']))
+        self.assertEqual(len(cleaner.df), 1)
+
     def test_handle_missing_values(self):
         self.cleaner.handle_missing_values()
         self.assertEqual(self.cleaner.df['C'].isnull().sum(), 0)
         # Median of [1, 1, 1, 1] is 1.0
         self.assertEqual(self.cleaner.df['C'].iloc[0], 1.0)
 
+    def test_imputer_reused_on_new_data(self):
+        self.cleaner.df.loc[1, 'cat'] = None
+        self.cleaner.handle_missing_values()
+        self.assertEqual(self.cleaner.imputer.fill_values, {'C': 1.0, 'cat': 'x'})
+
+        new = DataCleaner()
+        new.df = pd.DataFrame({'C': [None, 5.0], 'cat': [None, 'y']})
+        new.handle_missing_values(imputer=self.cleaner.imputer)
+        self.assertEqual(list(new.df['C']), [1.0, 5.0])
+        self.assertEqual(list(new.df['cat']), ['x', 'y'])
+
     def test_remove_outliers_iqr(self):
         # A: 1, 2, 2, 4, 100.
         # Q1=2, Q3=4. IQR=2. Upper=4+3=7. 100 should be removed.
@@ -56,13 +107,145 @@ class TestDataCleaner(unittest.TestCase):
         self.assertFalse(100 in self.cleaner.df['A'].values)
         self.assertTrue(4 in self.cleaner.df['A'].values)
 
+    def test_remove_outliers_iqr_combined_bounds(self):
+        df = pd.DataFrame({
+            'A': [1, 2, 3, 4, 5, 6, 7, 100],
+            'B': [10, 11, 12, 13, 14, 15, 16, 17]
+        })
+        cleaner = DataCleaner()
+        cleaner.df = df.copy()
+        cleaner.remove_outliers_iqr()
+        self.assertEqual(len(cleaner.df), 7)
+        self.assertNotIn(100, cleaner.df['A'].values)
+
+        # Sequential mode recomputes B's bounds on the rows left by A's filter
+        sequential = DataCleaner()
+        sequential.df = df.copy()
+        sequential.remove_outliers_iqr(sequential=True)
+        self.assertEqual(len(sequential.df), 7)
+
+    def test_remove_outliers_iqr_sequential_differs(self):
+        # Over all rows B's upper bound is 16.375; once A's outlier row is gone it is 14.25
+        df = pd.DataFrame({
+            'A': [1, 2, 3, 4, 5, 6, 7, 100],
+            'B': [10, 10, 11, 11, 12, 12, 16, 30]
+        })
+        joint, sequential = DataCleaner(), DataCleaner()
+        joint.df, sequential.df = df.copy(), df.copy()
+        joint.remove_outliers_iqr()
+        sequential.remove_outliers_iqr(sequential=True)
+        self.assertIn(16, joint.df['B'].values)
+        self.assertNotIn(16, sequential.df['B'].values)
+        self.assertEqual(list(sequential.df.index), list(range(6)))
+
     def test_encode_categorical(self):
         self.cleaner.encode_categorical('cat', method='label')
         self.assertIn('cat_Encoded', self.cleaner.df.columns)
+
+    def test_encode_categorical_many_columns_onehot(self):
+        self.cleaner.df['cat2'] = ['a', 'b', 'a', 'b', 'c']
+        self.cleaner.encode_categorical(['cat', 'cat2'], method='onehot')
+        for name in ('cat_x', 'cat_y', 'cat2_a', 'cat2_b', 'cat2_c'):
+            self.assertIn(name, self.cleaner.df.columns)
+        self.assertIs(self.cleaner.encoders['cat'], self.cleaner.encoders['cat2'])
+
+    def test_encode_categorical_reuses_encoder(self):
+        self.cleaner.encode_categorical('cat', method='label')
+        scoring = DataCleaner()
+        scoring.df = pd.DataFrame({'cat': ['y', 'x']})
+        scoring.encode_categorical('cat', encoder=self.cleaner.encoders['cat'])
+        self.assertEqual(list(scoring.df['cat_Encoded']), [1, 0])
         
     def test_clean_pipeline(self):
         cleaned_df = self.cleaner.clean()
         self.assertIsNotNone(cleaned_df)
 
+    def test_clean_chunked_matches_clean(self):
+        filename = "test_chunked_data.csv"
+        output = "test_chunked_output.csv"
+        df = pd.DataFrame({
+            'A': [1, 2, 2, 4, 100, 3, 2, None, 1, 2, 2],
+            'B': [0.5, 0.7, 0.7, 9.0, 0.6, 0.4, 0.7, 0.5, 0.5, None, 0.7],
+            'cat': ['x', 'y', 'y', None, 'x', 'y', 'y', 'x', 'x', 'y', 'y']
+        })
+        df.to_csv(filename, index=False)
+        try:
+            expected = DataCleaner(filename)
+            expected.load_data()
+            expected_df = expected.clean().reset_index(drop=True)
+
+            rows = DataCleaner(filename).clean_chunked(output, chunksize=3)
+            result = pd.read_csv(output)
+            self.assertEqual(rows, len(expected_df))
+            pd.testing.assert_frame_equal(result, expected_df)
+        finally:
+            for path in (filename, output):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_clean_chunked_column_missing_in_a_chunk(self):
+        filename = "test_chunked_gaps.csv"
+        output = "test_chunked_gaps_output.csv"
+        pd.DataFrame({
+            'A': [1, 2, 3, 4, 5, 6],
+            'cat': [None, None, 'x', 'y', 'x', None],
+            'code': [1, 2, 3, 'a7', 5, 6],
+        }).to_csv(filename, index=False)
+        try:
+            expected = DataCleaner(filename)
+            expected.load_data()
+            expected_df = expected.clean().reset_index(drop=True)
+
+            rows = DataCleaner(filename).clean_chunked(output, chunksize=2)
+            self.assertEqual(rows, len(expected_df))
+            pd.testing.assert_frame_equal(pd.read_csv(output), pd.read_csv(filename).fillna({'cat': 'x'}))
+        finally:
+            for path in (filename, output):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_clean_chunked_exact_without_sketch(self):
+        filename = "test_chunked_exact.csv"
+        output = "test_chunked_exact_output.csv"
+        rng = np.random.default_rng(0)
+        values = rng.lognormal(size=20_000)
+        values[rng.random(20_000) < 0.2] = np.nan
+        pd.DataFrame({'A': values}).to_csv(filename, index=False)
+        try:
+            expected = DataCleaner(filename)
+            expected.load_data()
+            expected_rows = len(expected.clean())
+            self.assertEqual(DataCleaner(filename).clean_chunked(output, chunksize=3000), expected_rows)
+        finally:
+            for path in (filename, output):
+                if os.path.exists(path):
+                    os.remove(path)
+
+    def test_sketched_quantiles(self):
+        rng = np.random.default_rng(0)
+        df = pd.DataFrame({'A': rng.normal(size=20_000), 'B': rng.normal(size=20_000)})
+        df.loc[::7, 'A'] = None
+        exact, sketched = DataCleaner(), DataCleaner(sketch_k=200)
+        exact.df, sketched.df = df.copy(), df.copy()
+        for cleaner in (exact, sketched):
+            cleaner.handle_missing_values().remove_outliers_iqr()
+        self.assertAlmostEqual(sketched.imputer.fill_values['A'], exact.imputer.fill_values['A'], delta=0.05)
+        self.assertLess(abs(len(sketched.df) - len(exact.df)), 0.01 * len(df))
+
+    def test_clean_chunked_with_history(self):
+        first, second, output = "test_day1.csv", "test_day2.csv", "test_day_output.csv"
+        pd.DataFrame({'A': [1, 2, 3, 4], 'B': [1.0, 2.0, 3.0, 4.0]}).to_csv(first, index=False)
+        pd.DataFrame({'A': [3, 5, 5, 6], 'B': [3.0, 5.0, 5.0, 6.0]}).to_csv(second, index=False)
+        try:
+            index = RowHashIndex()
+            self.assertEqual(DataCleaner(first).clean_chunked(output, chunksize=2, dedup_index=index), 4)
+            self.assertEqual(DataCleaner(second).clean_chunked(output, chunksize=2, dedup_index=index), 2)
+            self.assertEqual(pd.read_csv(output)['A'].tolist(), [5, 6])
+            self.assertEqual(len(index), 6)
+        finally:
+            for path in (first, second, output):
+                if os.path.exists(path):
+                    os.remove(path)
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,49 @@
+import unittest
+import numpy as np
+import pandas as pd
+from sklearn.ensemble import RandomForestClassifier
+from ds_toolkit.cross_validation import (
+    CrossValidationStrategy, KFoldStrategy, StratifiedKFoldStrategy, ModelEvaluator
+)
+
+class TestCrossValidation(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.X = pd.DataFrame(rng.rand(60, 3), columns=['f1', 'f2', 'f3'])
+        self.y = pd.Series((self.X['f1'] > 0.5).astype(int))
+        self.model = RandomForestClassifier(n_estimators=10, random_state=0)
+
+    def test_kfold_scores(self):
+        scores = KFoldStrategy().validate(self.model, self.X, self.y)
+        self.assertEqual(len(scores), 5)
+
+    def test_parallel_executors_match_serial(self):
+        serial = StratifiedKFoldStrategy().validate(self.model, self.X, self.y)
+        for executor in ('threads', 'processes'):
+            strategy = StratifiedKFoldStrategy(executor=executor, n_workers=2)
+            np.testing.assert_array_equal(strategy.validate(self.model, self.X, self.y), serial)
+
+    def test_evaluator_executor_override(self):
+        strategy = KFoldStrategy()
+        evaluator = ModelEvaluator(strategy, executor='threads', n_workers=2)
+        scores = evaluator.evaluate(self.model, self.X, self.y)
+        np.testing.assert_array_equal(scores, KFoldStrategy().validate(self.model, self.X, self.y))
+        self.assertEqual((strategy.executor, strategy.n_workers), ('serial', None))
+
+    def test_evaluator_with_baseline_strategy(self):
+        class FixedScores(CrossValidationStrategy):
+            def validate(self, model, X, y, n_splits=5):
+                return np.ones(n_splits)
+
+        for evaluator in (ModelEvaluator(FixedScores()), ModelEvaluator(FixedScores(), executor='threads')):
+            np.testing.assert_array_equal(evaluator.evaluate(self.model, self.X, self.y), np.ones(5))
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            KFoldStrategy(executor='gpu')
+        with self.assertRaises(ValueError):
+            ModelEvaluator(KFoldStrategy(), executor='gpu')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit.dedup import BloomRowIndex, RowHashIndex, _RowIndex, load_index, row_hashes
+
+class TestRowHashes(unittest.TestCase):
+
+    def test_int_and_float_rows_match(self):
+        ints = pd.DataFrame({'a': [1, 2], 'b': ['x', 'y']})
+        floats = pd.DataFrame({'a': [1.0, 2.0], 'b': ['x', 'y']})
+        np.testing.assert_array_equal(row_hashes(ints), row_hashes(floats))
+
+    def test_subset(self):
+        df = pd.DataFrame({'a': [1, 1], 'b': ['x', 'y']})
+        hashes = row_hashes(df, ['a'])
+        self.assertEqual(hashes[0], hashes[1])
+
+class TestRowIndexes(unittest.TestCase):
+
+    def setUp(self):
+        self.day1 = pd.DataFrame({'id': [1, 2, 2, 3], 'value': ['a', 'b', 'b', 'c']})
+        self.day2 = pd.DataFrame({'id': [3, 4, 1, 4], 'value': ['c', 'd', 'z', 'd']})
+
+    def _check_batches(self, index):
+        self.assertEqual(index.deduplicate(self.day1)['id'].tolist(), [1, 2, 3])
+        self.assertEqual(index.deduplicate(self.day2)['id'].tolist(), [4, 1])
+        self.assertEqual(len(index), 5)
+        self.assertGreater(index.memory_bytes, 0)
+
+    def test_exact_index_across_batches(self):
+        self._check_batches(RowHashIndex())
+
+    def test_bloom_index_across_batches(self):
+        self._check_batches(BloomRowIndex(capacity=1000, error_rate=0.001))
+
+    def test_key_subset(self):
+        index = RowHashIndex(subset=['id'])
+        index.deduplicate(self.day1)
+        self.assertEqual(index.deduplicate(self.day2)['id'].tolist(), [4])
+
+    def test_contains_does_not_record(self):
+        index = RowHashIndex()
+        self.assertFalse(index.contains(self.day1).any())
+        self.assertEqual(len(index), 0)
+
+    def test_bloom_false_positive_rate(self):
+        rng = np.random.default_rng(0)
+        index = BloomRowIndex(capacity=20_000, error_rate=0.01)
+        index.deduplicate(pd.DataFrame({'x': rng.permutation(20_000)}))
+        unseen = pd.DataFrame({'x': np.arange(20_000, 40_000)})
+        self.assertLess(index.contains(unseen).mean(), 0.02)
+
+    def test_save_and_load(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for index in (RowHashIndex(subset=['id']), BloomRowIndex(100)):
+                index.deduplicate(self.day1)
+                path = os.path.join(tmpdir, f'{index.kind}.npz')
+                index.save(path)
+                loaded = load_index(path)
+                self.assertIs(type(loaded), type(index))
+                self.assertEqual(loaded.subset, index.subset)
+                self.assertEqual(len(loaded), len(index))
+                np.testing.assert_array_equal(loaded.contains(self.day2), index.contains(self.day2))
+
+    def test_save_keeps_path(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = os.path.join(tmpdir, 'seen.idx')
+            RowHashIndex().save(path)
+            self.assertEqual(os.listdir(tmpdir), ['seen.idx'])
+            self.assertEqual(len(load_index(path)), 0)
+
+    def test_index_interface_is_abstract(self):
+        class Incomplete(_RowIndex):
+            def _contains(self, hashes):
+                return np.zeros(len(hashes), dtype=bool)
+
+        with self.assertRaises(TypeError):
+            Incomplete()
+
+    def test_merge(self):
+        exact = RowHashIndex()
+        exact.deduplicate(self.day1)
+        other = RowHashIndex()
+        other.deduplicate(self.day2)
+        exact.merge(other)
+        self.assertEqual(len(exact), 5)
+        bloom = BloomRowIndex(100).merge(exact)
+        self.assertTrue(bloom.contains(self.day2).all())
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import pandas as pd
+import numpy as np
+from ds_toolkit.encoding import LabelEncoder, OneHotEncoder, _CategoricalEncoder
+
+class TestEncoders(unittest.TestCase):
+    
+    def setUp(self):
+        self.train = pd.DataFrame({
+            'color': ['red', 'blue', 'green', 'blue'],
+            'size': ['S', 'M', None, 'M']
+        })
+        self.score = pd.DataFrame({
+            'color': ['green', 'purple', 'red'],
+            'size': ['M', 'S', 'XL']
+        })
+
+    def test_label_codes_independent_of_row_order(self):
+        encoder = LabelEncoder(['color']).fit(self.train)
+        shuffled = LabelEncoder(['color']).fit(self.train.iloc[::-1])
+        np.testing.assert_array_equal(
+            encoder.transform(self.train)['color_Encoded'],
+            shuffled.transform(self.train)['color_Encoded']
+        )
+        self.assertEqual(list(encoder.transform(self.train)['color_Encoded']), [2, 0, 1, 0])
+
+    def test_label_unseen_values_are_nan(self):
+        encoded = LabelEncoder(['color']).fit(self.train).transform(self.score)
+        self.assertEqual(encoded['color_Encoded'].iloc[0], 1)
+        self.assertTrue(np.isnan(encoded['color_Encoded'].iloc[1]))
+
+    def test_onehot_matches_get_dummies(self):
+        encoder = OneHotEncoder(['color', 'size']).fit(self.train)
+        expected = pd.get_dummies(self.train, columns=['color', 'size'])
+        pd.testing.assert_frame_equal(encoder.transform(self.train), expected)
+
+    def test_onehot_sparse_and_unseen(self):
+        encoder = OneHotEncoder(['color', 'size'], sparse=True).fit(self.train)
+        matrix = encoder.transform_matrix(self.score)
+        self.assertEqual(matrix.shape, (3, 5))
+        self.assertEqual(matrix.nnz, 4)
+        frame = encoder.transform(self.score)
+        self.assertIsInstance(frame['color_red'].dtype, pd.SparseDtype)
+        self.assertEqual(list(frame.columns), encoder.feature_names())
+
+    def test_transform_requires_fit(self):
+        with self.assertRaises(ValueError):
+            LabelEncoder(['color']).transform(self.train)
+
+    def test_encoder_without_transform_cannot_be_created(self):
+        class Incomplete(_CategoricalEncoder):
+            pass
+
+        with self.assertRaises(TypeError):
+            Incomplete(['color'])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,112 @@
+import unittest
+import pandas as pd
+import numpy as np
+import multiprocessing
+import os
+import tempfile
+from unittest import mock
+from ds_toolkit.facade import DataSciencePackage
+
+class TestDataSciencePackage(unittest.TestCase):
+    
+    def setUp(self):
+        self.filename = "test_facade_data.csv"
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame(rng.rand(40, 3), columns=['f1', 'f2', 'f3'])
+        df['target'] = rng.choice([0, 1], 40)
+        df.to_csv(self.filename, index=False)
+
+    def tearDown(self):
+        for path in (self.filename, "test_facade_clean.csv", "test_facade_clean"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_workflow_in_memory(self):
+        pkg = DataSciencePackage(self.filename, 'target')
+        pkg.run_full_workflow()
+        self.assertIsNotNone(pkg.pipeline)
+        self.assertFalse(os.path.exists("temp_cleaned_data.csv"))
+
+    def test_workflow_saves_side_output(self):
+        pkg = DataSciencePackage(self.filename, 'target')
+        pkg.run_full_workflow(saved_clean_path="test_facade_clean.csv")
+        self.assertTrue(os.path.exists("test_facade_clean.csv"))
+
+    def test_workflow_side_output_defaults_to_binary(self):
+        try:
+            import pyarrow
+        except ImportError:
+            self.skipTest("pyarrow not installed")
+        pkg = DataSciencePackage(self.filename, 'target')
+        pkg.run_full_workflow(saved_clean_path="test_facade_clean")
+        self.assertEqual(len(pd.read_parquet("test_facade_clean")), len(pkg.cleaner.df))
+
+    def test_failed_cleaning_raises_on_request(self):
+        pkg = DataSciencePackage("missing_file.csv", 'target')
+        self.assertIsNone(pkg.run_full_workflow())
+        with self.assertRaises(FileNotFoundError):
+            pkg.run_full_workflow(raise_errors=True)
+
+    def test_run_batch(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for executor in ('serial', 'processes'):
+                output_dir = os.path.join(tmpdir, executor)
+                summary = DataSciencePackage.run_batch(
+                    [(self.filename, 'target'), ("missing_file.csv", 'target'), (self.filename, 'no_such_column')],
+                    n_workers=2, executor=executor, output_dir=output_dir, save_format='csv')
+                self.assertEqual(list(summary['status']), ['ok', 'failed', 'failed'])
+                self.assertEqual(summary.loc[0, 'rows_in'], 40)
+                self.assertTrue(0 <= summary.loc[0, 'accuracy'] <= 1)
+                self.assertIn('FileNotFoundError', summary.loc[1, 'error'])
+                self.assertIn('no_such_column', summary.loc[2, 'error'])
+                # Each run keeps its own intermediates
+                self.assertTrue(os.path.exists(os.path.join(summary.loc[0, 'output_dir'], 'cleaned.csv')))
+                self.assertTrue(os.path.exists(os.path.join(summary.loc[2, 'output_dir'], 'cleaned.csv')))
+                self.assertNotEqual(summary.loc[0, 'output_dir'], summary.loc[2, 'output_dir'])
+                with open(os.path.join(summary.loc[0, 'output_dir'], 'run.log')) as f:
+                    self.assertIn('Data loaded: 40 rows', f.read())
+                with open(os.path.join(summary.loc[1, 'output_dir'], 'run.log')) as f:
+                    log = f.read()
+                self.assertIn('ERROR - Error in load_data', log)
+                self.assertIn('Traceback', log)
+
+    def test_run_batch_survives_worker_crash(self):
+        if multiprocessing.get_start_method() != 'fork':
+            self.skipTest("workers only inherit the patched method when forked")
+        clean = DataSciencePackage._clean
+
+        def crash_on_marker(pkg, *args):
+            if 'crash' in pkg.filepath:
+                os._exit(1)
+            return clean(pkg, *args)
+
+        crashing = "test_facade_crash.csv"
+        pd.read_csv(self.filename).to_csv(crashing, index=False)
+        try:
+            with mock.patch.object(DataSciencePackage, '_clean', crash_on_marker):
+                summary = DataSciencePackage.run_batch(
+                    [(self.filename, 'target')] * 3 + [(crashing, 'target')] + [(self.filename, 'target')] * 2,
+                    n_workers=2)
+        finally:
+            os.remove(crashing)
+        self.assertEqual(list(summary['status']), ['ok'] * 3 + ['failed'] + ['ok'] * 2)
+        self.assertIn('BrokenProcessPool', summary.loc[3, 'error'])
+
+    def test_run_batch_temporary_dirs(self):
+        summary = DataSciencePackage.run_batch([(self.filename, 'target')] * 2, executor='serial')
+        self.assertEqual(list(summary['status']), ['ok', 'ok'])
+        self.assertTrue(summary['output_dir'].isna().all())
+
+    def test_run_batch_without_pyarrow(self):
+        def no_pyarrow():
+            raise ImportError("Parquet/Feather support requires pyarrow (pip install pyarrow)")
+
+        with tempfile.TemporaryDirectory() as tmpdir, mock.patch('ds_toolkit.storage._require_pyarrow', no_pyarrow):
+            summary = DataSciencePackage.run_batch([(self.filename, 'target')], executor='serial')
+            self.assertEqual(list(summary['status']), ['ok'])
+            summary = DataSciencePackage.run_batch([(self.filename, 'target')], executor='serial', output_dir=tmpdir)
+            self.assertEqual(list(summary['status']), ['ok'])
+            self.assertTrue(os.path.exists(os.path.join(summary.loc[0, 'output_dir'], 'cleaned.csv')))
+
+if __name__ == '__main__':
+    unittest.main()
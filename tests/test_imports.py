@@ -0,0 +1,55 @@
+import unittest
+import subprocess
+import sys
+import json
+
+# Seconds ds_toolkit may add on top of pandas/numpy for a cleaning-only job
+IMPORT_BUDGET_SECONDS = 0.3
+
+_PROBE = """
+import json, sys, time
+import numpy, pandas
+start = time.perf_counter()
+import ds_toolkit
+from ds_toolkit import DataCleaner, DataValidator
+elapsed = time.perf_counter() - start
+heavy = sorted(m for m in ('sklearn', 'scipy', 'ds_toolkit.pipeline', 'ds_toolkit.cross_validation')
+               if m in sys.modules)
+print(json.dumps({'elapsed': elapsed, 'heavy': heavy}))
+"""
+
+class TestLazyImports(unittest.TestCase):
+    
+    def _probe(self, code):
+        output = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, check=True
+        ).stdout
+        return json.loads(output.strip().splitlines()[-1])
+
+    def test_cleaning_only_import_skips_sklearn(self):
+        result = self._probe(_PROBE)
+        self.assertEqual(result['heavy'], [])
+
+    def test_import_time_budget(self):
+        # Best of three runs to absorb noise from a cold disk cache
+        elapsed = min(self._probe(_PROBE)['elapsed'] for _ in range(3))
+        self.assertLess(elapsed, IMPORT_BUDGET_SECONDS)
+
+    def test_sklearn_deferred_until_component_built(self):
+        code = (
+            "import json, sys\n"
+            "from ds_toolkit import MLPipeline, KFoldStrategy\n"
+            "before = 'sklearn' in sys.modules\n"
+            "from ds_toolkit import Scaler\n"
+            "Scaler()\n"
+            "print(json.dumps({'before': before, 'after': 'sklearn' in sys.modules}))\n"
+        )
+        self.assertEqual(self._probe(code), {'before': False, 'after': True})
+
+    def test_unknown_attribute(self):
+        import ds_toolkit
+        with self.assertRaises(AttributeError):
+            ds_toolkit.DoesNotExist
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,50 @@
+import unittest
+import pandas as pd
+import numpy as np
+from ds_toolkit.imputation import MissingValueImputer, column_mode
+
+class TestMissingValueImputer(unittest.TestCase):
+    
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'num': [1.0, None, 3.0, 10.0],
+            'int': [1, 2, 3, 4],
+            'cat': ['b', 'a', None, 'b'],
+            'empty': [None, None, None, None]
+        })
+
+    def test_fill_values_match_pandas(self):
+        imputer = MissingValueImputer().fit(self.df)
+        self.assertEqual(imputer.fill_values['num'], self.df['num'].median())
+        self.assertEqual(imputer.fill_values['int'], self.df['int'].median())
+        self.assertEqual(imputer.fill_values['cat'], self.df['cat'].mode()[0])
+        self.assertNotIn('empty', imputer.fill_values)
+
+    def test_only_missing(self):
+        imputer = MissingValueImputer(only_missing=True).fit(self.df)
+        self.assertEqual(set(imputer.fill_values), {'num', 'cat'})
+        self.assertEqual(imputer.filled_count, 2)
+
+    def test_transform_in_place(self):
+        imputer = MissingValueImputer(columns=['num'])
+        result = imputer.fit_transform(self.df)
+        self.assertIs(result, self.df)
+        self.assertEqual(self.df['num'].isnull().sum(), 0)
+        self.assertEqual(self.df['cat'].isnull().sum(), 1)
+
+    def test_reused_on_categorical_batch_without_fill_value(self):
+        imputer = MissingValueImputer().fit(pd.DataFrame({'Embarked': pd.Categorical(['S', 'S', 'C'])}))
+        batch = pd.DataFrame({'Embarked': pd.Categorical(['C', None])})
+        imputer.transform(batch)
+        self.assertEqual(list(batch['Embarked']), ['C', 'S'])
+        self.assertEqual(list(batch['Embarked'].cat.categories), ['C', 'S'])
+
+    def test_column_mode_ties_and_categories(self):
+        series = pd.Series(['z', 'y', 'z', 'y', None])
+        self.assertEqual(column_mode(series), series.mode()[0])
+        categorical = series.astype('category')
+        self.assertEqual(column_mode(categorical), categorical.mode()[0])
+        self.assertIsNone(column_mode(pd.Series([None, None], dtype=object)))
+
+if __name__ == '__main__':
+    unittest.main()
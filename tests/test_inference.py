@@ -0,0 +1,53 @@
+import unittest
+import os
+import pandas as pd
+import numpy as np
+from ds_toolkit.inference import InferenceBundle
+from ds_toolkit.pipeline import MLPipeline, DataLoader, DataSplitter, Scaler, ModelHandler
+
+class TestInferenceBundle(unittest.TestCase):
+    
+    def setUp(self):
+        rng = np.random.RandomState(0)
+        self.df = pd.DataFrame(rng.rand(50, 3), columns=['f1', 'f2', 'f3'])
+        self.df['target'] = (self.df['f1'] > 0.5).astype(int)
+        self.pipeline = MLPipeline(
+            DataLoader(self.df, 'target'), DataSplitter(), Scaler(), ModelHandler(n_estimators=5)
+        )
+        self.pipeline.run()
+        self.paths = ['test_bundle.pkl', 'test_scoring.csv']
+
+    def tearDown(self):
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_save_and_load(self):
+        bundle = self.pipeline.export_bundle('test_bundle.pkl')
+        loaded = InferenceBundle.load('test_bundle.pkl')
+        self.assertEqual(loaded.columns, ['f1', 'f2', 'f3'])
+        np.testing.assert_array_equal(loaded.predict(self.df), bundle.predict(self.df))
+
+    def test_predict_stream_reorders_columns(self):
+        bundle = self.pipeline.export_bundle()
+        expected = bundle.predict(self.df)
+        shuffled = self.df[['target', 'f3', 'f1', 'f2']]
+        chunks = (shuffled.iloc[i:i + 7] for i in range(0, len(shuffled), 7))
+        np.testing.assert_array_equal(np.concatenate(list(bundle.predict_stream(chunks))), expected)
+
+    def test_predict_stream_from_file_with_workers(self):
+        self.df.to_csv('test_scoring.csv', index=False)
+        bundle = self.pipeline.export_bundle()
+        expected = bundle.predict(self.df)
+        for executor in ('threads', 'processes'):
+            predictions = bundle.predict_stream('test_scoring.csv', chunksize=8, executor=executor, n_workers=2)
+            np.testing.assert_array_equal(np.concatenate(list(predictions)), expected)
+
+    def test_model_handler_predict_stream(self):
+        handler = self.pipeline.model_handler
+        chunks = [self.df.iloc[:25], self.df.iloc[25:]]
+        predictions = handler.predict_stream(chunks, scaler=self.pipeline.scaler, columns=['f1', 'f2', 'f3'])
+        self.assertEqual(sum(len(p) for p in predictions), 50)
+
+if __name__ == '__main__':
+    unittest.main()
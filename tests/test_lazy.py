@@ -0,0 +1,129 @@
+import contextlib
+import io
+import os
+import tempfile
+import unittest
+import pandas as pd
+from ds_toolkit.cleaning import DataCleaner
+
+class TestLazyCleaner(unittest.TestCase):
+
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'data.csv')
+        pd.DataFrame({
+            'A': [1.0, 2.0, 2.0, None, 3.0, 100.0, 2.5, 1.5],
+            'B': [5, 6, 6, 7, 5, 6, 7, 5],
+            'cat': ['x', 'y', 'y', None, 'z', 'x', 'y', 'x'],
+            'unused': list('abcdefgh')
+        }).to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _eager(self):
+        cleaner = DataCleaner(self.path)
+        cleaner.load_data()
+        cleaner.remove_duplicates()
+        cleaner.handle_missing_values(['A'])
+        cleaner.handle_missing_values(['cat'])
+        cleaner.encode_categorical('cat', method='onehot')
+        cleaner.remove_outliers_iqr(['A'])
+        return cleaner
+
+    def _lazy(self, cleaner):
+        return (cleaner.lazy()
+                .remove_duplicates()
+                .handle_missing_values(['A'])
+                .handle_missing_values(['cat'])
+                .encode_categorical('cat', method='onehot')
+                .remove_outliers_iqr(['A']))
+
+    def test_collect_matches_eager(self):
+        expected = self._eager().df
+        result = self._lazy(DataCleaner(self.path)).collect()
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_filters_pushed_before_encoding(self):
+        _, steps = self._lazy(DataCleaner(self.path)).optimized_plan()
+        ops = [step.op for step in steps]
+        self.assertEqual(ops, ['remove_duplicates', 'handle_missing_values', 'fit_encoder',
+                               'remove_outliers_iqr', 'encode_categorical'])
+        self.assertEqual(steps[1].columns, ['A', 'cat'])
+
+    def test_filter_reading_encoded_column_not_pushed(self):
+        lazy = DataCleaner(self.path).lazy().encode_categorical('cat').remove_outliers_iqr()
+        _, steps = lazy.optimized_plan()
+        self.assertEqual([step.op for step in steps], ['encode_categorical', 'remove_outliers_iqr'])
+        self.assertIn('cat_Encoded', steps[1].columns)
+
+    def test_select_prunes_columns_and_steps(self):
+        cleaner = DataCleaner(self.path)
+        lazy = (cleaner.lazy().handle_missing_values().encode_categorical(['cat', 'unused'])
+                .remove_outliers_iqr(['A']).select(['A', 'cat_Encoded']))
+        scan_columns, steps = lazy.optimized_plan()
+        self.assertEqual(scan_columns, ['A', 'cat'])
+        self.assertEqual(steps[0].columns, ['A', 'cat'])
+        self.assertTrue(all(step.columns == ['cat'] for step in steps if 'encode' in step.op))
+
+        expected = DataCleaner(self.path)
+        expected.load_data()
+        expected.handle_missing_values().encode_categorical(['cat', 'unused']).remove_outliers_iqr(['A'])
+        result = lazy.collect()
+        pd.testing.assert_frame_equal(result, expected.df[['A', 'cat_Encoded']])
+        self.assertIn('cat', cleaner.encoders)
+
+    def test_explain(self):
+        cleaner = DataCleaner(self.path)
+        cleaner.load_data()
+        output = io.StringIO()
+        with contextlib.redirect_stdout(output):
+            text = self._lazy(cleaner).explain()
+        self.assertEqual(output.getvalue(), text + '\n')
+        self.assertIn('== Logical plan ==', text)
+        self.assertIn('== Optimized plan ==', text)
+        self.assertIn("fit_encoder(['cat'], method='onehot')", text)
+
+    def test_schema_of_whole_file(self):
+        # 'code' only turns to text after the first few thousand rows
+        path = os.path.join(self.tmpdir.name, 'late_text.csv')
+        pd.DataFrame({
+            'A': [float(i % 50) for i in range(3000)],
+            'code': [str(i % 50) for i in range(2999)] + ['unknown'],
+        }).to_csv(path, index=False)
+        lazy = DataCleaner(path).lazy().remove_outliers_iqr()
+        _, steps = lazy.optimized_plan()
+        self.assertEqual(steps[0].columns, ['A'])
+
+        expected = DataCleaner(path)
+        expected.load_data()
+        expected.remove_outliers_iqr()
+        pd.testing.assert_frame_equal(lazy.collect(), expected.df)
+
+    def test_dedup_keeps_encoded_column_without_its_source(self):
+        cleaner = DataCleaner()
+        cleaner.df = pd.DataFrame({'x': [1, 1, 2], 'c': ['a', 'b', 'a']})
+        lazy = cleaner.lazy().encode_categorical('c').select(['x', 'c_Encoded']).remove_duplicates()
+        _, steps = lazy.optimized_plan()
+        self.assertEqual(steps[-1].columns, ['x', 'c_Encoded'])
+
+        expected = DataCleaner()
+        expected.df = pd.DataFrame({'x': [1, 1, 2], 'c': ['a', 'b', 'a']})
+        expected.encode_categorical('c')
+        expected.df = expected.df[['x', 'c_Encoded']]
+        expected.remove_duplicates()
+        pd.testing.assert_frame_equal(lazy.collect(), expected.df)
+        self.assertEqual(len(expected.df), 3)
+
+    def test_select_ignores_unknown_columns(self):
+        lazy = DataCleaner(self.path).lazy().select(['A', 'missing']).remove_duplicates()
+        _, steps = lazy.optimized_plan()
+        self.assertEqual(steps[-1].columns, ['A'])
+        self.assertEqual(list(lazy.collect().columns), ['A'])
+
+    def test_unknown_method(self):
+        with self.assertRaises(ValueError):
+            DataCleaner(self.path).lazy().encode_categorical('cat', method='target')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,57 @@
+import unittest
+import json
+from ds_toolkit import metrics
+from ds_toolkit.metrics import Histogram, MetricsRegistry, REGISTRY
+from ds_toolkit.utils import timing_decorator
+
+@timing_decorator
+def _work(fail=False):
+    if fail:
+        raise ValueError("boom")
+    return 42
+
+NAME = f"{__name__}._work"
+
+class TestMetrics(unittest.TestCase):
+    
+    def setUp(self):
+        REGISTRY.reset()
+        metrics.enable()
+
+    def tearDown(self):
+        metrics.enable()
+
+    def test_decorator_records_calls_and_errors(self):
+        for _ in range(3):
+            self.assertEqual(_work(), 42)
+        with self.assertRaises(ValueError):
+            _work(fail=True)
+        snapshot = REGISTRY.snapshot()[NAME]
+        self.assertEqual(snapshot['count'], 4)
+        self.assertEqual(snapshot['errors'], 1)
+        self.assertLessEqual(snapshot['p50_seconds'], snapshot['p99_seconds'])
+
+    def test_disable_skips_recording(self):
+        metrics.disable()
+        _work()
+        self.assertNotIn(NAME, REGISTRY.snapshot())
+
+    def test_histogram_percentiles(self):
+        histogram = Histogram()
+        for duration in range(1, 101):
+            histogram.observe(duration * 1_000_000)
+        self.assertAlmostEqual(histogram.percentile(50) / 1e6, 50, delta=15)
+        self.assertLessEqual(histogram.percentile(99), histogram.max_ns)
+        self.assertGreaterEqual(histogram.percentile(1), histogram.min_ns)
+
+    def test_exports(self):
+        registry = MetricsRegistry()
+        with registry.timer('step'):
+            pass
+        self.assertEqual(json.loads(registry.to_json())['step']['count'], 1)
+        text = registry.to_prometheus()
+        self.assertIn('ds_toolkit_call_duration_seconds_count{function="step"} 1', text)
+        self.assertIn('le="+Inf"', text)
+
+if __name__ == '__main__':
+    unittest.main()
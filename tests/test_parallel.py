@@ -0,0 +1,91 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit.cleaning import DataCleaner
+from ds_toolkit.parallel import ProcessBackend, partition_bounds
+
+class TestProcessBackend(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 5_000
+        self.df = pd.DataFrame({f'num_{i}': rng.normal(size=n) for i in range(12)})
+        self.df['int'] = rng.integers(0, 50, n)
+        self.df.loc[rng.random(n) < 0.1, 'num_3'] = np.nan
+        self.df['empty'] = np.nan
+        self.df['text'] = rng.choice(['a', 'b', 'c', None], n)
+        self.df['cat'] = pd.Categorical(rng.choice(['x', 'y'], n))
+        self.numeric = [col for col in self.df.columns if col not in ('text', 'cat')]
+
+    def test_summarize_matches_pandas(self):
+        stats = ProcessBackend(n_workers=3).summarize(
+            self.df, medians=self.numeric, quantiles=self.numeric[::-1],
+            modes=['text', 'cat'], vocabularies=['cat', 'text'])
+        pd.testing.assert_series_equal(stats['median'], self.df[self.numeric].median())
+        pd.testing.assert_frame_equal(stats['quantiles'], self.df[self.numeric[::-1]].quantile([0.25, 0.75]))
+        self.assertEqual(stats['mode'], {'text': self.df['text'].mode()[0], 'cat': self.df['cat'].mode()[0]})
+        self.assertEqual(list(stats['vocabulary']), ['cat', 'text'])
+        self.assertEqual(list(stats['vocabulary']['text']), ['a', 'b', 'c'])
+
+    def test_pool_reused_until_closed(self):
+        with ProcessBackend(n_workers=2) as backend:
+            backend.medians(self.df, self.numeric)
+            pool = backend._pool
+            pd.testing.assert_series_equal(backend.medians(self.df, self.numeric), self.df[self.numeric].median())
+            self.assertIs(backend._pool, pool)
+        self.assertIsNone(backend._pool)
+
+    def test_cleaner_results_unchanged(self):
+        serial, parallel = DataCleaner(), DataCleaner(executor='processes', n_workers=2)
+        serial.df, parallel.df = self.df.copy(), self.df.copy()
+        for cleaner in (serial, parallel):
+            cleaner.handle_missing_values().remove_outliers_iqr().encode_categorical(['text', 'cat'])
+        self.assertEqual(parallel.imputer.fill_values, serial.imputer.fill_values)
+        pd.testing.assert_frame_equal(parallel.df, serial.df)
+        parallel.close()
+        self.assertIsNone(parallel.backend._pool)
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            DataCleaner(executor='threads')
+
+class TestRowPartitions(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(1)
+        n = 6_000
+        df = pd.DataFrame({
+            'a': rng.normal(size=n),
+            'b': rng.integers(0, 20, n),
+            'text': rng.choice(['x', 'y', 'z', None], n),
+            'cat': pd.Categorical(rng.choice(['p', 'q'], n)),
+            'skewed': rng.lognormal(size=n),
+        })
+        df.loc[rng.random(n) < 0.05, ['a', 'skewed']] = np.nan
+        # Duplicates spanning partitions
+        self.df = pd.concat([df, df.iloc[:300]], ignore_index=True)
+
+    def test_partition_bounds(self):
+        self.assertEqual(partition_bounds(10, 3), [(0, 3), (3, 6), (6, 10)])
+        self.assertEqual(partition_bounds(2, 4), [(0, 1), (1, 2)])
+
+    def test_partitioned_clean_matches_clean(self):
+        expected = DataCleaner()
+        expected.df = self.df.copy()
+        expected_df = expected.clean()
+        for partitions in (1, 4):
+            cleaner = DataCleaner(n_workers=2)
+            cleaner.df = self.df.copy()
+            pd.testing.assert_frame_equal(cleaner.clean(partitions=partitions), expected_df)
+            self.assertEqual(cleaner.imputer.fill_values, expected.imputer.fill_values)
+
+    def test_partitioned_clean_sketched(self):
+        expected = DataCleaner()
+        expected.df = self.df.copy()
+        cleaner = DataCleaner(sketch_k=200, n_workers=2)
+        cleaner.df = self.df.copy()
+        self.assertLess(abs(len(cleaner.clean(partitions=3)) - len(expected.clean())), 0.01 * len(self.df))
+        self.assertAlmostEqual(cleaner.imputer.fill_values['a'], expected.imputer.fill_values['a'], delta=0.05)
+
+if __name__ == '__main__':
+    unittest.main()
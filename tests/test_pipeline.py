@@ -25,6 +25,25 @@ class TestMLPipeline(unittest.TestCase):
         self.assertEqual(X.shape, (20, 4))
         self.assertEqual(y.shape, (20,))
 
+    def test_dataloader_from_dataframe(self):
+        df = pd.read_csv(self.filename)
+        X, y = DataLoader(df, 'target').load()
+        self.assertEqual(X.shape, (20, 4))
+        self.assertEqual(list(y), list(df['target']))
+
+    def test_dataloader_from_provider(self):
+        df = pd.read_csv(self.filename)
+        X, y = DataLoader(lambda: df, 'target').load()
+        self.assertEqual(X.shape, (20, 4))
+
+    def test_dataloader_filepath_alias(self):
+        with self.assertWarns(DeprecationWarning):
+            loader = DataLoader(filepath=self.filename, target_column='target')
+        self.assertEqual(loader.filepath, self.filename)
+        self.assertEqual(loader.load()[0].shape, (20, 4))
+        with self.assertRaises(TypeError):
+            DataLoader(self.filename, 'target', filepath=self.filename)
+
     def test_datasplitter(self):
         X = pd.DataFrame(np.random.rand(10, 2))
         y = pd.Series(np.random.randint(0, 2, 10))
@@ -51,5 +70,15 @@ class TestMLPipeline(unittest.TestCase):
         self.assertIsInstance(report, str)
         self.assertIn("accuracy", report)
 
+    def test_evaluate_report_matches_sklearn(self):
+        from sklearn.metrics import classification_report
+        rng = np.random.default_rng(0)
+        X, y = rng.random((60, 3)), rng.choice(['a', 'b', 'c'], 60)
+        handler = ModelHandler(n_estimators=5)
+        handler.train(X, y)
+        report = handler.evaluate(X[:30], y[:30])
+        self.assertEqual(report, classification_report(y[:30], handler.predict(X[:30])))
+        self.assertEqual(set(handler.metrics), {'a', 'b', 'c', 'accuracy', 'macro avg', 'weighted avg'})
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,74 @@
+import threading
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit import profiling
+from ds_toolkit.profiling import PROFILER, memory_profile
+from ds_toolkit.cleaning import DataCleaner
+
+@memory_profile('allocate')
+def _allocate(n):
+    data = np.ones(n)
+    return float(data.sum())
+
+@memory_profile('outer')
+def _outer():
+    _allocate(1_000_000)
+    return np.ones(10)
+
+class TestMemoryProfiler(unittest.TestCase):
+    
+    def setUp(self):
+        PROFILER.reset()
+        profiling.enable()
+
+    def tearDown(self):
+        profiling.disable()
+        PROFILER.reset()
+
+    def test_peak_and_net_allocation(self):
+        _allocate(1_000_000)
+        summary = PROFILER.summary()['allocate']
+        self.assertEqual(summary['calls'], 1)
+        self.assertGreaterEqual(summary['max_peak_bytes'], 8_000_000)
+        self.assertLess(summary['total_net_bytes'], 1_000_000)
+
+    def test_nested_peak_propagates(self):
+        _outer()
+        summary = PROFILER.summary()
+        self.assertGreaterEqual(summary['outer']['max_peak_bytes'], summary['allocate']['max_peak_bytes'])
+
+    def test_overlapping_threads_leave_peak_unmeasured(self):
+        inside = threading.Barrier(2)
+
+        def work(name):
+            with PROFILER.step(name):
+                inside.wait()
+                np.ones(100_000).sum()
+                inside.wait()
+
+        threads = [threading.Thread(target=work, args=(name,)) for name in ('t1', 't2')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual([record['peak_bytes'] for record in PROFILER.records], [None, None])
+        _allocate(1_000_000)
+        self.assertGreaterEqual(PROFILER.summary()['allocate']['max_peak_bytes'], 8_000_000)
+
+    def test_disabled_records_nothing(self):
+        profiling.disable()
+        _allocate(1000)
+        self.assertEqual(PROFILER.records, [])
+
+    def test_cleaner_steps_report(self):
+        cleaner = DataCleaner()
+        cleaner.df = pd.DataFrame({'A': np.arange(1000.0), 'cat': ['x', 'y'] * 500})
+        cleaner.clean()
+        cleaner.encode_categorical('cat', method='onehot')
+        report = PROFILER.report()
+        for step in ('DataCleaner.clean', 'DataCleaner.remove_outliers_iqr', 'DataCleaner.encode_categorical'):
+            self.assertIn(step, report)
+
+if __name__ == '__main__':
+    unittest.main()
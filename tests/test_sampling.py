@@ -0,0 +1,40 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit.sampling import sample_positions, sample_size, wilson_interval
+
+class TestSampling(unittest.TestCase):
+
+    def test_sample_size(self):
+        self.assertEqual(sample_size(0.95, 0.01), 9604)
+        self.assertEqual(sample_size(0.95, 0.05), 385)
+        self.assertLess(sample_size(0.95, 0.01, population=1000), 1000)
+        self.assertEqual(sample_size(0.95, 0.01, population=10), 10)
+        with self.assertRaises(ValueError):
+            sample_size(1.5)
+
+    def test_wilson_interval(self):
+        low, high = wilson_interval(0, 100)
+        self.assertEqual(low, 0.0)
+        self.assertAlmostEqual(high, 0.037, places=3)
+        low, high = wilson_interval(50, 100)
+        self.assertAlmostEqual(low + high, 1.0)
+        self.assertEqual(wilson_interval(0, 0), (0.0, 1.0))
+
+    def test_uniform_sample(self):
+        positions = sample_positions(1000, 100, random_state=0)
+        self.assertEqual(len(positions), 100)
+        self.assertEqual(len(np.unique(positions)), 100)
+        self.assertTrue(np.all(np.diff(positions) > 0))
+        np.testing.assert_array_equal(positions, sample_positions(1000, 100, random_state=0))
+
+    def test_stratified_sample(self):
+        strata = pd.Series(['a'] * 900 + [None] * 90 + ['c'] * 10)
+        positions = sample_positions(1000, 100, strata, random_state=0)
+        counts = strata.iloc[positions].value_counts(dropna=False)
+        self.assertEqual(counts['a'], 90)
+        self.assertEqual(counts['c'], 1)
+        self.assertEqual(counts.sum(), 100)
+
+if __name__ == '__main__':
+    unittest.main()
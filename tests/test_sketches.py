@@ -0,0 +1,48 @@
+import unittest
+import numpy as np
+import pandas as pd
+from ds_toolkit.sketches import QuantileSketch
+
+class TestQuantileSketch(unittest.TestCase):
+
+    def setUp(self):
+        self.values = np.random.default_rng(0).lognormal(size=200_000)
+        self.sorted = np.sort(self.values)
+
+    def _rank_errors(self, sketch, qs):
+        estimates = sketch.quantile(qs)
+        return np.abs(np.searchsorted(self.sorted, estimates) / len(self.values) - np.array(qs))
+
+    def test_exact_below_capacity(self):
+        series = pd.Series([3, 1, None, 2, 10.0])
+        sketch = QuantileSketch().update(series)
+        np.testing.assert_allclose(sketch.quantile([0.25, 0.5, 0.75]), series.quantile([0.25, 0.5, 0.75]))
+        self.assertEqual(sketch.count, 4)
+        self.assertEqual(sketch.missing, 1)
+
+    def test_error_bound_and_memory(self):
+        sketch = QuantileSketch(k=200)
+        for chunk in np.array_split(self.values, 17):
+            sketch.update(chunk)
+        self.assertEqual(sketch.count, len(self.values))
+        self.assertTrue(np.all(self._rank_errors(sketch, [0.25, 0.5, 0.75]) < sketch.rank_error))
+        self.assertLess(sketch.memory_bytes, 10_000)
+
+    def test_merge(self):
+        halves = np.array_split(self.values, 2)
+        merged = QuantileSketch(seed=1).update(halves[0]).merge(QuantileSketch(seed=2).update(halves[1]))
+        self.assertEqual(merged.count, len(self.values))
+        self.assertTrue(np.all(self._rank_errors(merged, [0.25, 0.5, 0.75]) < merged.rank_error))
+
+    def test_add_value(self):
+        sketch = QuantileSketch().update([1.0, 5.0]).add_value(2.0, 1001)
+        self.assertEqual(sketch.count, 1003)
+        self.assertEqual(sketch.median(), 2.0)
+
+    def test_empty(self):
+        self.assertTrue(np.isnan(QuantileSketch().median()))
+        with self.assertRaises(ValueError):
+            QuantileSketch(k=2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+import unittest
+import pandas as pd
+import os
+from ds_toolkit.storage import FrameWriter, infer_format, iter_frames, read_frame, write_frame
+from ds_toolkit.pipeline import DataLoader
+
+try:
+    import pyarrow
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+class TestStorage(unittest.TestCase):
+    
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'A': [1, 2, 3, 4, 5],
+            'B': [0.5, 1.5, 2.5, 3.5, 4.5],
+            'cat': pd.Categorical(['x', 'y', 'x', 'y', 'x']),
+            'target': [0, 1, 0, 1, 0]
+        })
+        self.paths = []
+
+    def tearDown(self):
+        for path in self.paths:
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_infer_format(self):
+        self.assertEqual(infer_format('data.csv'), 'csv')
+        self.assertEqual(infer_format('data.parquet'), 'parquet')
+        self.assertEqual(infer_format('data.arrow'), 'feather')
+        self.assertEqual(infer_format('data', default='parquet'), 'parquet')
+        self.assertEqual(infer_format('data.csv', format='feather'), 'feather')
+        with self.assertRaises(ValueError):
+            infer_format('data.csv', format='xls')
+
+    def test_csv_chunked_roundtrip(self):
+        path = 'test_storage.csv'
+        self.paths.append(path)
+        with FrameWriter(path) as writer:
+            writer.write(self.df.iloc[:2])
+            writer.write(self.df.iloc[2:])
+        chunks = list(iter_frames(path, chunksize=2, columns=['A', 'target']))
+        self.assertEqual(len(chunks), 3)
+        self.assertEqual(list(pd.concat(chunks)['A']), [1, 2, 3, 4, 5])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_binary_roundtrip_keeps_dtypes(self):
+        for path in ('test_storage.parquet', 'test_storage.feather'):
+            self.paths.append(path)
+            write_frame(self.df, path)
+            result = read_frame(path)
+            self.assertEqual(str(result['cat'].dtype), 'category')
+            self.assertEqual(str(result['A'].dtype), 'int64')
+            self.assertEqual(list(read_frame(path, columns=['B']).columns), ['B'])
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_binary_chunked_roundtrip(self):
+        for path in ('test_storage_chunks.parquet', 'test_storage_chunks.feather'):
+            self.paths.append(path)
+            with FrameWriter(path) as writer:
+                writer.write(self.df.iloc[:3])
+                writer.write(self.df.iloc[3:])
+            chunks = list(iter_frames(path, chunksize=2))
+            self.assertEqual(sum(len(chunk) for chunk in chunks), 5)
+
+    @unittest.skipUnless(HAS_PYARROW, "pyarrow not installed")
+    def test_dataloader_column_projection(self):
+        path = 'test_storage_loader.parquet'
+        self.paths.append(path)
+        write_frame(self.df, path)
+        X, y = DataLoader(path, 'target', feature_columns=['A', 'B']).load()
+        self.assertEqual(list(X.columns), ['A', 'B'])
+        self.assertEqual(len(y), 5)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,67 @@
+import unittest
+import json
+import os
+import numpy as np
+import pandas as pd
+from ds_toolkit import tracing
+from ds_toolkit.tracing import TRACER, traced
+from ds_toolkit.facade import DataSciencePackage
+
+@traced('fails')
+def _fails():
+    raise RuntimeError("bad step")
+
+class TestTracing(unittest.TestCase):
+    
+    def setUp(self):
+        TRACER.reset()
+        tracing.enable()
+        self.filename = "test_tracing_data.csv"
+        rng = np.random.RandomState(0)
+        df = pd.DataFrame(rng.rand(40, 3), columns=['f1', 'f2', 'f3'])
+        df['target'] = rng.choice([0, 1], 40)
+        df.to_csv(self.filename, index=False)
+
+    def tearDown(self):
+        tracing.disable()
+        TRACER.reset()
+        for path in (self.filename, "test_trace.json"):
+            if os.path.exists(path):
+                os.remove(path)
+
+    def test_nested_spans(self):
+        with TRACER.span('outer'):
+            with TRACER.span('inner') as span:
+                span.set(rows_in=3)
+        spans = {s.name: s for s in TRACER.spans}
+        self.assertEqual(spans['outer'].depth, 0)
+        self.assertEqual(spans['inner'].depth, 1)
+        self.assertGreaterEqual(spans['outer'].duration_ns, spans['inner'].duration_ns)
+        self.assertEqual(spans['inner'].args, {'rows_in': 3})
+
+    def test_exception_recorded(self):
+        with self.assertRaises(RuntimeError):
+            _fails()
+        self.assertEqual(TRACER.spans[0].error, "RuntimeError: bad step")
+
+    def test_workflow_chrome_trace(self):
+        DataSciencePackage(self.filename, 'target').run_full_workflow()
+        TRACER.export("test_trace.json")
+        with open("test_trace.json") as f:
+            events = json.load(f)['traceEvents']
+        names = [event['name'] for event in events]
+        self.assertEqual(names[0], 'DataSciencePackage.run_full_workflow')
+        for name in ('DataCleaner.clean', 'DataCleaner.remove_duplicates', 'MLPipeline.train'):
+            self.assertIn(name, names)
+        dedup = next(event for event in events if event['name'] == 'DataCleaner.remove_duplicates')
+        self.assertEqual(dedup['args']['rows_in'], 40)
+        self.assertEqual(dedup['ph'], 'X')
+
+    def test_disabled_records_nothing(self):
+        tracing.disable()
+        with TRACER.span('ignored') as span:
+            span.set(rows_in=1)
+        self.assertEqual(TRACER.spans, [])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,219 @@
+import os
+import tempfile
+import unittest
+import pandas as pd
+import numpy as np
+from ds_toolkit.sampling import sample_size
+from ds_toolkit.validation import (
+    DataValidator, NoMissingValuesRule, DataTypeRule, RangeRule, UniqueValuesRule,
+    ValidationRule, ProfileRule, FrameProfile, NULLS, RANGE
+)
+
+class _PositiveSumRule(ValidationRule):
+    """Legacy-style rule implementing only validate()."""
+    
+    def __init__(self):
+        super().__init__("Positive Sum")
+        
+    def validate(self, df):
+        return df['A'].sum() > 0
+
+class TestDataValidator(unittest.TestCase):
+    
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'A': [1, 2, 3, 4],
+            'B': [0.5, None, 1.5, 2.0],
+            'id': [10, 11, 12, 12],
+            'cat': ['x', 'y', 'x', 'z']
+        })
+
+    def test_report_collects_all_rules(self):
+        validator = DataValidator()
+        validator.add_rule(NoMissingValuesRule())
+        validator.add_rule(DataTypeRule({'A': 'int64', 'B': 'int64'}))
+        validator.add_rule(RangeRule('A', min_value=0, max_value=10))
+        validator.add_rule(UniqueValuesRule(['id', 'cat']))
+        report = validator.run(self.df)
+        self.assertFalse(report.passed)
+        self.assertEqual([r.passed for r in report.results], [False, False, True, False])
+        self.assertEqual(report.results[0].details['missing'], 1)
+        self.assertEqual(report.results[3].details['duplicates'], {'id': 1, 'cat': 1})
+        self.assertEqual(report.results[2].details, {'min': 1, 'max': 4})
+        self.assertEqual(len(report.failures), 3)
+
+    def test_validate_returns_bool(self):
+        validator = DataValidator()
+        validator.add_rule(NoMissingValuesRule(columns=['A']))
+        validator.add_rule(DataTypeRule({'A': 'int64'}))
+        self.assertTrue(validator.validate(self.df))
+
+    def test_missing_column_fails(self):
+        result = DataTypeRule({'missing': 'int64'}).evaluate(FrameProfile.from_frame(self.df, {}))
+        self.assertFalse(result.passed)
+
+    def test_profile_only_computes_requested_stats(self):
+        profile = FrameProfile.from_frame(self.df, {'B': {NULLS}, 'A': {RANGE}})
+        self.assertEqual(set(profile.columns), {'A', 'B'})
+        self.assertEqual(profile.columns['B'].null_count, 1)
+        self.assertIsNone(profile.columns['B'].min)
+        self.assertEqual(profile.columns['A'].max, 4)
+
+    def test_legacy_rule_still_supported(self):
+        validator = DataValidator()
+        validator.add_rule(_PositiveSumRule())
+        validator.add_rule(RangeRule('A', max_value=3))
+        report = validator.run(self.df)
+        self.assertEqual([r.passed for r in report.results], [True, False])
+
+    def test_incomplete_rules_cannot_be_created(self):
+        class NoValidate(ValidationRule):
+            pass
+
+        class NoEvaluate(ProfileRule):
+            def requirements(self, columns):
+                return {col: {NULLS} for col in columns}
+
+        for rule_class in (NoValidate, NoEvaluate):
+            with self.assertRaises(TypeError):
+                rule_class("broken")
+
+    def test_threads_match_serial(self):
+        reports = []
+        for executor in ('serial', 'threads'):
+            validator = DataValidator(executor=executor, n_workers=3)
+            validator.add_rule(NoMissingValuesRule())
+            validator.add_rule(_PositiveSumRule())
+            validator.add_rule(RangeRule('B', min_value=1))
+            validator.add_rule(UniqueValuesRule(['id', 'cat', 'A']))
+            reports.append(validator.run(self.df))
+        self.assertEqual(reports[0], reports[1])
+        self.assertEqual([r.rule for r in reports[1].results],
+                         ['No Missing Values', 'Positive Sum', 'Range Check (B)', 'Unique Values'])
+
+    def test_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            DataValidator(executor='gpu')
+
+    def test_rule_validate_standalone(self):
+        self.assertFalse(NoMissingValuesRule().validate(self.df))
+        self.assertTrue(UniqueValuesRule(['A']).validate(self.df))
+
+class TestSampledValidation(unittest.TestCase):
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        n = 50_000
+        self.df = pd.DataFrame({
+            'id': np.arange(n),
+            'value': rng.uniform(0, 100, n),
+            'group': rng.choice(['x', 'y'], n)
+        })
+
+    def _validator(self):
+        validator = DataValidator()
+        validator.add_rule(DataTypeRule({'value': 'float64'}))
+        validator.add_rule(RangeRule('value', min_value=0, max_value=100))
+        validator.add_rule(UniqueValuesRule(['id']))
+        return validator
+
+    def test_clean_batch_passes_on_sample(self):
+        report = self._validator().run_sampled(self.df, margin=0.02, random_state=0)
+        self.assertTrue(report.passed)
+        self.assertFalse(report.escalated)
+        self.assertEqual(report.sampled_rows, sample_size(0.95, 0.02, population=len(self.df)))
+        self.assertEqual(report.results[1].details['violations'], 0)
+
+    def test_violation_rate_estimated(self):
+        df = self.df.copy()
+        df.loc[df.index % 10 == 0, 'value'] = -1
+        report = self._validator().run_sampled(df, margin=0.02, stratify='group', escalate=False, random_state=0)
+        details = report.results[1].details
+        low, high = details['interval']
+        self.assertLess(low, 0.1)
+        self.assertGreater(high, 0.1)
+        self.assertFalse(report.results[1].passed)
+
+    def test_suspicious_batch_escalates(self):
+        df = self.df.copy()
+        df.loc[::10, 'value'] = -1
+        report = self._validator().run_sampled(df, margin=0.02, random_state=0)
+        self.assertTrue(report.escalated)
+        self.assertIsNone(report.sampled_rows)
+        self.assertEqual(report.results[1].details['min'], -1)
+
+    def test_schema_checked_from_metadata(self):
+        validator = DataValidator()
+        validator.add_rule(DataTypeRule({'value': 'int64'}))
+        report = validator.run_sampled(self.df, margin=0.02, escalate=False)
+        self.assertFalse(report.passed)
+
+class TestStreamingValidation(unittest.TestCase):
+
+    def setUp(self):
+        self.df = pd.DataFrame({
+            'id': list(range(20)) + [5],
+            'score': [float(i) for i in range(20)] + [None],
+            'count': list(range(20)) + [None],
+            'label': ['a', 'b', 'c'] * 7
+        })
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmpdir.name, 'data.csv')
+        self.df.to_csv(self.path, index=False)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def _validator(self):
+        validator = DataValidator()
+        validator.add_rule(NoMissingValuesRule())
+        validator.add_rule(DataTypeRule({'id': 'int64', 'count': 'float64'}))
+        validator.add_rule(RangeRule('score', min_value=0, max_value=15))
+        validator.add_rule(UniqueValuesRule(['id', 'label']))
+        return validator
+
+    def test_stream_matches_in_memory(self):
+        validator = self._validator()
+        expected = validator.run(pd.read_csv(self.path))
+        for chunksize in (1, 4, 100):
+            report = validator.run_stream(self.path, chunksize=chunksize)
+            self.assertTrue(report.complete)
+            self.assertEqual(report.rows, len(self.df))
+            self.assertEqual([r.messages for r in report.results], [r.messages for r in expected.results])
+            self.assertEqual([r.details for r in report.results], [r.details for r in expected.results])
+
+    def test_dtype_promoted_across_chunks(self):
+        # The last chunk alone holds the missing 'count' value
+        report = self._validator().run_stream(self.path, chunksize=20)
+        self.assertTrue(report.results[1].passed)
+
+    def test_duplicates_across_chunks(self):
+        validator = DataValidator()
+        validator.add_rule(UniqueValuesRule(['id']))
+        chunks = [self.df.iloc[:10], self.df.iloc[10:]]
+        report = validator.run_stream(chunks)
+        self.assertEqual(report.results[0].details['duplicates'], {'id': 1})
+
+    def test_fail_fast_stops_early(self):
+        validator = DataValidator()
+        validator.add_rule(RangeRule('score', max_value=2))
+        report = validator.run_stream(self.path, chunksize=5, fail_fast=True)
+        self.assertFalse(report.passed)
+        self.assertFalse(report.complete)
+        self.assertEqual(report.rows, 5)
+
+    def test_stream_with_threads(self):
+        serial = self._validator().run_stream(self.path, chunksize=4)
+        validator = self._validator()
+        validator.executor, validator.n_workers = 'threads', 2
+        self.assertEqual(validator.run_stream(self.path, chunksize=4).results, serial.results)
+
+    def test_legacy_rule_checked_per_chunk(self):
+        validator = DataValidator()
+        validator.add_rule(_PositiveSumRule())
+        chunks = [pd.DataFrame({'A': [1, 2]}), pd.DataFrame({'A': [-5]})]
+        self.assertFalse(validator.validate_stream(chunks))
+        self.assertTrue(validator.validate_stream(chunks[:1]))
+
+if __name__ == '__main__':
+    unittest.main()